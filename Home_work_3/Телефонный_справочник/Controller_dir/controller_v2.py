@@ -3,23 +3,37 @@
 
 Класс ContactController координирует взаимодействие между моделью (model) и представлением (view_forms).
 Отвечает за логику отображения, создания, поиска, редактирования и удаления контактов.
+
+Хранилище вызывается только через AsyncStorage: чтение и запись идут в фоновом потоке,
+а результаты возвращаются в главный поток Tk, поэтому окно не замирает на больших файлах.
 """
 
-from typing import List, Dict, Optional
+from concurrent.futures import Future
+from typing import Callable, List, Dict, Optional, Tuple
+import threading
 import tkinter as tk
 
 # Импорты из других модулей приложения
-from model.contact_storage import ContactStorage
+from model.async_storage import AsyncStorage
+from model.contact_record import contact_etag
+from model.incremental_search import IncrementalSearch
+from model.storage_factory import create_storage
 from view_forms.view import (
     AppButton,
-    AppTable,
+    VirtualAppTable,
     AppLabel,
     AppEntry,
     AppWindowModal,
 )
 from view_forms.forms.create_form import CreateContactForm
 from view_forms.forms.search_form import SearchContactForm
-from .exceptions import EmptyFieldError, InvalidPhoneError, InvalidEmailError
+from .exceptions import (
+    EmptyFieldError,
+    InvalidPhoneError,
+    InvalidEmailError,
+    DuplicatePhoneError,
+    ConcurrentUpdateError,
+)
 
 
 # Тип для контакта
@@ -34,15 +48,20 @@ class ContactController:
     Взаимодействует с моделью (contact_storage.py) и представлением (view_forms.py).
     """
 
-    def __init__(self, app_instance: 'App', filename: str = "ДЗ2_Контакты.txt") -> None:
+    def __init__(
+        self, app_instance: 'App', filename: Optional[str] = None, backend: Optional[str] = None
+    ) -> None:
         """
         Инициализирует контроллер.
 
         :param app_instance: Экземпляр основного приложения (App), чтобы иметь доступ к его методам (например, clear_screen).
+        :param filename: Файл с контактами (по умолчанию — из model/config.py).
+        :param backend: Хранилище: "csv" или "sqlite" (по умолчанию — из model/config.py).
         """
         self.app = app_instance
         self.root: tk.Tk = app_instance.root
-        self.storage = ContactStorage(filename)
+        self.storage = create_storage(backend, filename)
+        self.async_storage = AsyncStorage(self.storage, self.root)
 
     def get_all_contacts(self) -> None:
         """
@@ -50,14 +69,15 @@ class ContactController:
         """
         self.app.clear_screen()
         columns = ("ID", "Имя", "Телефон", "Email", "Комментарий")
-        tree = AppTable(self.root, columns=columns, show="headings", height=800)
+        tree = VirtualAppTable(self.root, columns=columns, show="headings", height=800)
 
         # Скрываем колонку ID, но оставляем её для внутреннего использования
         tree.table.column("ID", width=0, stretch=tk.NO)
         tree.table.heading("ID", text="ID")
 
-        contacts = self.storage.load_contacts()
-        tree.load_contact(contacts)
+        tree.load_async(self.async_storage.load_contacts)
+        # Изменения контактов сразу попадают в таблицу без полной перезагрузки
+        tree.bind_storage(self.async_storage)
 
         AppButton(
             self.root,
@@ -77,29 +97,33 @@ class ContactController:
         """
         self.app.clear_screen()
 
+        def show_error(e: BaseException) -> None:
+            if isinstance(e, (EmptyFieldError, InvalidPhoneError, InvalidEmailError, DuplicatePhoneError)):
+                form.show_message(str(e), color="red")
+            else:
+                print(f"Неизвестная ошибка: {e}")
+                form.show_message("Произошла ошибка при сохранении.", color="red")
+
         def handle_save(name: str, phone: str, email: str, comment: str) -> None:
             """Обработка сохранения — здесь живёт валидация и запись."""
             try:
-                # Валидация
+                # Валидация формата — сразу, без обращения к файлу
                 if not name or not phone:
                     raise EmptyFieldError()
-                if not self.storage.is_valid_phone(phone):
+                if not self.async_storage.is_valid_phone(phone):
                     raise InvalidPhoneError()
-                if email and not self.storage.is_valid_email(email):
+                if email and not self.async_storage.is_valid_email(email):
                     raise InvalidEmailError()
-
-                # Сохранение
-                self.storage.add_contact(name=name, phone=phone, email=email, comment=comment)
-
-                # Показ успеха
-                form.show_message("Данные сохранены!", color="green")
-
-
             except (EmptyFieldError, InvalidPhoneError, InvalidEmailError) as e:
                 form.show_message(str(e), color="red")
-            except Exception as e:
-                print(f"Неизвестная ошибка: {e}")
-                form.show_message("Произошла ошибка при сохранении.", color="red")
+                return
+
+            # Проверка дубликата — в хранилище, под той же блокировкой, что и запись
+            self.async_storage.add_contact(
+                name=name, phone=phone, email=email, comment=comment, unique_phone=True,
+                on_done=lambda _: form.show_message("Данные сохранены!", color="green"),
+                on_error=show_error,
+            )
 
         # Создаём форму и передаём ей обработчики
         form = CreateContactForm(
@@ -112,35 +136,68 @@ class ContactController:
         """
         Открывает форму поиска контактов.
         Таблица создаётся один раз, а затем обновляется при каждом поиске.
+
+        Поиск идёт по мере ввода: новый запрос отменяет предыдущий, уточнённый запрос
+        фильтрует прошлые результаты, а найденное выводится в таблицу порциями.
         """
         self.app.clear_screen()
 
         # Создаём таблицу один раз (она будет обновляться)
         columns = ("ID", "Имя", "Телефон", "Email", "Комментарий")
-        tree = AppTable(self.root, columns=columns, show="headings", height=450)
+        tree = VirtualAppTable(self.root, columns=columns, show="headings", height=450)
         tree.table.column("ID", width=0, stretch=tk.NO)
         tree.table.heading("ID", text="ID")
 
-        # Загружаем все контакты один раз (для фильтрации)
-        all_contacts = self.storage.load_contacts()
+        search = IncrementalSearch(self.storage)
+        # Прошлые результаты устаревают при любом изменении контактов.
+        # Уведомление приходит в рабочем потоке — там же, где выполняется поиск.
+        reset_search = lambda event, contact: search.reset()
+        self.storage.subscribe(reset_search)
+        tree.frame.bind("<Destroy>", lambda event: self.storage.unsubscribe(reset_search), add="+")
+
+        # Текущий запрос: флаг отмены и задача в рабочем потоке
+        running: List[Optional[Tuple[threading.Event, Future]]] = [None]
 
         def handle_search(name: str, phone: str, email: str, comment: str) -> None:
-            """Фильтрует контакты и обновляет таблицу."""
-            # Очистка таблицы
-            for item in tree.table.get_children():
-                tree.table.delete(item)
-
-            # Фильтрация
-            results = [
-                c for c in all_contacts
-                if (not name or name.lower() in c["Имя"].lower())
-                   and (not phone or phone.lower() in c["Телефон"].lower())
-                   and (not email or email.lower() in c["Email"].lower())
-                   and (not comment or comment.lower() in c.get("Комментарий", "").lower())
-            ]
-
-            # Загрузка результатов
-            tree.load_contact(results)
+            """Отменяет предыдущий поиск и запускает новый в фоне."""
+            if running[0] is not None:
+                # Ещё не начатая задача отменяется сразу, начатая — на следующей порции
+                running[0][0].set()
+                running[0][1].cancel()
+            cancelled = threading.Event()
+            criteria = {"Имя": name, "Телефон": phone, "Email": email, "Комментарий": comment}
+            first_chunk = [True]
+
+            def show_chunk(contacts: List[Contact]) -> None:
+                """Выводит порцию результатов (в главном потоке)."""
+                if cancelled.is_set() or not tree.exists():
+                    return
+                if first_chunk[0]:
+                    first_chunk[0] = False
+                    tree.set_loading(False)
+                    tree.load_contact(contacts)
+                else:
+                    tree.append_contacts(contacts)
+
+            def run_search() -> None:
+                for contacts in search.search(criteria, cancelled.is_set):
+                    self.async_storage.post(show_chunk, contacts)
+
+            def finished(_: None) -> None:
+                if cancelled.is_set() or not tree.exists():
+                    return
+                tree.set_loading(False)
+                if first_chunk[0]:
+                    # Ничего не найдено
+                    tree.clear()
+
+            def failed(error: BaseException) -> None:
+                if tree.exists():
+                    tree.set_loading(False)
+                print(f"Неизвестная ошибка: {error}")
+
+            tree.set_loading(True)
+            running[0] = (cancelled, self.async_storage.run(run_search, on_done=finished, on_error=failed))
 
         # Создаём форму поиска
         SearchContactForm(
@@ -158,49 +215,50 @@ class ContactController:
 
         # === 1. Создаём таблицу ===
         columns = ("ID", "Имя", "Телефон", "Email", "Комментарий")
-        tree = AppTable(self.root, columns=columns, show="headings", height=620)
+        tree = VirtualAppTable(self.root, columns=columns, show="headings", height=620)
         tree.table.column("ID", width=0, stretch=tk.NO)
         tree.table.heading("ID", text="ID")
 
-        contacts = self.storage.load_contacts()
-        tree.load_contact(contacts)
+        tree.load_async(self.async_storage.load_contacts)
+        # Изменения контактов сразу попадают в таблицу без полной перезагрузки
+        tree.bind_storage(self.async_storage)
 
         # === 2. Статус-метка (для ошибок/успеха) ===
         status_label: List[Optional[AppLabel]] = [None]
 
         def show_message(text: str, fg: str = "red") -> None:
+            # Фоновая операция могла завершиться, когда пользователь уже ушёл с экрана
+            if not tree.exists():
+                return
             if status_label[0]:
                 status_label[0].update_text(text, fg=fg)
             else:
                 status_label[0] = AppLabel(self.root, text=text, fg=fg)
 
         # === 3. Функция: получить выбранный контакт ===
-        def get_selected_contact() -> Optional[Dict[str, str]]:
+        def with_selected_contact(action: Callable[[Dict[str, str]], None]) -> None:
+            """Находит выбранный контакт в хранилище (в фоне) и передаёт его в action."""
             selected_items = tree.selection()
             if not selected_items:
                 show_message("Выберите контакт для действия!")
-                return None
+                return
 
             item_id = selected_items[0]
             values = tree.item(item_id)["values"]
             contact_id = values[0]
-            contact_name = values[1]
 
-            contact = next((c for c in contacts if c["ID"] == contact_id), None)
-            if not contact:
-                show_message("Контакт не найден в данных!")
-                return None
+            def found(contact: Optional[Dict[str, str]]) -> None:
+                if not contact:
+                    show_message("Контакт не найден в данных!")
+                    return
+                action(contact)
 
-            return contact
+            self.async_storage.find_contact_by_id(contact_id, on_done=found)
 
         # === 4. Обработчик "Изменить" ===
-        def handle_edit() -> None:
-            contact = get_selected_contact()
-            if not contact:
-                return
-
+        def edit_selected(contact: Dict[str, str]) -> None:
             def on_save_success() -> None:
-                tree.refresh_table(self.storage.load_contacts)
+                # Строку в таблице уже обновило уведомление хранилища
                 show_message(f"Контакт '{contact['Имя']}' обновлён!", fg="green")
 
             edit_win = tk.Toplevel(self.root)
@@ -208,23 +266,34 @@ class ContactController:
                 parent=edit_win,
                 contact_data=contact,
                 on_save_callback=on_save_success,
-                mode="edit"
+                mode="edit",
+                storage=self.async_storage,
             )
 
-        # === 5. Обработчик "Удалить" ===
-        def handle_delete() -> None:
-            contact = get_selected_contact()
-            if not contact:
-                return
+        def handle_edit() -> None:
+            with_selected_contact(edit_selected)
 
-            def do_delete() -> None:
-                success = self.storage.delete_contact(contact["ID"])
+        # === 5. Обработчик "Удалить" ===
+        def delete_selected(contact: Dict[str, str]) -> None:
+            def deleted(success: bool) -> None:
                 if success:
-                    tree.refresh_table(self.storage.load_contacts)
                     show_message(f"Контакт '{contact['Имя']}' удалён!", fg="green")
                 else:
                     show_message("Не удалось удалить контакт.", fg="red")
 
+            def not_deleted(error: BaseException) -> None:
+                if isinstance(error, ConcurrentUpdateError):
+                    show_message(str(error), fg="red")
+                else:
+                    print(f"Неизвестная ошибка: {error}")
+                    show_message("Не удалось удалить контакт.", fg="red")
+
+            def do_delete() -> None:
+                # Удаляем ту версию, которую пользователь видел в окне подтверждения
+                self.async_storage.delete_contact(
+                    contact["ID"], contact_etag(contact), on_done=deleted, on_error=not_deleted
+                )
+
             confirm_win = tk.Toplevel(self.root)
             AppWindowModal(
                 parent=confirm_win,
@@ -233,6 +302,9 @@ class ContactController:
                 on_confirm=do_delete,
             )
 
+        def handle_delete() -> None:
+            with_selected_contact(delete_selected)
+
         # === 6. Кнопки ===
         AppButton(
             self.root,
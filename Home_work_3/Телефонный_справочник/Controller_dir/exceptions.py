@@ -2,8 +2,12 @@
 Модуль исключений для приложения телефонного справочника.
 
 Содержит пользовательские исключения, связанные с валидацией и обработкой контактов.
+ConcurrentUpdateError и DuplicatePhoneError поднимает хранилище, поэтому они объявлены
+в модели (model/contact_record.py) и только реэкспортируются отсюда для контроллера и представления.
 """
 
+from model.contact_record import ConcurrentUpdateError, DuplicatePhoneError  # noqa: F401
+
 
 class ContactError(Exception):
     """
@@ -53,4 +57,5 @@ class InvalidEmailError(ContactError):
     """
 
     def __init__(self, message: str = "Неверный формат email (пример: user@example.com).") -> None:
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
@@ -0,0 +1,207 @@
+"""
+Модуль фонового доступа к хранилищу контактов.
+
+AsyncStorage выполняет методы хранилища в рабочем потоке и возвращает Future,
+а результаты и ошибки передаёт обратно в главный поток Tk через root.after.
+Окно не «замирает» на время чтения и записи большого файла.
+
+Модуль не импортирует tkinter: от root нужен только метод after(ms, func).
+"""
+
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from model.change_notifier import ChangeListener
+from model.validators import is_valid_email, is_valid_phone
+
+
+Callback = Callable[[Any], None]
+ErrorCallback = Callable[[BaseException], None]
+
+
+def _print_error(error: BaseException) -> None:
+    print(f"Неизвестная ошибка: {error}")
+
+
+class AsyncStorage:
+    """
+    Фасад хранилища, выполняющий операции в фоновом потоке.
+
+    Каждый метод сразу возвращает Future. Если передан on_done (или on_error),
+    он будет вызван в главном потоке с результатом (или исключением) операции.
+    Для отменённых задач колбэки не вызываются.
+
+    Уведомления хранилища об изменениях (subscribe) тоже доставляются в главный поток,
+    поэтому подписчики могут сразу обновлять виджеты.
+
+    ContactStorage не рассчитан на одновременный доступ из нескольких потоков,
+    поэтому по умолчанию поток один и операции выполняются строго по очереди.
+    Всё обращение к хранилищу из интерфейса должно идти через этот фасад.
+
+    :param storage: хранилище контактов (ContactStorage или SQLiteContactStorage)
+    :param root: виджет Tk, через after которого результаты передаются в главный поток
+    :param max_workers: число рабочих потоков
+    :param poll_interval: как часто (мс) главный поток забирает готовые результаты
+    """
+
+    def __init__(self, storage: Any, root: Any, max_workers: int = 1, poll_interval: int = 20) -> None:
+        self.storage = storage
+        self.root = root
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="contacts-io")
+        # Колбэки для главного потока: рабочий поток кладёт, главный забирает в _poll
+        self._results: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._pending = 0  # меняется только в главном потоке
+        self._polling = False
+        self._listeners: Dict[ChangeListener, ChangeListener] = {}
+
+    # --- Общие методы ---
+
+    def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        on_done: Optional[Callback] = None,
+        on_error: Optional[ErrorCallback] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Выполняет func(*args, **kwargs) в рабочем потоке.
+
+        :param on_done: вызывается в главном потоке с результатом
+        :param on_error: вызывается в главном потоке с исключением (по умолчанию ошибка печатается)
+        :return: Future с результатом; пока задача не началась, её можно отменить
+        """
+        future = self._executor.submit(func, *args, **kwargs)
+        self._pending += 1
+        future.add_done_callback(lambda f: self._results.put(lambda: self._deliver(f, on_done, on_error)))
+        self._start_polling()
+        return future
+
+    def call(
+        self,
+        method: str,
+        *args: Any,
+        on_done: Optional[Callback] = None,
+        on_error: Optional[ErrorCallback] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """Вызывает метод хранилища по имени в рабочем потоке (см. run)."""
+        return self.run(getattr(self.storage, method), *args, on_done=on_done, on_error=on_error, **kwargs)
+
+    def post(self, callback: Callable[..., None], *args: Any) -> None:
+        """
+        Передаёт вызов callback(*args) в главный поток.
+
+        Вызывается из задачи в рабочем потоке, чтобы отдавать промежуточные результаты
+        (например, порции найденных контактов), не дожидаясь её завершения.
+        """
+        self._results.put(lambda: callback(*args))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Останавливает рабочие потоки, отменяя ещё не начатые задачи."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    # --- Операции с контактами ---
+
+    def load_contacts(self, on_done: Optional[Callback] = None, on_error: Optional[ErrorCallback] = None) -> Future:
+        """Загружает все контакты."""
+        return self.call("load_contacts", on_done=on_done, on_error=on_error)
+
+    def add_contact(
+        self, name: str, phone: str, email: str, comment: str, unique_phone: bool = False,
+        on_done: Optional[Callback] = None, on_error: Optional[ErrorCallback] = None,
+    ) -> Future:
+        """Добавляет новый контакт (unique_phone — см. ContactStorage.add_contact)."""
+        return self.call(
+            "add_contact", name, phone, email, comment, unique_phone=unique_phone, on_done=on_done, on_error=on_error
+        )
+
+    def update_contact(
+        self, updated_contact: Dict[str, str], expected_etag: Optional[str] = None,
+        on_done: Optional[Callback] = None, on_error: Optional[ErrorCallback] = None,
+    ) -> Future:
+        """Обновляет контакт по ID (expected_etag — см. ContactStorage.update_contact)."""
+        return self.call("update_contact", updated_contact, expected_etag, on_done=on_done, on_error=on_error)
+
+    def delete_contact(
+        self, contact_id: str, expected_etag: Optional[str] = None,
+        on_done: Optional[Callback] = None, on_error: Optional[ErrorCallback] = None,
+    ) -> Future:
+        """Удаляет контакт по ID (expected_etag — см. ContactStorage.delete_contact)."""
+        return self.call("delete_contact", contact_id, expected_etag, on_done=on_done, on_error=on_error)
+
+    def find_contact_by_id(
+        self, contact_id: str, on_done: Optional[Callback] = None, on_error: Optional[ErrorCallback] = None
+    ) -> Future:
+        """Находит контакт по ID."""
+        return self.call("find_contact_by_id", contact_id, on_done=on_done, on_error=on_error)
+
+    def filter_contacts(
+        self, name: str = "", phone: str = "", email: str = "", comment: str = "",
+        on_done: Optional[Callback] = None, on_error: Optional[ErrorCallback] = None,
+    ) -> Future:
+        """Ищет контакты по нескольким полям одновременно."""
+        return self.call("filter_contacts", name, phone, email, comment, on_done=on_done, on_error=on_error)
+
+    # Проверка формата не трогает файл — выполняется сразу
+    @staticmethod
+    def is_valid_phone(phone: str) -> bool:
+        """Проверяет, корректен ли номер телефона."""
+        return is_valid_phone(phone)
+
+    @staticmethod
+    def is_valid_email(email: str) -> bool:
+        """Проверяет, корректен ли email."""
+        return is_valid_email(email)
+
+    # --- Уведомления ---
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """Подписывает функцию на изменения хранилища; она вызывается в главном потоке."""
+        def forward(event: str, contact: Any) -> None:
+            self._results.put(lambda: listener(event, contact))
+
+        self._listeners[listener] = forward
+        self.storage.subscribe(forward)
+
+    def unsubscribe(self, listener: ChangeListener) -> None:
+        """Отписывает функцию от изменений хранилища."""
+        forward = self._listeners.pop(listener, None)
+        if forward is not None:
+            self.storage.unsubscribe(forward)
+
+    # --- Главный поток ---
+
+    def _deliver(self, future: Future, on_done: Optional[Callback], on_error: Optional[ErrorCallback]) -> None:
+        """Вызывает колбэк задачи (в главном потоке)."""
+        self._pending -= 1
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            (on_error or _print_error)(error)
+        elif on_done is not None:
+            on_done(future.result())
+
+    def _start_polling(self) -> None:
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval, self._poll)
+
+    def _poll(self) -> None:
+        """Выполняет накопившиеся колбэки; опрос продолжается, пока есть незавершённые задачи."""
+        while True:
+            try:
+                callback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as error:
+                _print_error(error)
+        if self._pending:
+            self.root.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
@@ -0,0 +1,53 @@
+"""
+Модуль уведомлений об изменении контактов.
+
+Хранилища подмешивают ChangeNotifierMixin и сообщают подписчикам о каждом
+добавлении, изменении и удалении. Представление может обновить только
+изменившуюся строку таблицы вместо полной перезагрузки списка.
+"""
+
+from typing import Callable, List, Mapping, Optional
+
+
+Contact = Mapping[str, str]
+
+# События изменений
+CHANGE_ADD = "add"
+CHANGE_UPDATE = "update"
+CHANGE_DELETE = "delete"
+# Изменилось сразу много контактов (массовый импорт, полная перезапись) — нужен полный перечит
+CHANGE_RELOAD = "reload"
+
+ChangeListener = Callable[[str, Optional[Contact]], None]
+
+
+class ChangeNotifierMixin:
+    """
+    Миксин для рассылки уведомлений об изменениях.
+
+    Подписчик вызывается как listener(event, contact), где event — одна из констант CHANGE_*,
+    а contact — изменённый контакт (для CHANGE_DELETE достаточно его ID, для CHANGE_RELOAD — None).
+    Уведомления приходят в том потоке, где было сделано изменение.
+    """
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """Подписывает функцию на изменения."""
+        self._listeners().append(listener)
+
+    def unsubscribe(self, listener: ChangeListener) -> None:
+        """Отписывает функцию от изменений (если она была подписана)."""
+        listeners = self._listeners()
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def _listeners(self) -> List[ChangeListener]:
+        # Список создаётся лениво, чтобы классам не нужно было вызывать __init__ миксина
+        listeners = self.__dict__.get("_change_listeners")
+        if listeners is None:
+            listeners = self.__dict__["_change_listeners"] = []
+        return listeners
+
+    def _notify(self, event: str, contact: Optional[Contact] = None) -> None:
+        """Рассылает событие всем подписчикам."""
+        for listener in list(self._listeners()):
+            listener(event, contact)
@@ -0,0 +1,16 @@
+"""
+Настройки хранилища контактов.
+
+Бэкенд выбирается переменной окружения CONTACTS_BACKEND:
+"csv" (по умолчанию) — CSV-файл с кэшем и журналом, "sqlite" — база SQLite.
+"""
+
+import os
+
+BACKEND_CSV = "csv"
+BACKEND_SQLITE = "sqlite"
+
+STORAGE_BACKEND = os.environ.get("CONTACTS_BACKEND", BACKEND_CSV)
+
+CSV_FILENAME = os.environ.get("CONTACTS_CSV_FILE", "ДЗ2_Контакты.txt")
+SQLITE_FILENAME = os.environ.get("CONTACTS_SQLITE_FILE", "contacts.db")
@@ -0,0 +1,325 @@
+"""
+Модуль индекса контактов, хранящегося в памяти.
+
+Класс ContactIndex держит все контакты и вторичные индексы по ID, телефону и email.
+Используется ContactStorage в кэширующем режиме, чтобы поиск по ID, телефону и email
+выполнялся двоичным поиском без повторного чтения файла, а поиск по подстроке —
+через триграммный индекс (TrigramIndex).
+
+Индекс рассчитан на миллион контактов и бережёт память:
+- контакты хранятся упакованными в строки байт (ContactRecord.pack) в списке,
+  где позиция — номер строки; удалённый контакт оставляет пустое место (None),
+  и когда пустых мест больше, чем контактов, индекс перестраивается;
+- ID, телефоны и email не хранятся отдельными строками: вторичные индексы
+  (KeyIndex) держат только числовой ключ и номер строки, а значение поля
+  при поиске берётся из самого контакта.
+
+Телефоны индексируются по нормализованному ключу (normalize_phone), переведённому
+в число с тем же порядком, что у строк: поиск по началу номера — это поиск диапазона ключей.
+"""
+
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+from model.contact_record import FIELDNAMES, ContactRecord, PackedContact
+from model.contact_table import ContactTable
+from model.key_index import KeyIndex
+from model.trigram_index import SEARCH_FIELDS, TrigramIndex
+from model.validators import normalize_phone, phone_prefix_keys
+
+
+Contact = Mapping[str, str]
+
+# Сколько первых цифр телефона входит в числовой ключ (число до 10**18 помещается в 8 байт)
+PHONE_KEY_DIGITS = 18
+
+# Ключ телефонов с цифрами не из ASCII (такие номера находит только точный поиск)
+OTHER_PHONE_KEY = -1
+
+# Индекс перестраивается, когда удалённых строк больше, чем контактов, но не меньше этого числа
+COMPACT_MIN_DELETED = 1024
+
+
+def phone_key(phone: str) -> int:
+    """
+    Переводит нормализованный номер в число, сравнимое так же, как строки.
+
+    Номер дополняется нулями до PHONE_KEY_DIGITS цифр, поэтому все номера,
+    начинающиеся с "7920", лежат между ключами "7920000…" и "7920999…".
+    Разные номера могут дать один ключ — совпадения проверяются по самому контакту.
+    """
+    if not phone.isascii():
+        return OTHER_PHONE_KEY
+    return int(phone[:PHONE_KEY_DIGITS].ljust(PHONE_KEY_DIGITS, "0"))
+
+
+def _email_key(contact: ContactRecord) -> str:
+    return contact.email.strip().lower()
+
+
+def _search_text(packed: PackedContact) -> str:
+    """
+    Возвращает поля поиска (SEARCH_FIELDS — все, кроме ID) в нижнем регистре через NUL.
+
+    Подстрока без NUL встречается в этой строке, только если она есть в одном из полей,
+    поэтому search проверяет её без распаковки контакта в запись.
+    """
+    if type(packed) is bytes:
+        text = packed.decode("utf-8")
+        return text[text.index("\x00") + 1:].lower()
+    return "\x00".join(packed[field] for field in SEARCH_FIELDS).lower()
+
+
+def _lower_values(packed: PackedContact) -> Sequence[str]:
+    """Возвращает значения полей в нижнем регистре в порядке FIELDNAMES (для filter)."""
+    if type(packed) is bytes:
+        return packed.decode("utf-8").lower().split("\x00")
+    return [packed[field].lower() for field in FIELDNAMES]
+
+
+class ContactIndex:
+    """
+    Индекс контактов в памяти.
+
+    Номера строк растут в порядке добавления, поэтому порядок контактов
+    совпадает с порядком строк в файле, и список контактов получается без сортировки.
+    Контакты выдаются как неизменяемые ContactRecord.
+    """
+
+    def __init__(self, contacts: Iterable[Contact] = ()) -> None:
+        # Номер строки → упакованный контакт (None — контакт удалён)
+        self._rows: List[Optional[PackedContact]] = []
+        self._deleted = 0
+        self._ids = KeyIndex()
+        self._phones = KeyIndex()
+        self._emails = KeyIndex()
+        self.trigrams = TrigramIndex()
+        self.extend(contacts)
+        # Сортируем сразу, чтобы первый поиск после загрузки не ждал сортировки
+        for keys in (self._ids, self._phones, self._emails):
+            keys.sort()
+        # В файле ID может повториться (правка вручную) — остаётся последний контакт, как при add
+        for key in self._ids.repeated_keys():
+            rows_by_id: Dict[str, List[int]] = {}
+            for row in self._ids.find(key):
+                rows_by_id.setdefault(self._record(row).id, []).append(row)
+            for rows in rows_by_id.values():
+                for row in sorted(rows)[:-1]:
+                    self._remove_row(row)
+
+    def __len__(self) -> int:
+        return len(self._rows) - self._deleted
+
+    def __contains__(self, contact_id: str) -> bool:
+        return self._find_row(contact_id) is not None
+
+    def contacts(self) -> ContactTable:
+        """Возвращает все контакты в порядке файла."""
+        if not self._deleted:
+            return ContactTable.from_packed(list(self._rows))
+        return ContactTable.from_packed([row for row in self._rows if row is not None])
+
+    def get(self, contact_id: str) -> Optional[ContactRecord]:
+        """Возвращает контакт по ID или None."""
+        row = self._find_row(contact_id)
+        return None if row is None else self._record(row)
+
+    def add(self, contact: Contact) -> None:
+        """Добавляет контакт в индекс (или заменяет контакт с тем же ID, перенося его в конец)."""
+        contact = ContactRecord.from_mapping(contact)
+        old = self._find_row(contact.id)
+        if old is not None:
+            self._remove_row(old)
+        row = len(self._rows)
+        self._rows.append(contact.pack())
+        self._link(row, contact, self._ids.add, self._phones.add, self._emails.add)
+
+    def extend(self, contacts: Iterable[Contact]) -> None:
+        """
+        Добавляет много контактов с новыми ID (только что созданные или при загрузке файла).
+
+        ID не проверяются на повтор, а вторичные индексы сортируются один раз —
+        при следующем поиске, поэтому массовое добавление не замедляется с ростом индекса.
+        """
+        for contact in contacts:
+            contact = ContactRecord.from_mapping(contact)
+            row = len(self._rows)
+            self._rows.append(contact.pack())
+            self._link(row, contact, self._ids.append, self._phones.append, self._emails.append)
+
+    def replace(self, contact: Contact) -> bool:
+        """
+        Заменяет контакт с тем же ID, сохраняя его позицию.
+
+        :return: True, если контакт был в индексе
+        """
+        contact = ContactRecord.from_mapping(contact)
+        row = self._find_row(contact.id)
+        if row is None:
+            return False
+        self._unlink(row, self._record(row), with_id=False)
+        self._rows[row] = contact.pack()
+        self._link(row, contact, None, self._phones.add, self._emails.add)
+        return True
+
+    def remove(self, contact_id: str) -> Optional[Contact]:
+        """
+        Удаляет контакт из индекса.
+
+        :return: удалённый контакт или None, если его не было
+        """
+        row = self._find_row(contact_id)
+        if row is None:
+            return None
+        old = self._remove_row(row)
+        if self._deleted >= COMPACT_MIN_DELETED and self._deleted > len(self):
+            self._compact()
+        return old
+
+    def find_by_phone(self, phone: str) -> List[Contact]:
+        """Возвращает контакты с тем же номером телефона (после нормализации)."""
+        key = normalize_phone(phone)
+        if not key:
+            return []
+        rows = self._phones.find(phone_key(key))
+        return self._select(rows, lambda c: normalize_phone(c.phone) == key)
+
+    def has_phone(self, phone: str) -> bool:
+        """Проверяет двоичным поиском, есть ли контакт с таким номером телефона."""
+        return bool(self.find_by_phone(phone))
+
+    def find_by_phone_prefix(self, prefix: str) -> List[Contact]:
+        """Возвращает контакты, нормализованный телефон которых начинается с prefix."""
+        keys = tuple(phone_prefix_keys(prefix))
+        rows: Set[int] = set()
+        # Для начала без кода страны просматриваются два диапазона (см. phone_prefix_keys)
+        for key in keys:
+            if key.isascii():
+                low = int(key[:PHONE_KEY_DIGITS].ljust(PHONE_KEY_DIGITS, "0"))
+                high = int(key[:PHONE_KEY_DIGITS].ljust(PHONE_KEY_DIGITS, "9"))
+                rows.update(self._phones.find_range(low, high))
+            else:
+                rows.update(self._phones.find(OTHER_PHONE_KEY))
+        return self._select(rows, lambda c: normalize_phone(c.phone).startswith(keys))
+
+    def find_by_email(self, email: str) -> List[Contact]:
+        """Возвращает контакты с таким email (без учёта регистра)."""
+        email = email.strip().lower()
+        if not email:
+            return []
+        rows = self._emails.find(hash(email))
+        return self._select(rows, lambda c: _email_key(c) == email)
+
+    def search(self, query: str) -> ContactTable:
+        """
+        Ищет контакты, у которых подстрока встречается хотя бы в одном поле.
+
+        Найденные контакты возвращаются упакованными (ContactTable) и распаковываются
+        только при обращении: списку из тысяч совпадений не нужны тысячи записей в памяти.
+        """
+        query = query.lower()
+        rows: Optional[Set[int]] = set()
+        for field in SEARCH_FIELDS:
+            candidates = self.trigrams.candidates(field, query)
+            if candidates is None:
+                rows = None
+                break
+            rows |= candidates
+        if "\x00" in query:
+            # NUL разделяет поля в _search_text — такой запрос проверяем по каждому полю, кроме ID
+            found = [p for p in self._packed(rows) if any(query in value for value in _lower_values(p)[1:])]
+        else:
+            found = [p for p in self._packed(rows) if query in _search_text(p)]
+        return ContactTable.from_packed(found)
+
+    def filter(self, criteria: Dict[str, str]) -> ContactTable:
+        """
+        Ищет контакты, у которых каждое заполненное поле критерия содержит подстроку.
+
+        :param criteria: словарь поле → подстрока; пустые значения игнорируются
+        :return: найденные контакты в упакованном виде (как у search)
+        """
+        criteria = {field: value.lower() for field, value in criteria.items() if value}
+        if any(field not in FIELDNAMES for field in criteria):
+            # Такого поля у контакта нет, значит, оно пустое и подстроку не содержит
+            return ContactTable()
+        positions = [(FIELDNAMES.index(field), value) for field, value in criteria.items()]
+
+        rows: Optional[Set[int]] = None
+        for field, value in criteria.items():
+            candidates = self.trigrams.candidates(field, value)
+            if candidates is None:
+                # Короткий запрос: индекс не сужает поиск, проверим подстроку напрямую
+                continue
+            rows = candidates if rows is None else rows & candidates
+        found = []
+        for packed in self._packed(rows):
+            values = _lower_values(packed)
+            if all(value in values[i] for i, value in positions):
+                found.append(packed)
+        return ContactTable.from_packed(found)
+
+    def _select(
+        self, rows: Optional[Iterable[int]], matches: Callable[[ContactRecord], bool]
+    ) -> List[Contact]:
+        """Проверяет кандидатов (номера строк) и возвращает подходящие контакты в порядке файла."""
+        candidates = map(ContactRecord.unpack, self._packed(rows))
+        return [c for c in candidates if matches(c)]
+
+    def _packed(self, rows: Optional[Iterable[int]]) -> Iterable[PackedContact]:
+        """Упакованные контакты с номерами строк rows (None — все) в порядке файла."""
+        if rows is None:
+            return (packed for packed in self._rows if packed is not None)
+        return (self._rows[row] for row in sorted(set(rows)))
+
+    def _record(self, row: int) -> ContactRecord:
+        return ContactRecord.unpack(self._rows[row])
+
+    def _find_rows(self, contact_id: str) -> List[int]:
+        return [row for row in self._ids.find(hash(contact_id)) if self._record(row).id == contact_id]
+
+    def _find_row(self, contact_id: str) -> Optional[int]:
+        rows = self._find_rows(contact_id)
+        return rows[0] if rows else None
+
+    def _link(
+        self,
+        row: int,
+        contact: ContactRecord,
+        add_id: Optional[Callable[[int, int], None]],
+        add_phone: Callable[[int, int], None],
+        add_email: Callable[[int, int], None],
+    ) -> None:
+        """Вносит контакт в индексы (add_* — KeyIndex.add или KeyIndex.append)."""
+        if add_id is not None:
+            add_id(hash(contact.id), row)
+        phone = normalize_phone(contact.phone)
+        if phone:
+            add_phone(phone_key(phone), row)
+        email = _email_key(contact)
+        if email:
+            add_email(hash(email), row)
+        self.trigrams.add(row, contact)
+
+    def _unlink(self, row: int, contact: ContactRecord, with_id: bool = True) -> None:
+        if with_id:
+            self._ids.remove(hash(contact.id), row)
+        phone = normalize_phone(contact.phone)
+        if phone:
+            self._phones.remove(phone_key(phone), row)
+        email = _email_key(contact)
+        if email:
+            self._emails.remove(hash(email), row)
+        self.trigrams.remove(row, contact)
+
+    def _remove_row(self, row: int) -> ContactRecord:
+        old = self._record(row)
+        self._unlink(row, old)
+        self._rows[row] = None
+        self._deleted += 1
+        return old
+
+    def _compact(self) -> None:
+        """Перестраивает индекс без удалённых строк (номера строк меняются)."""
+        rows = [row for row in self._rows if row is not None]
+        self.__init__()
+        self.extend(ContactRecord.unpack(row) for row in rows)
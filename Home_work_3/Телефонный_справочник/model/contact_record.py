@@ -0,0 +1,151 @@
+"""
+Модуль компактной записи контакта.
+
+ContactRecord хранит пять полей контакта в слотах, а не в словаре, поэтому
+занимает в памяти в несколько раз меньше, чем dict с пятью ключами.
+Запись ведёт себя как неизменяемый словарь: contact["Имя"], contact.get("Email", ""),
+"ID" in contact, dict(contact) и сравнение со словарём работают как раньше.
+
+Для хранения большого числа контактов запись упаковывается в одну строку байт
+(ContactRecord.pack): так её держат ContactTable и ContactIndex.
+
+Версия контакта (etag) — короткий хеш его полей. Она не хранится в файле,
+а вычисляется по содержимому, поэтому любое изменение контакта меняет etag.
+"""
+
+import hashlib
+from collections.abc import Mapping
+from typing import Iterator, Mapping as MappingType, Sequence, Union
+
+
+FIELDNAMES = ("ID", "Имя", "Телефон", "Email", "Комментарий")
+
+# Поле контакта → имя слота
+_SLOTS = {"ID": "id", "Имя": "name", "Телефон": "phone", "Email": "email", "Комментарий": "comment"}
+
+# Разделитель полей в упакованной записи
+_SEPARATOR = "\x00"
+
+# Упакованный контакт (см. ContactRecord.pack)
+PackedContact = Union[bytes, "ContactRecord"]
+
+
+def contact_etag(contact: MappingType[str, str]) -> str:
+    """
+    Возвращает версию (etag) контакта — хеш всех его полей.
+
+    Используется для оптимистичной блокировки: клиент запоминает etag прочитанного
+    контакта, а при сохранении хранилище проверяет, что контакт с тех пор не менялся.
+    """
+    data = "\x1f".join(contact.get(field) or "" for field in FIELDNAMES)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class ConcurrentUpdateError(Exception):
+    """
+    Исключение, возникающее при сохранении контакта, который с момента чтения
+    успел изменить или удалить кто-то другой (другое окно приложения или скрипт).
+
+    Версия контакта сравнивается по etag (contact_etag).
+
+    :param message: Пользовательское сообщение об ошибке.
+                    По умолчанию: "Контакт был изменён в другом окне. Откройте его заново."
+    """
+
+    def __init__(self, message: str = "Контакт был изменён в другом окне. Откройте его заново.") -> None:
+        super().__init__(message)
+
+
+class DuplicatePhoneError(Exception):
+    """
+    Исключение, возникающее при попытке добавить контакт с номером телефона,
+    который уже есть в справочнике (add_contact с unique_phone=True).
+
+    Номера сравниваются после нормализации: "8 901 123-45-67" и "+79011234567" — один номер.
+
+    :param message: Пользовательское сообщение об ошибке.
+                    По умолчанию: "Контакт с таким телефоном уже существует."
+    """
+
+    def __init__(self, message: str = "Контакт с таким телефоном уже существует.") -> None:
+        super().__init__(message)
+
+
+class ContactRecord(Mapping):
+    """
+    Неизменяемая запись контакта с доступом по ключам словаря.
+
+    Изменить запись нельзя — для правки создаётся новая: dict(contact, Имя="...").
+    Благодаря этому записи из кэша можно отдавать наружу без копирования.
+    """
+
+    __slots__ = ("id", "name", "phone", "email", "comment")
+
+    def __init__(self, id: str, name: str = "", phone: str = "", email: str = "", comment: str = "") -> None:
+        self.id = id
+        self.name = name
+        self.phone = phone
+        self.email = email
+        self.comment = comment
+
+    @classmethod
+    def from_mapping(cls, contact: MappingType[str, str]) -> "ContactRecord":
+        """Создаёт запись из словаря с полями контакта (уже готовая запись возвращается как есть)."""
+        if isinstance(contact, cls):
+            return contact
+        return cls(*(contact.get(field) or "" for field in FIELDNAMES))
+
+    @classmethod
+    def from_values(cls, values: Sequence[str]) -> "ContactRecord":
+        """Создаёт запись из значений в порядке FIELDNAMES (недостающие — пустые строки)."""
+        values = list(values[:len(FIELDNAMES)])
+        values += [""] * (len(FIELDNAMES) - len(values))
+        return cls(*values)
+
+    def pack(self) -> PackedContact:
+        """
+        Упаковывает запись в одну строку байт: поля в UTF-8, разделённые NUL.
+
+        Строка байт с пятью полями занимает в несколько раз меньше памяти, чем запись
+        с пятью отдельными строками (у каждой строки Python свой заголовок, а кириллица
+        в str хранится по 2 байта на символ). Запись, в полях которой есть NUL,
+        упаковать нельзя — она возвращается как есть.
+        """
+        text = _SEPARATOR.join((self.id, self.name, self.phone, self.email, self.comment))
+        if text.count(_SEPARATOR) != len(FIELDNAMES) - 1:
+            return self
+        return text.encode("utf-8")
+
+    @classmethod
+    def unpack(cls, packed: PackedContact) -> "ContactRecord":
+        """Восстанавливает запись, упакованную методом pack."""
+        if isinstance(packed, cls):
+            return packed
+        return cls(*packed.decode("utf-8").split(_SEPARATOR))
+
+    @property
+    def etag(self) -> str:
+        """Версия контакта (см. contact_etag)."""
+        return contact_etag(self)
+
+    def __getitem__(self, key: str) -> str:
+        try:
+            slot = _SLOTS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return getattr(self, slot)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        raise TypeError("ContactRecord неизменяем: создайте новую запись, например dict(contact, ...)")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDNAMES)
+
+    def __len__(self) -> int:
+        return len(FIELDNAMES)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _SLOTS
+
+    def __repr__(self) -> str:
+        return f"ContactRecord({dict(self)!r})"
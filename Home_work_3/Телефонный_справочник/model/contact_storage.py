@@ -1,106 +1,621 @@
 """
 Модуль для работы с данными контактов: загрузка, сохранение, добавление, обновление, удаление.
 Использует CSV для хранения данных и uuid для генерации уникальных ID.
+
+В кэширующем режиме (cached=True) файл читается один раз, а контакты хранятся
+в индексе в памяти (ContactIndex). Индекс перечитывается, только если у файла
+изменились время модификации или размер.
+
+В режиме журнала (journaled=True) добавление, изменение и удаление не переписывают
+весь файл, а дописывают одну запись в журнал рядом с CSV (<файл>.journal).
+При чтении журнал применяется поверх основного файла, а когда записей в нём
+становится больше compact_threshold, журнал сворачивается обратно в CSV.
+
+Массовый импорт (bulk_add_contacts) и экспорт (export_contacts) работают потоково:
+данные читаются и пишутся пачками, и память не растёт с размером входа.
+Операции чтения без кэша тоже идут по файлу построчно (iter_contacts):
+список всех контактов не строится, а поиск по ID останавливается на первом совпадении.
+
+Строки файла превращаются в неизменяемые записи ContactRecord, которые читаются
+как словари (contact["Имя"]). Списки контактов (load_contacts) и кэш хранят их
+упакованными в строки байт (ContactTable, ContactIndex) — в несколько раз компактнее.
+Без кэша добавление, изменение и удаление перезаписывают файл потоково,
+не собирая список всех контактов.
+
+О каждом изменении хранилище сообщает подписчикам (ChangeNotifierMixin).
+
+С одним файлом могут одновременно работать несколько экземпляров хранилища
+(два окна приложения, приложение и скрипт). Запись идёт под межпроцессной
+блокировкой (<файл>.lock), внутри которой хранилище перечитывает изменения
+других процессов. Файл целиком перезаписывается атомарно: данные пишутся
+во временный файл, который затем подменяет основной, поэтому читатели
+блокировку не берут и никогда не видят файл наполовину записанным.
+update_contact и delete_contact принимают expected_etag — версию контакта,
+которую видел пользователь; если контакт успели изменить, выбрасывается
+ConcurrentUpdateError, и чужое изменение не теряется.
 """
 
 # contact_storage.py
 import csv
+import io
+import os
+import stat
+import tempfile
 import uuid
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from itertools import chain, islice
+from typing import Callable, IO, Iterable, Iterator, List, Dict, Mapping, Optional, Sequence, Tuple
+
+from model.change_notifier import CHANGE_ADD, CHANGE_DELETE, CHANGE_RELOAD, CHANGE_UPDATE, ChangeNotifierMixin
+from model.contact_index import ContactIndex
+from model.contact_record import ConcurrentUpdateError, ContactRecord, DuplicatePhoneError, contact_etag
+from model.contact_table import ContactTable
+from model.file_lock import FileLock
+from model.validators import is_valid_email, is_valid_phone, normalize_phone, phone_prefix_keys
 
 
-Contact = Dict[str, str]
+Contact = Mapping[str, str]
 
+FIELDNAMES = ["ID", "Имя", "Телефон", "Email", "Комментарий"]
 
-class ContactStorage:
+# Операции в журнале изменений (совпадают с событиями для подписчиков)
+JOURNAL_ADD = CHANGE_ADD
+JOURNAL_UPDATE = CHANGE_UPDATE
+JOURNAL_DELETE = CHANGE_DELETE
+
+FileStamp = Optional[Tuple[int, int, int]]
+
+
+def _stat(path: str) -> FileStamp:
+    """
+    Возвращает (mtime, размер, inode) файла или None, если файла нет.
+
+    inode меняется при атомарной замене файла, даже если время и размер совпали.
+    """
+    try:
+        result = os.stat(path)
+    except OSError:
+        return None
+    return result.st_mtime_ns, result.st_size, result.st_ino
+
+
+def _fold_journal(journal: List[List[str]]) -> Dict[str, Tuple[str, Optional[Contact]]]:
+    """
+    Сворачивает записи журнала в итоговое состояние каждого затронутого контакта.
+
+    Результат: ID → (операция, контакт). JOURNAL_ADD — контакт добавлен через журнал,
+    JOURNAL_UPDATE — изменён контакт основного файла, JOURNAL_DELETE — контакт удалён.
+    Повторное применение одной и той же записи ничего не меняет, поэтому
+    журнал, не удалённый после сворачивания, не испортит данные.
+    """
+    state: Dict[str, Tuple[str, Optional[Contact]]] = {}
+    for row in journal:
+        if not row:
+            continue
+        operation, values = row[0], row[1:]
+        contact = ContactRecord.from_values(values)
+        contact_id = contact.id
+        previous = state.get(contact_id, (None, None))[0]
+        if operation == JOURNAL_ADD:
+            state[contact_id] = (JOURNAL_ADD, contact)
+        elif operation == JOURNAL_UPDATE and previous != JOURNAL_DELETE:
+            state[contact_id] = (previous or JOURNAL_UPDATE, contact)
+        elif operation == JOURNAL_DELETE:
+            state[contact_id] = (JOURNAL_DELETE, None)
+    return state
+
+
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    """Разбивает поток элементов на списки не длиннее size."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def make_contact(name: str, phone: str, email: str, comment: str) -> ContactRecord:
+    """Создаёт запись нового контакта со свежим ID."""
+    return ContactRecord(str(uuid.uuid4()), name.strip(), phone.strip(), email.strip(), comment.strip())
+
+
+def is_valid_contact_row(row: Mapping[str, str]) -> bool:
+    """
+    Проверяет импортируемую строку так же, как форма создания контакта:
+    имя и телефон обязательны, телефон и email (если указан) должны быть корректны.
+    """
+    name = (row.get("Имя") or "").strip()
+    phone = (row.get("Телефон") or "").strip()
+    email = (row.get("Email") or "").strip()
+    return bool(name) and is_valid_phone(phone) and (not email or is_valid_email(email))
+
+
+class ContactStorage(ChangeNotifierMixin):
     """
     Класс для управления хранением контактов в CSV-файле.
     Позволяет избежать глобальных переменных и упрощает тестирование.
+
+    :param filename: путь к CSV-файлу с контактами
+    :param cached: держать контакты в памяти и не перечитывать файл при каждом вызове
+    :param journaled: дописывать изменения в журнал вместо перезаписи всего файла
+    :param compact_threshold: число записей в журнале, после которого он сворачивается в CSV
+    :param lock_timeout: сколько секунд ждать блокировку записи (None — без ограничения)
     """
-    def __init__(self, filename: str = "ДЗ2_Контакты.txt") -> None:
+    def __init__(
+        self,
+        filename: str = "ДЗ2_Контакты.txt",
+        cached: bool = False,
+        journaled: bool = False,
+        compact_threshold: int = 1000,
+        lock_timeout: Optional[float] = None,
+    ) -> None:
         self.filename = filename
+        self.journal_filename = filename + ".journal"
+        self.lock_filename = filename + ".lock"
+        self._lock = FileLock(self.lock_filename, timeout=lock_timeout)
+        self.cached = cached
+        self.journaled = journaled
+        self.compact_threshold = compact_threshold
+        self._index: Optional[ContactIndex] = None
+        self._stamp: Optional[Tuple[FileStamp, FileStamp]] = None
+        self._journal_count: Optional[int] = None
+
+    def _file_stamp(self) -> Tuple[FileStamp, FileStamp]:
+        """Возвращает состояние основного файла и журнала."""
+        return _stat(self.filename), _stat(self.journal_filename)
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """
+        Блокирует файл для записи от других процессов и экземпляров хранилища.
 
-    def load_contacts(self) -> List[Contact]:
-        """Загружает контакты из файла."""
+        Если файлы успели изменить другие, счётчик записей журнала пересчитывается,
+        а индекс (в кэширующем режиме) перечитается при следующем обращении.
+        """
+        with self._lock:
+            if self._stamp is not None and self._file_stamp() != self._stamp:
+                self._journal_count = None
+            yield
+
+    def _read_file(self) -> ContactTable:
+        """Читает все контакты из файла и применяет к ним журнал."""
+        return ContactTable(self._iter_file())
+
+    def _iter_file(self) -> Iterator[Contact]:
+        """
+        Построчно читает контакты из файла, применяя к ним журнал.
+
+        В памяти держится только свёрнутый журнал, размер которого ограничен compact_threshold.
+        """
+        state = _fold_journal(self._read_journal())
+        seen = set()
         try:
             with open(self.filename, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                return list(reader)
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if header is None:
+                    header = FIELDNAMES
+                # Порядок колонок берём из заголовка, как DictReader
+                positions = [header.index(field) if field in header else None for field in FIELDNAMES]
+                if positions == list(range(len(FIELDNAMES))):
+                    rows = (ContactRecord.from_values(row) for row in reader if row)
+                else:
+                    rows = (
+                        ContactRecord.from_values([row[i] if i is not None and i < len(row) else "" for i in positions])
+                        for row in reader if row
+                    )
+                for contact in rows:
+                    contact_id = contact.id
+                    if contact_id not in state:
+                        yield contact
+                        continue
+                    seen.add(contact_id)
+                    operation, patched = state[contact_id]
+                    if operation != JOURNAL_DELETE:
+                        yield patched
         except FileNotFoundError:
-            return []
+            pass
         except Exception as e:
             print(f"Ошибка при загрузке контактов: {e}")
+            return
+        for contact_id, (operation, contact) in state.items():
+            if operation == JOURNAL_ADD and contact_id not in seen:
+                yield contact
+
+    def _read_journal(self) -> List[List[str]]:
+        """Читает записи журнала изменений."""
+        try:
+            with open(self.journal_filename, "r", encoding="utf-8", newline="") as file:
+                return list(csv.reader(file))
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"Ошибка при чтении журнала: {e}")
             return []
 
-    def write_contacts(self, contacts: List[Contact]) -> None:
-        """Сохраняет контакты в файл."""
-        fieldnames = ["ID", "Имя", "Телефон", "Email", "Комментарий"]
+    def _append_journal(self, operation: str, contact: Contact) -> bool:
+        """Дописывает одну запись в журнал изменений."""
+        if self._journal_count is None:
+            self._journal_count = len(self._read_journal())
         try:
-            with open(self.filename, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(contacts)
+            with open(self.journal_filename, "a", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow([operation] + [contact.get(field, "") for field in FIELDNAMES])
         except Exception as e:
-            print(f"Ошибка при записи контактов: {e}")
+            print(f"Ошибка при записи журнала: {e}")
+            self._index = None
+            return False
+        self._journal_count += 1
+        self._stamp = self._file_stamp()
+        return True
 
-    def add_contact(self, name: str, phone: str, email: str, comment: str) -> Contact:
-        """Добавляет новый контакт."""
-        contacts = self.load_contacts()
-        new_contact = {
-            "ID": str(uuid.uuid4()),
-            "Имя": name.strip(),
-            "Телефон": phone.strip(),
-            "Email": email.strip(),
-            "Комментарий": comment.strip(),
-        }
-        contacts.append(new_contact)
-        self.write_contacts(contacts)
-        return new_contact
+    def _commit(
+        self, operation: str, contact: Contact, all_contacts: Callable[[], Iterable[Contact]]
+    ) -> None:
+        """
+        Сохраняет одно изменение: в журнал или перезаписью всего файла,
+        и после успешной записи сообщает о нём подписчикам.
+
+        :param operation: операция журнала (JOURNAL_ADD, JOURNAL_UPDATE, JOURNAL_DELETE)
+        :param contact: изменённый контакт (для удаления достаточно ID)
+        :param all_contacts: функция, возвращающая все контакты после изменения (можно генератор)
+        """
+        if not self.journaled:
+            saved = self._save(all_contacts())
+        else:
+            saved = self._append_journal(operation, contact)
+            if saved and self._journal_count >= self.compact_threshold:
+                self.compact()
+        if saved:
+            self._notify(operation, ContactRecord.from_mapping(contact))
+
+    def compact(self) -> None:
+        """Сворачивает журнал в основной CSV-файл и удаляет журнал."""
+        with self._write_lock():
+            contacts = self._get_index().contacts() if self.cached else self._iter_file()
+            self._save(contacts)
+
+    def _get_index(self) -> ContactIndex:
+        """Возвращает индекс, перечитывая файл, если он изменился с момента загрузки."""
+        stamp = self._file_stamp()
+        if self._index is None or stamp != self._stamp:
+            self._index = ContactIndex(self._iter_file())
+            self._stamp = stamp
+        return self._index
 
-    def update_contact(self, updated_contact: Contact) -> bool:
-        """Обновляет контакт по ID."""
-        contacts = self.load_contacts()
-        found = False
-        for i, contact in enumerate(contacts):
-            if contact["ID"] == updated_contact["ID"]:
-                contacts[i] = updated_contact
-                found = True
-                break
-        if found:
-            self.write_contacts(contacts)
-        return found
-
-    def delete_contact(self, contact_id: str) -> bool:
-        """Удаляет контакт по ID."""
-        contacts = self.load_contacts()
-        initial_length = len(contacts)
-        updated_contacts = [c for c in contacts if c["ID"] != contact_id]
-        if len(updated_contacts) == initial_length:
+    def _save(self, contacts: Iterable[Contact]) -> bool:
+        """Записывает контакты в файл и запоминает его новое состояние."""
+        def write(f: IO[str]) -> None:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(contacts)
+
+        return self._replace_file(write)
+
+    def _replace_file(self, write: Callable[[IO[str]], None]) -> bool:
+        """
+        Перезаписывает основной файл содержимым, которое выдаёт write.
+
+        Данные пишутся во временный файл рядом с основным, который затем атомарно
+        подменяет основной (os.replace): при сбое старый файл остаётся целым.
+        """
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        fd, temp_name = tempfile.mkstemp(prefix=os.path.basename(self.filename) + ".", suffix=".tmp", dir=directory)
+        try:
+            with open(fd, "w", encoding="utf-8", newline="") as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp создаёт файл с правами 0600 — сохраняем права прежнего файла
+            try:
+                mode = stat.S_IMODE(os.stat(self.filename).st_mode)
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(temp_name, mode)
+            os.replace(temp_name, self.filename)
+        except Exception as e:
+            print(f"Ошибка при записи контактов: {e}")
+            try:
+                os.remove(temp_name)
+            except OSError:
+                pass
+            # Индекс мог разойтись с файлом — при следующем обращении перечитаем файл
+            self._index = None
             return False
-        self.write_contacts(updated_contacts)
+        # Основной файл теперь содержит все изменения — журнал больше не нужен
+        try:
+            os.remove(self.journal_filename)
+        except FileNotFoundError:
+            pass
+        self._journal_count = 0
+        self._stamp = self._file_stamp()
         return True
 
+    def load_contacts(self) -> Sequence[Contact]:
+        """Загружает контакты из файла (список в упакованном виде, см. ContactTable)."""
+        if self.cached:
+            return self._get_index().contacts()
+        return self._read_file()
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """
+        Перебирает контакты по одному, не загружая весь файл в память.
+
+        Генератор держит файл открытым, пока перебор не закончен или не закрыт.
+        """
+        if self.cached:
+            yield from self._get_index().contacts()
+        else:
+            yield from self._iter_file()
+
+    def _find_first(self, predicate: Callable[[Contact], bool]) -> Optional[Contact]:
+        """Возвращает первый подходящий контакт, прекращая чтение файла на нём."""
+        contacts = self._iter_file()
+        try:
+            return next((c for c in contacts if predicate(c)), None)
+        finally:
+            contacts.close()
+
+    def write_contacts(self, contacts: Sequence[Contact]) -> None:
+        """Сохраняет контакты в файл."""
+        with self._write_lock():
+            if not self._save(contacts):
+                return
+            if self.cached:
+                self._index = ContactIndex(contacts)
+        self._notify(CHANGE_RELOAD)
+
+    def add_contact(self, name: str, phone: str, email: str, comment: str, unique_phone: bool = False) -> Contact:
+        """
+        Добавляет новый контакт.
+
+        :param unique_phone: не добавлять контакт, если такой номер уже есть (phone_exists);
+                             проверка и запись идут под одной блокировкой записи,
+                             поэтому два окна не добавят один номер одновременно
+        :raises DuplicatePhoneError: если unique_phone и номер уже есть в справочнике
+        """
+        new_contact = make_contact(name, phone, email, comment)
+        with self._write_lock():
+            if unique_phone and self.phone_exists(phone):
+                raise DuplicatePhoneError()
+            if self.cached:
+                index = self._get_index()
+                index.add(new_contact)
+                self._commit(JOURNAL_ADD, new_contact, index.contacts)
+                return new_contact
+            self._commit(JOURNAL_ADD, new_contact, lambda: chain(self._iter_file(), [new_contact]))
+        return new_contact
+
+    def bulk_add_contacts(self, contacts: Iterable[Mapping[str, str]], batch_size: int = 1000) -> Tuple[int, int]:
+        """
+        Добавляет много контактов за один проход.
+
+        Строки читаются из итератора пачками по batch_size и проверяются
+        (is_valid_contact_row). В режиме журнала они дописываются в журнал,
+        каждая пачка — одним вызовом write. Иначе прежние контакты и новые
+        построчно пишутся во временный файл, который подменяет основной,
+        как при любой перезаписи: читатели не видят наполовину импортированный файл.
+
+        :param contacts: итерируемый источник словарей с полями Имя, Телефон, Email, Комментарий
+        :param batch_size: размер пачки для проверки и записи
+        :return: (число добавленных контактов, число отклонённых строк)
+        """
+        with self._write_lock():
+            added, rejected = self._append_contacts(contacts, batch_size)
+        if added:
+            self._notify(CHANGE_RELOAD)
+        return added, rejected
+
+    def _append_contacts(self, contacts: Iterable[Mapping[str, str]], batch_size: int) -> Tuple[int, int]:
+        """Записывает проверенные контакты в файл или журнал (вызывается под блокировкой)."""
+        index = self._get_index() if self.cached else None
+        added = rejected = 0
+
+        def write_batches(f: IO[str]) -> None:
+            nonlocal added, rejected
+            prefix = [JOURNAL_ADD] if self.journaled else []
+            for batch in batched(contacts, batch_size):
+                valid = [
+                    make_contact(row.get("Имя") or "", row.get("Телефон") or "",
+                                 row.get("Email") or "", row.get("Комментарий") or "")
+                    for row in batch if is_valid_contact_row(row)
+                ]
+                rejected += len(batch) - len(valid)
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(prefix + [c[field] for field in FIELDNAMES] for c in valid)
+                f.write(buffer.getvalue())
+                f.flush()
+                if index is not None:
+                    # ID только что созданы и не повторяются — индекс дополняется без проверок
+                    index.extend(valid)
+                added += len(valid)
+
+        if not self.journaled:
+            # Прежние контакты переписываются во временный файл построчно, новые — следом,
+            # и файл подменяется целиком: при сбое посреди импорта основной файл не меняется
+            existing = index.contacts() if index is not None else self._iter_file()
+
+            def write(f: IO[str]) -> None:
+                writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+                writer.writeheader()
+                writer.writerows(existing)
+                write_batches(f)
+
+            if not self._replace_file(write):
+                return 0, rejected
+            return added, rejected
+
+        if self._journal_count is None:
+            self._journal_count = len(self._read_journal())
+        try:
+            with open(self.journal_filename, "a", encoding="utf-8", newline="") as f:
+                write_batches(f)
+        except Exception as e:
+            print(f"Ошибка при импорте контактов: {e}")
+            self._index = None
+            return added, rejected
+        self._stamp = self._file_stamp()
+        self._journal_count += added
+        if self._journal_count >= self.compact_threshold:
+            self.compact()
+        return added, rejected
+
+    def export_contacts(self, stream: IO[str]) -> int:
+        """
+        Построчно выгружает контакты в CSV-поток (тот же формат, что и у основного файла).
+
+        :param stream: текстовый поток, открытый с newline=""
+        :return: число выгруженных контактов
+        """
+        contacts = self._get_index().contacts() if self.cached else self._iter_file()
+        writer = csv.DictWriter(stream, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        count = 0
+        for batch in batched(contacts, 1000):
+            writer.writerows(batch)
+            count += len(batch)
+        return count
+
+    def update_contact(self, updated_contact: Contact, expected_etag: Optional[str] = None) -> bool:
+        """
+        Обновляет контакт по ID.
+
+        :param expected_etag: версия контакта, которую видел пользователь (contact_etag);
+                              если указана и контакт с тех пор изменился — ConcurrentUpdateError
+        :return: True, если контакт найден и обновлён
+        :raises ConcurrentUpdateError: если контакт изменили после чтения
+        """
+        with self._write_lock():
+            if self.cached:
+                index = self._get_index()
+                self._check_etag(index.get(updated_contact["ID"]), expected_etag)
+                found = index.replace(updated_contact)
+                if found:
+                    self._commit(JOURNAL_UPDATE, updated_contact, index.contacts)
+                return found
+            updated = ContactRecord.from_mapping(updated_contact)
+            current = self._find_first(lambda c: c["ID"] == updated.id)
+            self._check_etag(current, expected_etag)
+            if current is None:
+                return False
+            self._commit(
+                JOURNAL_UPDATE, updated,
+                lambda: (updated if c["ID"] == updated.id else c for c in self._iter_file()),
+            )
+            return True
+
+    def delete_contact(self, contact_id: str, expected_etag: Optional[str] = None) -> bool:
+        """
+        Удаляет контакт по ID.
+
+        :param expected_etag: версия контакта, которую видел пользователь (contact_etag);
+                              если указана и контакт с тех пор изменился — ConcurrentUpdateError
+        :return: True, если контакт найден и удалён
+        :raises ConcurrentUpdateError: если контакт изменили после чтения
+        """
+        with self._write_lock():
+            if self.cached:
+                index = self._get_index()
+                self._check_etag(index.get(contact_id), expected_etag)
+                if index.remove(contact_id) is None:
+                    return False
+                self._commit(JOURNAL_DELETE, {"ID": contact_id}, index.contacts)
+                return True
+            current = self._find_first(lambda c: c["ID"] == contact_id)
+            self._check_etag(current, expected_etag)
+            if current is None:
+                return False
+            self._commit(
+                JOURNAL_DELETE, {"ID": contact_id},
+                lambda: (c for c in self._iter_file() if c["ID"] != contact_id),
+            )
+            return True
+
+    @staticmethod
+    def _check_etag(current: Optional[Contact], expected_etag: Optional[str]) -> None:
+        """
+        Проверяет, что контакт не менялся с тех пор, как пользователь его прочитал.
+
+        Удалённый кем-то другим контакт при заданном expected_etag — тоже конфликт.
+        """
+        if expected_etag is None:
+            return
+        if current is None or contact_etag(current) != expected_etag:
+            raise ConcurrentUpdateError()
+
     def find_contact_by_id(self, contact_id: str) -> Optional[Contact]:
         """Находит контакт по ID."""
-        contacts = self.load_contacts()
-        return next((c for c in contacts if c["ID"] == contact_id), None)
+        if self.cached:
+            return self._get_index().get(contact_id)
+        return self._find_first(lambda c: c["ID"] == contact_id)
+
+    def find_contacts_by_phone(self, phone: str) -> List[Contact]:
+        """Находит контакты с тем же номером телефона (формат номера не важен)."""
+        if self.cached:
+            return self._get_index().find_by_phone(phone)
+        key = normalize_phone(phone)
+        if not key:
+            return []
+        return [c for c in self._iter_file() if normalize_phone(c["Телефон"]) == key]
+
+    def find_contacts_by_phone_prefix(self, prefix: str) -> List[Contact]:
+        """Находит контакты, номер телефона которых начинается с prefix."""
+        if self.cached:
+            return self._get_index().find_by_phone_prefix(prefix)
+        keys = tuple(phone_prefix_keys(prefix))
+        if not keys:
+            return []
+        return [c for c in self._iter_file() if normalize_phone(c["Телефон"]).startswith(keys)]
 
-    def search_contacts(self, query: str) -> List[Contact]:
+    def phone_exists(self, phone: str) -> bool:
+        """Проверяет, есть ли уже контакт с таким номером телефона."""
+        if self.cached:
+            return self._get_index().has_phone(phone)
+        key = normalize_phone(phone)
+        return bool(key) and self._find_first(lambda c: normalize_phone(c["Телефон"]) == key) is not None
+
+    def find_contacts_by_email(self, email: str) -> List[Contact]:
+        """Находит контакты с таким email (без учёта регистра)."""
+        if self.cached:
+            return self._get_index().find_by_email(email)
+        email = email.strip().lower()
+        return [c for c in self._iter_file() if c["Email"].lower() == email]
+
+    def search_contacts(self, query: str) -> Sequence[Contact]:
         """Ищет контакты по подстроке."""
-        contacts = self.load_contacts()
+        if self.cached:
+            return self._get_index().search(query)
+        return list(self.iter_search_contacts(query))
+
+    def iter_search_contacts(self, query: str) -> Iterator[Contact]:
+        """Ищет контакты по подстроке, выдавая совпадения по мере чтения файла."""
+        if self.cached:
+            yield from self._get_index().search(query)
+            return
         query = query.lower()
-        return [
-            contact for contact in contacts
+        for contact in self._iter_file():
             if (query in contact["Имя"].lower()
-                or query in contact["Телефон"].lower()
-                or query in contact["Email"].lower()
-                or query in contact["Комментарий"].lower())
+                    or query in contact["Телефон"].lower()
+                    or query in contact["Email"].lower()
+                    or query in contact["Комментарий"].lower()):
+                yield contact
+
+    def filter_contacts(self, name: str = "", phone: str = "", email: str = "", comment: str = "") -> Sequence[Contact]:
+        """Ищет контакты, у которых каждое заполненное поле содержит соответствующую подстроку."""
+        criteria = {"Имя": name, "Телефон": phone, "Email": email, "Комментарий": comment}
+        if self.cached:
+            return self._get_index().filter(criteria)
+        criteria = {field: value.lower() for field, value in criteria.items() if value}
+        return [
+            contact for contact in self._iter_file()
+            if all(value in contact.get(field, "").lower() for field, value in criteria.items())
         ]
 
     def is_valid_phone(self, phone: str) -> bool:
         """Проверяет номер телефона."""
-        return phone.isdigit() and len(phone) >= 10
+        return is_valid_phone(phone)
 
     def is_valid_email(self, email: str) -> bool:
         """Проверяет email."""
-        return "@" in email and "." in email
\ No newline at end of file
+        return is_valid_email(email)
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Модуль компактного списка контактов.
+
+ContactTable хранит каждый контакт одной строкой байт (ContactRecord.pack)
+и распаковывает его в ContactRecord только при обращении. Список из миллиона
+контактов занимает так в несколько раз меньше памяти, чем список записей или словарей.
+Для кода, который с ним работает, это обычная последовательность:
+len(contacts), contacts[0]["Имя"], перебор в цикле и сравнение со списком.
+"""
+
+from collections.abc import Sequence
+from typing import Iterable, Iterator, List, Mapping, Union
+
+from model.contact_record import ContactRecord, PackedContact
+
+
+class ContactTable(Sequence):
+    """
+    Неизменяемый список контактов в упакованном виде.
+
+    :param contacts: контакты (словари или ContactRecord) в нужном порядке
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, contacts: Iterable[Mapping[str, str]] = ()) -> None:
+        self._rows: List[PackedContact] = [ContactRecord.from_mapping(c).pack() for c in contacts]
+
+    @classmethod
+    def from_packed(cls, rows: List[PackedContact]) -> "ContactTable":
+        """Создаёт список из уже упакованных контактов (список не копируется)."""
+        table = cls()
+        table._rows = rows
+        return table
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [ContactRecord.unpack(row) for row in self._rows[index]]
+        return ContactRecord.unpack(self._rows[index])
+
+    def __iter__(self) -> Iterator[ContactRecord]:
+        return map(ContactRecord.unpack, self._rows)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ContactTable):
+            return self._rows == other._rows
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ContactTable({len(self)} контактов)"
@@ -0,0 +1,113 @@
+"""
+Модуль межпроцессной блокировки файла.
+
+FileLock берёт рекомендательную (advisory) эксклюзивную блокировку на отдельном
+файле-замке (<файл>.lock): fcntl.flock в Unix и msvcrt.locking в Windows.
+Блокировку соблюдают только те, кто её запрашивает, — то есть все экземпляры
+ContactStorage, в том числе в разных процессах. Читатели её не берут:
+основной файл заменяется атомарно, и читатель всегда видит его целиком.
+
+Файл-замок не удаляется после снятия блокировки: иначе два процесса могли бы
+одновременно заблокировать два разных файла с одним именем.
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Эксклюзивная блокировка файла-замка, используемая как контекстный менеджер.
+
+    Блокировка реентерабельна в пределах одного объекта: вложенные with не блокируют
+    сами себя, а файл разблокируется при выходе из внешнего with. Потоки одного
+    процесса, использующие один объект, выстраиваются в очередь.
+
+    :param path: путь к файлу-замку
+    :param timeout: сколько секунд ждать блокировку (None — без ограничения)
+    :param poll_interval: пауза между попытками в Windows, где ожидание реализовано опросом
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = None, poll_interval: float = 0.05) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """
+        Берёт блокировку, ожидая, пока её отпустит другой процесс.
+
+        :raises TimeoutError: если блокировку не удалось взять за timeout секунд
+        """
+        if not self._thread_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+            raise TimeoutError(f"Не удалось заблокировать {self.path}")
+        if self._depth:
+            self._depth += 1
+            return
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                self._lock_fd(fd)
+            except BaseException:
+                os.close(fd)
+                raise
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._fd = fd
+        self._depth = 1
+
+    def release(self) -> None:
+        """Отпускает блокировку (файл разблокируется при выходе из внешнего with)."""
+        self._depth -= 1
+        if not self._depth:
+            fd, self._fd = self._fd, None
+            try:
+                self._unlock_fd(fd)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+    def _lock_fd(self, fd: int) -> None:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        if fcntl is not None and deadline is None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            return
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"Не удалось заблокировать {self.path}") from None
+                time.sleep(self.poll_interval)
+
+    @staticmethod
+    def _unlock_fd(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,98 @@
+"""
+Модуль поиска по мере ввода.
+
+IncrementalSearch запоминает критерии и результаты последнего поиска. Если новый запрос
+лишь уточняет предыдущий (каждое поле содержит прежнюю подстроку — пользователь дописал
+символы), подходящие контакты отбираются из прошлых результатов, а не из всего справочника.
+
+Результаты выдаются порциями, а между порциями проверяется, не отменён ли запрос,
+поэтому устаревший поиск прекращается, не дойдя до конца списка.
+"""
+
+from typing import Callable, Dict, Iterator, List, Mapping, Optional
+
+
+Contact = Mapping[str, str]
+Criteria = Dict[str, str]
+
+SEARCH_CRITERIA = ("Имя", "Телефон", "Email", "Комментарий")
+
+
+def _normalize(criteria: Mapping[str, str]) -> Criteria:
+    """Оставляет заполненные поля, приведённые к нижнему регистру (как при поиске в хранилище)."""
+    return {field: value.lower() for field, value in criteria.items() if value}
+
+
+def refines(new: Criteria, old: Criteria) -> bool:
+    """
+    Проверяет, что запрос new сужает запрос old.
+
+    Это так, если каждое заполненное в old поле заполнено и в new и содержит прежнюю подстроку:
+    тогда всякий контакт, подходящий под new, подходит и под old.
+    """
+    return all(field in new and value in new[field] for field, value in old.items())
+
+
+def matches(contact: Contact, criteria: Criteria) -> bool:
+    """Проверяет, что каждое поле критерия содержится в поле контакта (без учёта регистра)."""
+    return all(value in contact.get(field, "").lower() for field, value in criteria.items())
+
+
+class IncrementalSearch:
+    """
+    Поиск контактов с уточнением по прошлым результатам.
+
+    Не потокобезопасен: методы search должны вызываться последовательно
+    (в приложении — в единственном рабочем потоке AsyncStorage).
+
+    :param storage: хранилище с методом filter_contacts(name, phone, email, comment)
+    :param chunk_size: сколько контактов выдавать за одну порцию
+    """
+
+    def __init__(self, storage, chunk_size: int = 2000) -> None:
+        self.storage = storage
+        self.chunk_size = chunk_size
+        self._criteria: Optional[Criteria] = None
+        self._results: List[Contact] = []
+
+    def reset(self) -> None:
+        """Забывает прошлые результаты (например, после изменения контактов)."""
+        self._criteria = None
+        self._results = []
+
+    def search(
+        self, criteria: Mapping[str, str], cancelled: Callable[[], bool] = lambda: False
+    ) -> Iterator[List[Contact]]:
+        """
+        Ищет контакты и выдаёт их порциями по chunk_size.
+
+        Пустой запрос выдаёт все контакты. Результаты запоминаются для следующего уточнения,
+        только если поиск дошёл до конца (не был отменён).
+
+        :param criteria: словарь поле → подстрока (поля из SEARCH_CRITERIA)
+        :param cancelled: функция, возвращающая True, если запрос устарел
+        """
+        criteria = _normalize(criteria)
+        found: List[Contact] = []
+
+        if self._criteria and refines(criteria, self._criteria):
+            # Уточнение: проверяем только прошлые результаты, порциями
+            source = self._results
+            for start in range(0, len(source), self.chunk_size):
+                if cancelled():
+                    return
+                chunk = [c for c in source[start:start + self.chunk_size] if matches(c, criteria)]
+                if chunk:
+                    found.extend(chunk)
+                    yield chunk
+        else:
+            # Новый запрос (или пустой, или стёртые символы) — через индекс хранилища
+            found = self.storage.filter_contacts(*(criteria.get(field, "") for field in SEARCH_CRITERIA))
+            for start in range(0, len(found), self.chunk_size):
+                if cancelled():
+                    return
+                yield found[start:start + self.chunk_size]
+
+        if not cancelled():
+            self._criteria = criteria
+            self._results = found
@@ -0,0 +1,89 @@
+"""
+Модуль индекса номеров строк по целочисленному ключу.
+
+KeyIndex хранит пары (ключ, номер строки) в двух параллельных массивах array,
+отсортированных по ключу: 12 байт на пару вместо словаря со строкой-ключом
+(больше 100 байт на запись). Поиск — двоичный, в том числе по диапазону ключей,
+что нужно для поиска телефона по началу номера.
+
+Ключом служит хеш строки (ID, email) или число, сохраняющее порядок строк (телефон).
+Разные строки могут дать один ключ, поэтому найденные строки проверяются вызывающим кодом.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List
+
+from model.trigram_index import ROW_TYPECODE
+
+
+# Тип ключа: знаковое целое, 8 байт (в него помещается hash() строки)
+KEY_TYPECODE = "q"
+
+
+class KeyIndex:
+    """
+    Отсортированный по ключу массив номеров строк.
+
+    Одиночная вставка — двоичный поиск и сдвиг массива (memmove), это быстро
+    и для миллиона записей. При массовой загрузке (append) пары дописываются в конец,
+    а массив сортируется один раз — при следующем поиске.
+    """
+
+    __slots__ = ("keys", "rows", "_sorted")
+
+    def __init__(self) -> None:
+        self.keys = array(KEY_TYPECODE)
+        self.rows = array(ROW_TYPECODE)
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def append(self, key: int, row: int) -> None:
+        """Дописывает пару без сортировки (массив отсортируется при следующем поиске)."""
+        self.keys.append(key)
+        self.rows.append(row)
+        self._sorted = False
+
+    def add(self, key: int, row: int) -> None:
+        """Вставляет пару, сохраняя порядок."""
+        self.sort()
+        position = bisect_right(self.keys, key)
+        self.keys.insert(position, key)
+        self.rows.insert(position, row)
+
+    def remove(self, key: int, row: int) -> None:
+        """Удаляет пару (если её нет — ничего не делает)."""
+        self.sort()
+        for position in range(bisect_left(self.keys, key), bisect_right(self.keys, key)):
+            if self.rows[position] == row:
+                del self.keys[position]
+                del self.rows[position]
+                return
+
+    def find(self, key: int) -> Iterable[int]:
+        """Возвращает номера строк с ключом key."""
+        return self.find_range(key, key)
+
+    def find_range(self, low: int, high: int) -> Iterable[int]:
+        """Возвращает номера строк с ключом от low до high включительно."""
+        self.sort()
+        return self.rows[bisect_left(self.keys, low):bisect_right(self.keys, high)]
+
+    def repeated_keys(self) -> List[int]:
+        """Возвращает ключи, которые встречаются больше одного раза."""
+        self.sort()
+        keys = self.keys
+        return sorted({key for key, following in zip(keys, keys[1:]) if key == following})
+
+    def sort(self) -> None:
+        """Сортирует пары, дописанные через append (если таких нет — ничего не делает)."""
+        if self._sorted:
+            return
+        keys = self.keys
+        # Сортировка устойчива: строки с одинаковым ключом остаются в порядке добавления
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = array(KEY_TYPECODE, [keys[i] for i in order])
+        self.rows = array(ROW_TYPECODE, [self.rows[i] for i in order])
+        self._sorted = True
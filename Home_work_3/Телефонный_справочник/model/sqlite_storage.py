@@ -0,0 +1,428 @@
+"""
+Модуль хранения контактов в базе SQLite.
+
+Класс SQLiteContactStorage повторяет публичные методы ContactStorage, поэтому
+контроллер может работать с любым из них. В отличие от CSV, база умеет
+частичные обновления, индексированный поиск и одновременное чтение:
+- режим WAL — читатели не блокируются записью;
+- индексы по ID, нормализованному телефону и email;
+- полнотекстовая таблица FTS5 с триграммным токенизатором для поиска по подстроке.
+
+Проверка версии (expected_etag) в update_contact и delete_contact выполняется
+прямо в условии WHERE, поэтому проверка и изменение атомарны.
+
+Запуск как скрипта переносит контакты из CSV-файла в базу:
+    python -m model.sqlite_storage ДЗ2_Контакты.txt contacts.db
+"""
+
+import csv
+import sqlite3
+import sys
+import threading
+from typing import IO, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from model.change_notifier import CHANGE_ADD, CHANGE_DELETE, CHANGE_RELOAD, CHANGE_UPDATE, ChangeNotifierMixin
+from model.contact_record import ConcurrentUpdateError, ContactRecord, DuplicatePhoneError
+from model.contact_storage import FIELDNAMES, ContactStorage, batched, is_valid_contact_row, make_contact
+from model.validators import (
+    is_valid_email,
+    is_valid_phone,
+    normalize_phone,
+    phone_prefix_keys,
+)
+
+
+Contact = Mapping[str, str]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    seq       INTEGER PRIMARY KEY AUTOINCREMENT,
+    id        TEXT NOT NULL UNIQUE,
+    name      TEXT NOT NULL DEFAULT '',
+    phone     TEXT NOT NULL DEFAULT '',
+    phone_key TEXT NOT NULL DEFAULT '',
+    email     TEXT NOT NULL DEFAULT '',
+    comment   TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_contacts_phone_key ON contacts(phone_key);
+CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email COLLATE NOCASE);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+    name, phone, email, comment,
+    content='contacts', content_rowid='seq', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS contacts_ai AFTER INSERT ON contacts BEGIN
+    INSERT INTO contacts_fts(rowid, name, phone, email, comment)
+    VALUES (new.seq, new.name, new.phone, new.email, new.comment);
+END;
+CREATE TRIGGER IF NOT EXISTS contacts_ad AFTER DELETE ON contacts BEGIN
+    INSERT INTO contacts_fts(contacts_fts, rowid, name, phone, email, comment)
+    VALUES ('delete', old.seq, old.name, old.phone, old.email, old.comment);
+END;
+CREATE TRIGGER IF NOT EXISTS contacts_au AFTER UPDATE ON contacts BEGIN
+    INSERT INTO contacts_fts(contacts_fts, rowid, name, phone, email, comment)
+    VALUES ('delete', old.seq, old.name, old.phone, old.email, old.comment);
+    INSERT INTO contacts_fts(rowid, name, phone, email, comment)
+    VALUES (new.seq, new.name, new.phone, new.email, new.comment);
+END;
+"""
+
+# Порядок колонок совпадает с порядком аргументов ContactRecord
+SELECT_COLUMNS = "SELECT id, name, phone, email, comment FROM contacts"
+
+# UPSERT, а не INSERT OR REPLACE: замена строки не вызывает триггер удаления,
+# и полнотекстовый индекс разошёлся бы с таблицей
+INSERT_SQL = (
+    "INSERT INTO contacts (id, name, phone, phone_key, email, comment) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET name = excluded.name, phone = excluded.phone, "
+    "phone_key = excluded.phone_key, email = excluded.email, comment = excluded.comment"
+)
+
+# Вставка, только если контакта с таким нормализованным телефоном нет (пустой номер не проверяется).
+# Проверка и вставка — одно выражение, поэтому между ними не вклинится другая запись.
+# Уникальный индекс по phone_key не подходит: импорт и перенос из CSV допускают повторы номеров.
+INSERT_UNIQUE_PHONE_SQL = (
+    "INSERT INTO contacts (id, name, phone, phone_key, email, comment) "
+    "SELECT ?, ?, ?, ?, ?, ? "
+    "WHERE ? = '' OR NOT EXISTS (SELECT 1 FROM contacts WHERE phone_key = ?)"
+)
+
+# Поля контакта → колонки полнотекстовой таблицы
+FTS_FIELDS = {"Имя": "name", "Телефон": "phone", "Email": "email", "Комментарий": "comment"}
+
+
+def _row_to_contact(row: Tuple[str, ...]) -> ContactRecord:
+    return ContactRecord(*row)
+
+
+def _contact_params(contact: Contact) -> Tuple[str, ...]:
+    phone = contact.get("Телефон", "")
+    return (
+        contact["ID"],
+        contact.get("Имя", ""),
+        phone,
+        normalize_phone(phone),
+        contact.get("Email", ""),
+        contact.get("Комментарий", ""),
+    )
+
+
+def _fts_phrase(text: str) -> str:
+    """Экранирует подстроку как фразу запроса FTS5."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _row_etag(*values: str) -> str:
+    """Версия контакта по значениям колонок id, name, phone, email, comment (для SQL)."""
+    return ContactRecord(*values).etag
+
+
+# Условие «версия строки совпадает с ожидаемой» для WHERE
+ETAG_CONDITION = " AND contact_etag(id, name, phone, email, comment) = ?"
+
+
+class SQLiteContactStorage(ChangeNotifierMixin):
+    """
+    Хранилище контактов в SQLite с тем же интерфейсом, что и ContactStorage.
+
+    Каждый поток получает своё соединение: в режиме WAL читатели работают
+    параллельно с записью. Запросы используют постоянный текст SQL, поэтому
+    sqlite3 переиспользует подготовленные выражения из своего кэша.
+
+    :param filename: путь к файлу базы данных
+    """
+
+    def __init__(self, filename: str = "contacts.db") -> None:
+        self.filename = filename
+        self._local = threading.local()
+        self.fts_enabled = True
+        self._create_schema()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Возвращает соединение текущего потока."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.filename, cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.create_function("py_lower", 1, str.lower, deterministic=True)
+            conn.create_function("contact_etag", 5, _row_etag, deterministic=True)
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self) -> None:
+        conn = self._connection()
+        with conn:
+            conn.executescript(SCHEMA)
+        try:
+            with conn:
+                conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            # Сборка SQLite без FTS5 или без триграммного токенизатора — ищем перебором
+            print(f"Полнотекстовый поиск недоступен: {e}")
+            self.fts_enabled = False
+
+    def close(self) -> None:
+        """Закрывает соединение текущего потока."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def load_contacts(self) -> List[Contact]:
+        """Загружает все контакты в порядке добавления."""
+        rows = self._connection().execute(SELECT_COLUMNS + " ORDER BY seq")
+        return [_row_to_contact(row) for row in rows]
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """Перебирает контакты по одному, читая строки курсором."""
+        for row in self._connection().execute(SELECT_COLUMNS + " ORDER BY seq"):
+            yield _row_to_contact(row)
+
+    def write_contacts(self, contacts: Iterable[Contact]) -> None:
+        """Заменяет все контакты в базе переданным списком."""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM contacts")
+            conn.executemany(INSERT_SQL, (_contact_params(c) for c in contacts))
+        self._notify(CHANGE_RELOAD)
+
+    def add_contact(self, name: str, phone: str, email: str, comment: str, unique_phone: bool = False) -> Contact:
+        """
+        Добавляет новый контакт.
+
+        :param unique_phone: не добавлять контакт, если такой номер уже есть;
+                             проверка выполняется в том же INSERT, что и вставка
+        :raises DuplicatePhoneError: если unique_phone и номер уже есть в базе
+        """
+        new_contact = make_contact(name, phone, email, comment)
+        params = _contact_params(new_contact)
+        conn = self._connection()
+        with conn:
+            if unique_phone:
+                phone_key = params[3]
+                cursor = conn.execute(INSERT_UNIQUE_PHONE_SQL, params + (phone_key, phone_key))
+                if cursor.rowcount <= 0:
+                    raise DuplicatePhoneError()
+            else:
+                conn.execute(INSERT_SQL, params)
+        self._notify(CHANGE_ADD, new_contact)
+        return new_contact
+
+    def bulk_add_contacts(self, contacts: Iterable[Mapping[str, str]], batch_size: int = 1000) -> Tuple[int, int]:
+        """
+        Добавляет много контактов: каждая пачка проверяется и вставляется одной транзакцией.
+
+        :return: (число добавленных контактов, число отклонённых строк)
+        """
+        conn = self._connection()
+        added = rejected = 0
+        for batch in batched(contacts, batch_size):
+            valid = [
+                make_contact(row.get("Имя") or "", row.get("Телефон") or "",
+                             row.get("Email") or "", row.get("Комментарий") or "")
+                for row in batch if is_valid_contact_row(row)
+            ]
+            rejected += len(batch) - len(valid)
+            with conn:
+                conn.executemany(INSERT_SQL, (_contact_params(c) for c in valid))
+            added += len(valid)
+        if added:
+            self._notify(CHANGE_RELOAD)
+        return added, rejected
+
+    def export_contacts(self, stream: IO[str]) -> int:
+        """
+        Построчно выгружает контакты в CSV-поток в формате ContactStorage.
+
+        :return: число выгруженных контактов
+        """
+        cursor = self._connection().execute(SELECT_COLUMNS + " ORDER BY seq")
+        writer = csv.writer(stream)
+        writer.writerow(FIELDNAMES)
+        count = 0
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                return count
+            writer.writerows(rows)
+            count += len(rows)
+
+    def update_contact(self, updated_contact: Contact, expected_etag: Optional[str] = None) -> bool:
+        """
+        Обновляет контакт по ID.
+
+        :param expected_etag: версия контакта, которую видел пользователь (contact_etag)
+        :raises ConcurrentUpdateError: если контакт изменили или удалили после чтения
+        """
+        params = _contact_params(updated_contact)
+        sql = "UPDATE contacts SET name = ?, phone = ?, phone_key = ?, email = ?, comment = ? WHERE id = ?"
+        params = params[1:] + params[:1]
+        if expected_etag is not None:
+            sql += ETAG_CONDITION
+            params += (expected_etag,)
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(sql, params)
+        if cursor.rowcount <= 0:
+            if expected_etag is not None:
+                raise ConcurrentUpdateError()
+            return False
+        self._notify(CHANGE_UPDATE, ContactRecord.from_mapping(updated_contact))
+        return True
+
+    def delete_contact(self, contact_id: str, expected_etag: Optional[str] = None) -> bool:
+        """
+        Удаляет контакт по ID.
+
+        :param expected_etag: версия контакта, которую видел пользователь (contact_etag)
+        :raises ConcurrentUpdateError: если контакт изменили или удалили после чтения
+        """
+        sql = "DELETE FROM contacts WHERE id = ?"
+        params: Tuple[str, ...] = (contact_id,)
+        if expected_etag is not None:
+            sql += ETAG_CONDITION
+            params += (expected_etag,)
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(sql, params)
+        if cursor.rowcount <= 0:
+            if expected_etag is not None:
+                raise ConcurrentUpdateError()
+            return False
+        self._notify(CHANGE_DELETE, ContactRecord(contact_id))
+        return True
+
+    def find_contact_by_id(self, contact_id: str) -> Optional[Contact]:
+        """Находит контакт по ID."""
+        row = self._connection().execute(SELECT_COLUMNS + " WHERE id = ?", (contact_id,)).fetchone()
+        return _row_to_contact(row) if row is not None else None
+
+    def find_contacts_by_phone(self, phone: str) -> List[Contact]:
+        """Находит контакты с тем же номером телефона (формат номера не важен)."""
+        key = normalize_phone(phone)
+        if not key:
+            return []
+        rows = self._connection().execute(SELECT_COLUMNS + " WHERE phone_key = ? ORDER BY seq", (key,))
+        return [_row_to_contact(row) for row in rows]
+
+    def find_contacts_by_phone_prefix(self, prefix: str) -> List[Contact]:
+        """Находит контакты, номер телефона которых начинается с prefix."""
+        keys = phone_prefix_keys(prefix)
+        if not keys:
+            return []
+        # Диапазоны по индексу: ключ >= начало и ключ < начало с увеличенной последней цифрой;
+        # для начала без кода страны их два (см. phone_prefix_keys)
+        ranges = []
+        for key in keys:
+            ranges += [key, key[:-1] + chr(ord(key[-1]) + 1)]
+        condition = " OR ".join(["(phone_key >= ? AND phone_key < ?)"] * len(keys))
+        rows = self._connection().execute(SELECT_COLUMNS + f" WHERE {condition} ORDER BY seq", ranges)
+        return [_row_to_contact(row) for row in rows]
+
+    def phone_exists(self, phone: str) -> bool:
+        """Проверяет, есть ли уже контакт с таким номером телефона."""
+        key = normalize_phone(phone)
+        if not key:
+            return False
+        row = self._connection().execute("SELECT 1 FROM contacts WHERE phone_key = ? LIMIT 1", (key,))
+        return row.fetchone() is not None
+
+    def find_contacts_by_email(self, email: str) -> List[Contact]:
+        """Находит контакты с таким email (без учёта регистра)."""
+        rows = self._connection().execute(
+            SELECT_COLUMNS + " WHERE email = ? COLLATE NOCASE ORDER BY seq", (email.strip(),)
+        )
+        return [_row_to_contact(row) for row in rows]
+
+    def search_contacts(self, query: str) -> List[Contact]:
+        """Ищет контакты по подстроке."""
+        return self._search({field: query for field in FTS_FIELDS}, match_all=False)
+
+    def iter_search_contacts(self, query: str) -> Iterator[Contact]:
+        """Ищет контакты по подстроке, выдавая совпадения по мере чтения курсора."""
+        sql, params = self._search_sql({field: query for field in FTS_FIELDS}, match_all=False)
+        for row in self._connection().execute(sql, params):
+            yield _row_to_contact(row)
+
+    def filter_contacts(self, name: str = "", phone: str = "", email: str = "", comment: str = "") -> List[Contact]:
+        """Ищет контакты, у которых каждое заполненное поле содержит соответствующую подстроку."""
+        criteria = {"Имя": name, "Телефон": phone, "Email": email, "Комментарий": comment}
+        return self._search({field: value for field, value in criteria.items() if value}, match_all=True)
+
+    def _search(self, criteria: Dict[str, str], match_all: bool) -> List[Contact]:
+        """Ищет контакты по подстрокам в полях."""
+        sql, params = self._search_sql(criteria, match_all)
+        return [_row_to_contact(row) for row in self._connection().execute(sql, params)]
+
+    def _search_sql(self, criteria: Dict[str, str], match_all: bool) -> Tuple[str, List[str]]:
+        """
+        Строит запрос поиска по подстрокам в полях.
+
+        Подстроки от трёх символов ищутся через FTS5, остальные — сравнением
+        py_lower(колонка) в SQL, как и в ContactStorage (без учёта регистра).
+        """
+        fts_terms = []
+        conditions = []
+        params: List[str] = []
+        for field, value in criteria.items():
+            column = FTS_FIELDS[field]
+            value = value.lower()
+            if self.fts_enabled and len(value) >= 3:
+                fts_terms.append(f"{column} : {_fts_phrase(value)}")
+            conditions.append(f"instr(py_lower({column}), ?) > 0")
+            params.append(value)
+
+        joiner = " AND " if match_all else " OR "
+        sql = SELECT_COLUMNS
+        where = []
+        if conditions:
+            where.append("(" + joiner.join(conditions) + ")")
+        # FTS сужает кандидатов, только если по каждой ветке условия есть триграммы
+        if fts_terms and (match_all or len(fts_terms) == len(conditions)):
+            where.append("seq IN (SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH ?)")
+            params.append(joiner.join(fts_terms))
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return sql + " ORDER BY seq", params
+
+    def is_valid_phone(self, phone: str) -> bool:
+        """Проверяет номер телефона."""
+        return is_valid_phone(phone)
+
+    def is_valid_email(self, email: str) -> bool:
+        """Проверяет email."""
+        return is_valid_email(email)
+
+
+def migrate_csv_to_sqlite(csv_filename: str, db_filename: str, batch_size: int = 1000) -> int:
+    """
+    Переносит контакты из CSV-файла (вместе с журналом) в базу SQLite.
+
+    Файл читается потоково (iter_contacts) и вставляется пачками по batch_size,
+    как в bulk_add_contacts, поэтому весь справочник не загружается в память.
+    Контакты с уже существующим ID перезаписываются, поэтому повторный запуск безопасен.
+
+    :return: число перенесённых контактов
+    """
+    storage = SQLiteContactStorage(db_filename)
+    conn = storage._connection()
+    count = 0
+    try:
+        for batch in batched(ContactStorage(csv_filename).iter_contacts(), batch_size):
+            with conn:
+                conn.executemany(INSERT_SQL, (_contact_params(c) for c in batch))
+            count += len(batch)
+    finally:
+        storage.close()
+    return count
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "ДЗ2_Контакты.txt"
+    target = sys.argv[2] if len(sys.argv) > 2 else "contacts.db"
+    count = migrate_csv_to_sqlite(source, target)
+    print(f"Перенесено контактов: {count}")
@@ -0,0 +1,30 @@
+"""
+Модуль выбора хранилища контактов по настройкам (model/config.py).
+"""
+
+from typing import Optional, Union
+
+from model import config
+from model.contact_storage import ContactStorage
+from model.sqlite_storage import SQLiteContactStorage
+
+
+Storage = Union[ContactStorage, SQLiteContactStorage]
+
+
+def create_storage(backend: Optional[str] = None, filename: Optional[str] = None) -> Storage:
+    """
+    Создаёт хранилище контактов.
+
+    :param backend: "csv" или "sqlite"; по умолчанию — config.STORAGE_BACKEND
+    :param filename: путь к файлу данных; по умолчанию — из настроек для выбранного бэкенда
+    :raises ValueError: если бэкенд неизвестен
+    """
+    backend = backend or config.STORAGE_BACKEND
+    if backend == config.BACKEND_CSV:
+        # Кэширующий режим: файл читается один раз и перечитывается только при его изменении.
+        # Журнал: сохранение контакта дописывает одну строку, а не переписывает весь файл.
+        return ContactStorage(filename or config.CSV_FILENAME, cached=True, journaled=True)
+    if backend == config.BACKEND_SQLITE:
+        return SQLiteContactStorage(filename or config.SQLITE_FILENAME)
+    raise ValueError(f"Неизвестное хранилище контактов: {backend}")
@@ -0,0 +1,105 @@
+"""
+Модуль триграммного индекса для поиска контактов по подстроке.
+
+Для каждого поля (Имя, Телефон, Email, Комментарий) хранится словарь
+триграмма → номера строк контактов. Подстрока длиной от трёх символов может
+встретиться только в контактах, содержащих все её триграммы, поэтому индекс
+быстро сужает список кандидатов, а точная проверка `in` выполняется только для них.
+
+Номера строк (их выдаёт ContactIndex) хранятся не в множествах, а в отсортированных
+массивах array по 4 байта на номер: множество ID-строк занимает в несколько раз
+больше памяти, а триграммный индекс — самая крупная часть кэша контактов.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Optional, Set
+
+
+Contact = Dict[str, str]
+
+SEARCH_FIELDS = ("Имя", "Телефон", "Email", "Комментарий")
+
+GRAM_SIZE = 3
+
+
+def trigrams(text: str) -> Set[str]:
+    """Возвращает множество триграмм строки (для строк короче трёх символов — пустое)."""
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+# Тип элементов массива: беззнаковое целое, 4 байта
+ROW_TYPECODE = "I"
+
+
+class TrigramIndex:
+    """
+    Триграммный индекс по полям контактов.
+
+    Обновляется инкрементально при добавлении и удалении контакта.
+    Текст индексируется в нижнем регистре, как и в search_contacts.
+    Контакт задаётся номером строки: новые контакты получают номер больше всех
+    прежних, поэтому добавление — это дописывание в конец массива.
+    """
+
+    def __init__(self, fields: Iterable[str] = SEARCH_FIELDS) -> None:
+        self.fields = tuple(fields)
+        self._postings: Dict[str, Dict[str, array]] = {field: {} for field in self.fields}
+
+    def add(self, row: int, contact: Contact) -> None:
+        """Добавляет триграммы контакта с номером строки row в индекс."""
+        for field in self.fields:
+            postings = self._postings[field]
+            for gram in trigrams(contact.get(field, "").lower()):
+                rows = postings.get(gram)
+                if rows is None:
+                    postings[gram] = array(ROW_TYPECODE, (row,))
+                elif rows[-1] < row:
+                    rows.append(row)
+                else:
+                    # Замена контакта на месте: номер строки прежний, вставляем по порядку
+                    position = bisect_left(rows, row)
+                    if position == len(rows) or rows[position] != row:
+                        rows.insert(position, row)
+
+    def remove(self, row: int, contact: Contact) -> None:
+        """Удаляет триграммы контакта с номером строки row из индекса."""
+        for field in self.fields:
+            postings = self._postings[field]
+            for gram in trigrams(contact.get(field, "").lower()):
+                rows = postings.get(gram)
+                if rows is None:
+                    continue
+                position = bisect_left(rows, row)
+                if position < len(rows) and rows[position] == row:
+                    del rows[position]
+                    if not rows:
+                        del postings[gram]
+
+    def candidates(self, field: str, query: str) -> Optional[Set[int]]:
+        """
+        Возвращает номера строк контактов, в поле которых может встретиться подстрока.
+
+        :param field: имя поля
+        :param query: искомая подстрока
+        :return: множество кандидатов или None, если запрос короче триграммы
+                 и индекс не может сузить поиск
+        """
+        grams = trigrams(query.lower())
+        if not grams:
+            return None
+        postings = self._postings[field]
+        lists = []
+        for gram in grams:
+            rows = postings.get(gram)
+            if not rows:
+                return set()
+            lists.append(rows)
+        lists.sort(key=len)
+        # Множество строится только из самого короткого списка, остальные лишь просматриваются
+        result = set(lists[0])
+        for rows in lists[1:]:
+            if not result:
+                break
+            result.intersection_update(rows)
+        return result
@@ -0,0 +1,70 @@
+"""
+Модуль вспомогательных функций для проверки и нормализации данных контактов.
+"""
+
+from typing import List
+
+COUNTRY_CODE = "7"
+
+
+def is_valid_phone(phone: str) -> bool:
+    """Проверяет номер телефона: только цифры, не меньше 10."""
+    return phone.isdigit() and len(phone) >= 10
+
+
+def is_valid_email(email: str) -> bool:
+    """Проверяет email: должен содержать '@' и '.'."""
+    return "@" in email and "." in email
+
+
+def phone_digits(phone: str) -> str:
+    """Оставляет в номере телефона только цифры."""
+    return "".join(ch for ch in phone if ch.isdigit())
+
+
+def normalize_phone(phone: str) -> str:
+    """
+    Приводит номер телефона к единому ключу для поиска и проверки дубликатов.
+
+    Убирает все символы, кроме цифр, и приводит код страны к виду "7":
+    "8 (901) 123-45-67", "+7 901 123 45 67" и "9011234567" дают "79011234567".
+
+    :param phone: номер в произвольном формате
+    :return: нормализованный номер (пустая строка, если цифр нет)
+    """
+    digits = phone_digits(phone)
+    if len(digits) == 11 and digits.startswith("8"):
+        return COUNTRY_CODE + digits[1:]
+    if len(digits) == 10:
+        return COUNTRY_CODE + digits
+    return digits
+
+
+def normalize_phone_prefix(prefix: str) -> str:
+    """
+    Приводит начало номера к виду ключа normalize_phone.
+
+    Длина номера неизвестна, поэтому меняется только ведущая "8" на код страны.
+    """
+    digits = phone_digits(prefix)
+    if digits.startswith("8"):
+        return COUNTRY_CODE + digits[1:]
+    return digits
+
+
+def phone_prefix_keys(prefix: str) -> List[str]:
+    """
+    Возвращает начала ключей normalize_phone, с которых может начинаться номер с этим началом.
+
+    Начало без кода страны ("920123") ищется и как есть, и с кодом страны ("7920123"):
+    десятизначные номера хранятся с кодом страны, а номера другой длины — без изменений.
+
+    :param prefix: начало номера в произвольном формате
+    :return: список начал ключей (пустой, если цифр нет)
+    """
+    key = normalize_phone_prefix(prefix)
+    if not key:
+        return []
+    if key.startswith(COUNTRY_CODE) or phone_digits(prefix).startswith("8"):
+        return [key]
+    return [key, COUNTRY_CODE + key]
@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.async_storage import AsyncStorage
+from model.change_notifier import CHANGE_ADD
+from model.contact_storage import ContactStorage
+
+
+class FakeRoot:
+    """Заменяет Tk: запоминает отложенные вызовы after, а run() выполняет их в текущем потоке."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func):
+        self.pending.append(func)
+
+    def run(self, until, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not until():
+            assert time.monotonic() < deadline, "колбэк не был вызван"
+            if self.pending:
+                self.pending.pop(0)()
+            else:
+                time.sleep(0.01)
+
+
+def _cleanup(name):
+    for path in (name, name + ".journal", name + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_async_storage_delivers_results_in_main_thread():
+    test_file = "test_async.txt"
+    _cleanup(test_file)
+    root = FakeRoot()
+    storage = AsyncStorage(ContactStorage(filename=test_file, cached=True), root)
+    main_thread = threading.get_ident()
+    results, events, errors = [], [], []
+
+    storage.subscribe(lambda event, contact: events.append((event, contact["Имя"], threading.get_ident())))
+    storage.add_contact("Иван", "79001234567", "", "", on_done=lambda c: results.append(c))
+    storage.load_contacts(on_done=lambda contacts: results.append(contacts))
+    storage.run(lambda: 1 / 0, on_error=errors.append)
+    root.run(lambda: len(results) == 2 and errors)
+
+    assert results[0]["Имя"] == "Иван"
+    assert [c["Имя"] for c in results[1]] == ["Иван"]
+    assert events == [(CHANGE_ADD, "Иван", main_thread)]
+    assert isinstance(errors[0], ZeroDivisionError)
+
+    # Опрос останавливается, когда незавершённых задач не осталось
+    assert not root.pending
+    storage.shutdown()
+    _cleanup(test_file)
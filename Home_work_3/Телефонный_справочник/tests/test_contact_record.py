@@ -0,0 +1,37 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_record import ContactRecord
+from model.contact_storage import ContactStorage
+
+
+def test_record_behaves_like_dict():
+    record = ContactRecord("1", "Анна", "79001234567", "anna@test.ru", "")
+    as_dict = {"ID": "1", "Имя": "Анна", "Телефон": "79001234567", "Email": "anna@test.ru", "Комментарий": ""}
+
+    assert record["Имя"] == "Анна"
+    assert record.get("Комментарий", "нет") == ""
+    assert record.get("Возраст") is None
+    assert "ID" in record
+    assert dict(record) == as_dict
+    assert record == as_dict
+    assert ContactRecord.from_mapping(as_dict) == record
+    assert dict(record, Имя="Мария")["Имя"] == "Мария"
+    # Записи без __dict__ — в этом и экономия памяти
+    assert not hasattr(record, "__dict__")
+
+
+def test_storage_reads_columns_by_header():
+    test_file = "test_record_header.txt"
+    # Файл с другим порядком колонок читается так же, как раньше через DictReader
+    with open(test_file, "w", encoding="utf-8", newline="") as f:
+        f.write("Имя,ID,Телефон,Email,Комментарий\r\nАнна,42,79001234567,,Друг\r\n")
+
+    loaded = ContactStorage(filename=test_file).load_contacts()
+    assert loaded[0]["ID"] == "42"
+    assert loaded[0]["Имя"] == "Анна"
+    assert loaded[0]["Комментарий"] == "Друг"
+
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
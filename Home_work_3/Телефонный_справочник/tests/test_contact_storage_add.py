@@ -35,8 +35,9 @@ def test_add_contact_success():
     assert loaded[0]["Имя"] == "Анна"
 
     # Удаляем тестовый файл после теста
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def test_validation_empty_name_or_phone():
@@ -65,8 +66,9 @@ def test_add_empty_contact():
     loaded = storage.load_contacts()
     assert len(loaded) == 1
 
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 
@@ -0,0 +1,110 @@
+import io
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_storage import ContactStorage
+from model.sqlite_storage import SQLiteContactStorage
+
+
+def _cleanup(*files):
+    for name in files:
+        for path in (name, name + ".journal", name + ".lock", name + "-wal", name + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _rows(count):
+    # Генератор: импорт не должен требовать список в памяти
+    for i in range(count):
+        yield {"Имя": f"Контакт {i}", "Телефон": f"7900{i:07d}", "Email": "", "Комментарий": ""}
+    yield {"Имя": "", "Телефон": "79001234567", "Email": "", "Комментарий": ""}
+    yield {"Имя": "Плохой телефон", "Телефон": "123", "Email": "", "Комментарий": ""}
+    yield {"Имя": "Плохой email", "Телефон": "79001234567", "Email": "bad-email", "Комментарий": ""}
+
+
+def test_bulk_add_plain_and_journaled():
+    for options in ({}, {"journaled": True}, {"cached": True, "journaled": True, "compact_threshold": 50}):
+        test_file = "test_bulk.txt"
+        _cleanup(test_file)
+        storage = ContactStorage(filename=test_file, **options)
+        storage.add_contact("Первый", "79990000000", "", "")
+
+        added, rejected = storage.bulk_add_contacts(_rows(120), batch_size=25)
+        assert (added, rejected) == (120, 3)
+
+        loaded = ContactStorage(filename=test_file).load_contacts()
+        assert len(loaded) == 121
+        assert loaded[0]["Имя"] == "Первый"
+        assert loaded[-1]["Имя"] == "Контакт 119"
+        assert len({c["ID"] for c in loaded}) == 121
+        assert len(storage.load_contacts()) == 121
+
+        _cleanup(test_file)
+
+
+def test_export_round_trip():
+    test_file = "test_export.txt"
+    test_db = "test_export.db"
+    _cleanup(test_file, test_db)
+    storage = ContactStorage(filename=test_file, journaled=True)
+    storage.bulk_add_contacts(_rows(10))
+    first = storage.load_contacts()[0]
+    storage.delete_contact(first["ID"])
+
+    stream = io.StringIO(newline="")
+    assert storage.export_contacts(stream) == 9
+
+    # Выгрузка читается как обычный файл справочника
+    with open(test_file + ".export", "w", encoding="utf-8", newline="") as f:
+        f.write(stream.getvalue())
+    exported = ContactStorage(filename=test_file + ".export").load_contacts()
+    assert exported == storage.load_contacts()
+
+    # SQLite-хранилище выгружает тот же формат
+    sqlite_storage = SQLiteContactStorage(filename=test_db)
+    assert sqlite_storage.bulk_add_contacts(exported) == (9, 0)
+    sqlite_stream = io.StringIO(newline="")
+    assert sqlite_storage.export_contacts(sqlite_stream) == 9
+    assert sqlite_stream.getvalue().splitlines()[0] == "ID,Имя,Телефон,Email,Комментарий"
+
+    sqlite_storage.close()
+    _cleanup(test_file, test_file + ".export", test_db)
+
+
+def test_bulk_add_to_file_without_trailing_newline():
+    for options in ({}, {"cached": True}, {"journaled": True}):
+        test_file = "test_bulk_newline.txt"
+        _cleanup(test_file)
+        with open(test_file, "w", encoding="utf-8", newline="") as f:
+            f.write("ID,Имя,Телефон,Email,Комментарий\r\nx1,A,1234567890,,")
+        storage = ContactStorage(filename=test_file, **options)
+
+        assert storage.bulk_add_contacts(_rows(2)) == (2, 3)
+
+        loaded = ContactStorage(filename=test_file).load_contacts()
+        assert [c["Имя"] for c in loaded] == ["A", "Контакт 0", "Контакт 1"]
+        assert loaded[0]["Комментарий"] == ""
+        _cleanup(test_file)
+
+
+def test_failed_bulk_add_leaves_file_unchanged():
+    def broken_rows():
+        yield from _rows(30)
+        raise OSError("источник оборвался")
+
+    for options in ({}, {"cached": True}):
+        test_file = "test_bulk_failed.txt"
+        _cleanup(test_file)
+        storage = ContactStorage(filename=test_file, **options)
+        storage.add_contact("Первый", "79990000000", "", "")
+        with open(test_file, "rb") as f:
+            before = f.read()
+
+        added, _ = storage.bulk_add_contacts(broken_rows(), batch_size=10)
+
+        assert added == 0
+        with open(test_file, "rb") as f:
+            assert f.read() == before
+        assert [c["Имя"] for c in storage.load_contacts()] == ["Первый"]
+        assert not [name for name in os.listdir(".") if name.startswith(test_file + ".") and name.endswith(".tmp")]
+        _cleanup(test_file)
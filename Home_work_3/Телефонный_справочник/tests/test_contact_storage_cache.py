@@ -0,0 +1,135 @@
+import os
+import sys
+import pytest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_index import ContactIndex
+from model.contact_record import ContactRecord
+from model.contact_table import ContactTable
+from model.contact_storage import ContactStorage
+
+
+def test_cached_storage_crud():
+    test_file = "test_cache_crud.txt"
+    storage = ContactStorage(filename=test_file, cached=True)
+
+    anna = storage.add_contact("Анна", "79001234567", "Anna@Example.com", "Друг")
+    storage.add_contact("Борис", "79101112233", "boris@example.com", "")
+
+    # Поиск по ID, телефону и email идёт через индекс
+    assert storage.find_contact_by_id(anna["ID"])["Имя"] == "Анна"
+    assert storage.find_contacts_by_phone("79101112233")[0]["Имя"] == "Борис"
+    assert storage.find_contacts_by_email("anna@example.com")[0]["Имя"] == "Анна"
+
+    updated = dict(anna, Телефон="79005554433")
+    assert storage.update_contact(updated) == True
+    assert storage.find_contacts_by_phone("79001234567") == []
+    assert storage.find_contacts_by_phone("79005554433")[0]["ID"] == anna["ID"]
+
+    assert storage.delete_contact(anna["ID"]) == True
+    assert storage.find_contact_by_id(anna["ID"]) is None
+
+    # Файл на диске совпадает с содержимым кэша
+    loaded = ContactStorage(filename=test_file).load_contacts()
+    assert [c["Имя"] for c in loaded] == ["Борис"]
+
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_cache_invalidated_on_external_change():
+    test_file = "test_cache_external.txt"
+    cached = ContactStorage(filename=test_file, cached=True)
+    cached.add_contact("Анна", "79001234567", "", "")
+    assert len(cached.load_contacts()) == 1
+
+    # Файл меняет другой экземпляр хранилища (например, окно редактирования)
+    other = ContactStorage(filename=test_file)
+    other.add_contact("Борис", "79101112233", "", "")
+
+    names = [c["Имя"] for c in cached.load_contacts()]
+    assert names == ["Анна", "Борис"]
+
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_cached_results_cannot_corrupt_cache():
+    test_file = "test_cache_copies.txt"
+    storage = ContactStorage(filename=test_file, cached=True)
+    contact = storage.add_contact("Анна", "79001234567", "", "")
+
+    # Записи из кэша неизменяемы: изменить их можно только через update_contact
+    found = storage.find_contact_by_id(contact["ID"])
+    with pytest.raises(TypeError):
+        found["Имя"] = "Испорчено"
+    assert storage.find_contact_by_id(contact["ID"])["Имя"] == "Анна"
+
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_index_shared_phone_and_email():
+    index = ContactIndex([
+        {"ID": "1", "Имя": "Анна", "Телефон": "79001234567", "Email": "home@example.com"},
+        {"ID": "2", "Имя": "Борис", "Телефон": "89001234567", "Email": "HOME@example.com"},
+        {"ID": "3", "Имя": "Вера", "Телефон": "79101112233", "Email": ""},
+    ])
+    assert [c["ID"] for c in index.find_by_phone("79101112233")] == ["3"]
+    assert [c["ID"] for c in index.find_by_phone("79001234567")] == ["1", "2"]
+    assert [c["ID"] for c in index.find_by_email("home@example.com")] == ["1", "2"]
+    assert index.find_by_email("") == []
+
+    index.remove("1")
+    assert [c["ID"] for c in index.find_by_phone("79001234567")] == ["2"]
+    assert [c["ID"] for c in index.find_by_email("home@example.com")] == ["2"]
+    index.remove("2")
+    assert index.find_by_phone("79001234567") == []
+    assert not index.has_phone("79001234567")
+    assert index.find_by_email("home@example.com") == []
+    assert len(index) == 1
+
+
+def test_index_duplicate_ids_and_compaction():
+    # Повтор ID в файле: остаётся последний контакт
+    index = ContactIndex([
+        {"ID": "1", "Имя": "Старая", "Телефон": "79001234567"},
+        {"ID": "2", "Имя": "Борис", "Телефон": "79101112233"},
+        {"ID": "1", "Имя": "Новая", "Телефон": "79205556677"},
+    ])
+    assert [c["Имя"] for c in index.contacts()] == ["Борис", "Новая"]
+    assert index.find_by_phone("79001234567") == []
+    assert index.get("1")["Имя"] == "Новая"
+
+    # Удалённые строки не копятся: индекс перестраивается, поиск работает как прежде
+    index = ContactIndex(
+        {"ID": str(i), "Имя": f"Контакт {i}", "Телефон": f"7900{i:07d}", "Email": f"u{i}@example.com"}
+        for i in range(3000)
+    )
+    for i in range(2500):
+        index.remove(str(i))
+    assert len(index._rows) < 3000
+    assert len(index) == 500
+    assert index.get("2999")["Имя"] == "Контакт 2999"
+    assert index.get("0") is None
+    assert [c["ID"] for c in index.find_by_phone_prefix("790000029")] == [str(i) for i in range(2900, 3000)]
+    assert [c["ID"] for c in index.find_by_email("U2600@example.com")] == ["2600"]
+    assert [c["ID"] for c in index.search("контакт 2501")] == ["2501"]
+    index.add({"ID": "новый", "Имя": "Новый", "Телефон": "79990000000"})
+    assert index.contacts()[-1]["ID"] == "новый"
+
+
+def test_contact_table_packs_records():
+    contacts = [
+        {"ID": "1", "Имя": "Анна", "Телефон": "79001234567", "Email": "", "Комментарий": "коллега"},
+        # NUL в поле не ломает упаковку: такая запись хранится как есть
+        {"ID": "2", "Имя": "Борис\x00", "Телефон": "79101112233", "Email": "", "Комментарий": ""},
+    ]
+    table = ContactTable(contacts)
+    assert len(table) == 2
+    assert table == contacts
+    assert table[-1]["Имя"] == "Борис\x00"
+    assert [c["ID"] for c in table[:1]] == ["1"]
+    assert ContactRecord.unpack(ContactRecord.from_mapping(contacts[0]).pack()) == contacts[0]
@@ -0,0 +1,161 @@
+import os
+import sys
+import threading
+import pytest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_record import ConcurrentUpdateError, DuplicatePhoneError
+from model.contact_record import contact_etag
+from model.contact_storage import ContactStorage
+from model.file_lock import FileLock
+from model.sqlite_storage import SQLiteContactStorage
+
+
+def _cleanup(*files):
+    for name in files:
+        for path in (name, name + ".journal", name + ".lock", name + "-wal", name + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def test_file_lock_is_exclusive_and_reentrant():
+    path = "test_lock.txt.lock"
+    _cleanup("test_lock.txt")
+    first = FileLock(path)
+    second = FileLock(path, timeout=0.1, poll_interval=0.01)
+    with first:
+        with first:
+            pass
+        # Внешний with ещё держит блокировку
+        with pytest.raises(TimeoutError):
+            second.acquire()
+    with second:
+        pass
+    _cleanup("test_lock.txt")
+
+
+def test_two_instances_do_not_lose_each_others_changes():
+    for options in ({}, {"cached": True}, {"cached": True, "journaled": True}):
+        test_file = "test_concurrent.txt"
+        _cleanup(test_file)
+        first = ContactStorage(filename=test_file, **options)
+        second = ContactStorage(filename=test_file, **options)
+        ivan = first.add_contact("Иван", "79001234567", "", "")
+        # Второй экземпляр успел загрузить данные до того, как первый добавил контакт
+        second.load_contacts()
+        petr = first.add_contact("Пётр", "79007654321", "", "")
+        anna = second.add_contact("Анна", "79001111111", "", "")
+
+        names = sorted(c["Имя"] for c in ContactStorage(filename=test_file).load_contacts())
+        assert names == ["Анна", "Иван", "Пётр"], options
+        assert {c["ID"] for c in first.load_contacts()} == {ivan["ID"], petr["ID"], anna["ID"]}
+        _cleanup(test_file)
+
+
+def test_update_with_stale_etag_is_rejected():
+    for options in ({}, {"cached": True}, {"cached": True, "journaled": True}):
+        test_file = "test_concurrent_etag.txt"
+        _cleanup(test_file)
+        first = ContactStorage(filename=test_file, **options)
+        second = ContactStorage(filename=test_file, **options)
+        contact = first.add_contact("Иван", "79001234567", "", "")
+        seen = second.find_contact_by_id(contact["ID"])
+        assert seen.etag == contact_etag(contact)
+
+        assert first.update_contact(dict(contact, Имя="Иван Петров"), expected_etag=contact.etag)
+        # Второй экземпляр правит устаревшую версию — изменение первого не затирается
+        with pytest.raises(ConcurrentUpdateError):
+            second.update_contact(dict(seen, Комментарий="друг"), expected_etag=seen.etag)
+        with pytest.raises(ConcurrentUpdateError):
+            second.delete_contact(contact["ID"], expected_etag=seen.etag)
+        assert first.find_contact_by_id(contact["ID"])["Имя"] == "Иван Петров"
+
+        fresh = second.find_contact_by_id(contact["ID"])
+        assert second.delete_contact(contact["ID"], expected_etag=fresh.etag)
+        with pytest.raises(ConcurrentUpdateError):
+            first.update_contact(dict(fresh, Имя="Снова"), expected_etag=fresh.etag)
+        # Без etag поведение прежнее: несуществующий контакт просто не найден
+        assert not first.update_contact(dict(fresh, Имя="Снова"))
+        _cleanup(test_file)
+
+
+def _add_same_phone_concurrently(storages):
+    """Каждое хранилище в своём потоке добавляет контакт с одним номером в разных форматах."""
+    phones = ["89001234567", "+7 900 123-45-67", "9001234567", "7 (900) 123 45 67"]
+    added, duplicates = [], []
+    start = threading.Barrier(len(storages))
+
+    def add(storage, phone):
+        start.wait()
+        try:
+            added.append(storage.add_contact("Иван", phone, "", "", unique_phone=True))
+        except DuplicatePhoneError:
+            duplicates.append(phone)
+        finally:
+            if isinstance(storage, SQLiteContactStorage):
+                storage.close()
+
+    threads = [threading.Thread(target=add, args=pair) for pair in zip(storages, phones)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return added, duplicates
+
+
+def test_add_with_unique_phone_is_atomic():
+    for options in ({}, {"cached": True}, {"cached": True, "journaled": True}):
+        test_file = "test_concurrent_unique.txt"
+        _cleanup(test_file)
+        storages = [ContactStorage(filename=test_file, **options) for _ in range(4)]
+        for storage in storages:
+            storage.load_contacts()
+
+        added, duplicates = _add_same_phone_concurrently(storages)
+        assert len(added) == 1 and len(duplicates) == 3, options
+        assert [c["ID"] for c in ContactStorage(filename=test_file).load_contacts()] == [added[0]["ID"]]
+        # Без флага повтор номера по-прежнему разрешён
+        storages[0].add_contact("Иван-2", "89001234567", "", "")
+        assert len(storages[0].find_contacts_by_phone("89001234567")) == 2
+        _cleanup(test_file)
+
+
+def test_sqlite_add_with_unique_phone_is_atomic():
+    test_file = "test_concurrent_unique.db"
+    _cleanup(test_file)
+    storage = SQLiteContactStorage(filename=test_file)
+    added, duplicates = _add_same_phone_concurrently([storage] * 4)
+    assert len(added) == 1 and len(duplicates) == 3
+    assert [c["ID"] for c in storage.load_contacts()] == [added[0]["ID"]]
+    # Пустой номер не считается дубликатом
+    storage.add_contact("Без номера", "", "", "", unique_phone=True)
+    storage.add_contact("Тоже без номера", "", "", "", unique_phone=True)
+    assert len(storage.load_contacts()) == 3
+    storage.close()
+    _cleanup(test_file)
+
+
+def test_full_write_is_atomic_and_leaves_no_temp_files():
+    test_file = "test_concurrent_atomic.txt"
+    _cleanup(test_file)
+    storage = ContactStorage(filename=test_file)
+    storage.write_contacts([{"ID": "1", "Имя": "Иван", "Телефон": "79001234567", "Email": "", "Комментарий": ""}])
+    storage.add_contact("Пётр", "79007654321", "", "")
+    assert [c["Имя"] for c in storage.load_contacts()] == ["Иван", "Пётр"]
+    assert not [name for name in os.listdir(".") if name.startswith(test_file) and name.endswith(".tmp")]
+    _cleanup(test_file)
+
+
+def test_sqlite_update_with_stale_etag_is_rejected():
+    test_file = "test_concurrent.db"
+    _cleanup(test_file)
+    storage = SQLiteContactStorage(filename=test_file)
+    contact = storage.add_contact("Иван", "79001234567", "", "")
+    assert storage.update_contact(dict(contact, Имя="Иван Петров"), expected_etag=contact.etag)
+    with pytest.raises(ConcurrentUpdateError):
+        storage.update_contact(dict(contact, Комментарий="друг"), expected_etag=contact.etag)
+    with pytest.raises(ConcurrentUpdateError):
+        storage.delete_contact(contact["ID"], expected_etag=contact.etag)
+    current = storage.find_contact_by_id(contact["ID"])
+    assert storage.delete_contact(contact["ID"], expected_etag=current.etag)
+    storage.close()
+    _cleanup(test_file)
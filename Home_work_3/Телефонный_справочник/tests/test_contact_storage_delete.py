@@ -20,8 +20,9 @@ def test_delete_contact_success():
     assert len(contacts) == 0
 
     # Удалим временный файл
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def test_delete_contact_with_invalid_id():
@@ -41,5 +42,6 @@ def test_delete_contact_with_invalid_id():
     assert len(contacts) == 1
     assert contacts[0]["Имя"] == "Борис"
 
-    if os.path.exists(test_file):
-        os.remove(test_file)
\ No newline at end of file
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
\ No newline at end of file
@@ -30,8 +30,9 @@ def test_update_contact_success():
     assert loaded[0]["Телефон"] == "79104445566"
 
     # Удаляем файл
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def test_update_nonexistent_contact():
@@ -58,8 +59,9 @@ def test_update_nonexistent_contact():
     assert len(loaded) == 1
     assert loaded[0]["Имя"] == "Анна"
 
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 def test_validation_during_edit():
     storage = ContactStorage()
@@ -103,5 +105,6 @@ def test_partial_update():
     assert loaded[0]["Комментарий"] == "Новый коммент"
     assert loaded[0]["Имя"] == "Иван"  # остальное не изменилось
 
-    if os.path.exists(test_file):
-        os.remove(test_file)
\ No newline at end of file
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
\ No newline at end of file
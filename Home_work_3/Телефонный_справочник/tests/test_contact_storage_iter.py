@@ -0,0 +1,48 @@
+import os
+import sys
+import types
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_storage import ContactStorage
+
+
+def _cleanup(test_file):
+    for path in (test_file, test_file + ".journal", test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_iter_contacts_is_lazy():
+    test_file = "test_iter.txt"
+    _cleanup(test_file)
+    storage = ContactStorage(filename=test_file, journaled=True)
+    anna = storage.add_contact("Анна", "79001234567", "", "")
+    storage.add_contact("Борис", "79101112233", "", "")
+    storage.update_contact(dict(anna, Комментарий="Друг"))
+
+    contacts = storage.iter_contacts()
+    assert isinstance(contacts, types.GeneratorType)
+    first = next(contacts)
+    assert first["Имя"] == "Анна"
+    assert first["Комментарий"] == "Друг"
+    contacts.close()
+
+    assert [c["Имя"] for c in storage.iter_contacts()] == ["Анна", "Борис"]
+    _cleanup(test_file)
+
+
+def test_streaming_find_and_search():
+    test_file = "test_iter_find.txt"
+    _cleanup(test_file)
+    storage = ContactStorage(filename=test_file)
+    anna = storage.add_contact("Анна Петрова", "79001112233", "anna@test.ru", "Друг")
+    boris = storage.add_contact("Борис Сидоров", "79104445566", "boris@work.com", "Коллега")
+
+    assert storage.find_contact_by_id(boris["ID"])["Имя"] == "Борис Сидоров"
+    assert storage.find_contact_by_id("несуществующий-id") is None
+
+    results = storage.iter_search_contacts("петров")
+    assert isinstance(results, types.GeneratorType)
+    assert [c["ID"] for c in results] == [anna["ID"]]
+    assert list(storage.iter_search_contacts("нет такого")) == []
+
+    _cleanup(test_file)
@@ -0,0 +1,69 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_storage import ContactStorage
+
+
+def _cleanup(test_file):
+    for path in (test_file, test_file + ".journal", test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_journal_replayed_on_load():
+    test_file = "test_journal.txt"
+    _cleanup(test_file)
+    storage = ContactStorage(filename=test_file, journaled=True)
+
+    anna = storage.add_contact("Анна", "79001234567", "", "")
+    boris = storage.add_contact("Борис", "79101112233", "", "")
+    storage.update_contact(dict(anna, Комментарий="Друг"))
+    storage.delete_contact(boris["ID"])
+
+    # Основной файл не переписывался — все изменения лежат в журнале
+    assert not os.path.exists(test_file)
+    assert os.path.exists(test_file + ".journal")
+
+    # Обычное хранилище прозрачно применяет журнал
+    loaded = ContactStorage(filename=test_file).load_contacts()
+    assert len(loaded) == 1
+    assert loaded[0]["Имя"] == "Анна"
+    assert loaded[0]["Комментарий"] == "Друг"
+
+    _cleanup(test_file)
+
+
+def test_journal_compaction_by_threshold():
+    test_file = "test_journal_compact.txt"
+    _cleanup(test_file)
+    storage = ContactStorage(filename=test_file, journaled=True, compact_threshold=3)
+
+    storage.add_contact("Анна", "79001234567", "", "")
+    storage.add_contact("Борис", "79101112233", "", "")
+    assert os.path.exists(test_file + ".journal")
+
+    # Третья запись достигает порога — журнал сворачивается в CSV
+    storage.add_contact("Вера", "79201112233", "", "")
+    assert not os.path.exists(test_file + ".journal")
+
+    loaded = ContactStorage(filename=test_file).load_contacts()
+    assert [c["Имя"] for c in loaded] == ["Анна", "Борис", "Вера"]
+
+    _cleanup(test_file)
+
+
+def test_full_write_clears_journal():
+    test_file = "test_journal_full_write.txt"
+    _cleanup(test_file)
+    journaled = ContactStorage(filename=test_file, journaled=True, cached=True)
+    anna = journaled.add_contact("Анна", "79001234567", "", "")
+
+    # Обычное хранилище переписывает файл целиком и удаляет журнал
+    plain = ContactStorage(filename=test_file)
+    plain.update_contact(dict(anna, Имя="Анна Петрова"))
+    assert not os.path.exists(test_file + ".journal")
+
+    # Кэш журналируемого хранилища видит изменение
+    assert journaled.find_contact_by_id(anna["ID"])["Имя"] == "Анна Петрова"
+
+    _cleanup(test_file)
@@ -0,0 +1,55 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.change_notifier import CHANGE_ADD, CHANGE_DELETE, CHANGE_RELOAD, CHANGE_UPDATE
+from model.contact_storage import ContactStorage
+from model.sqlite_storage import SQLiteContactStorage
+
+
+def _cleanup(*files):
+    for name in files:
+        for path in (name, name + ".journal", name + ".lock", name + "-wal", name + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _check_notifications(storage):
+    events = []
+
+    def listener(event, contact):
+        events.append((event, contact["ID"] if contact else None, contact["Имя"] if contact else None))
+
+    storage.subscribe(listener)
+    contact = storage.add_contact("Иван", "79001234567", "", "")
+    storage.update_contact(dict(contact, Имя="Иван Петров"))
+    storage.update_contact({"ID": "нет-такого", "Имя": "X", "Телефон": "79000000000", "Email": "", "Комментарий": ""})
+    storage.delete_contact(contact["ID"])
+    storage.delete_contact("нет-такого")
+    storage.bulk_add_contacts([{"Имя": "Пётр", "Телефон": "79007654321", "Email": "", "Комментарий": ""}])
+    storage.write_contacts([])
+
+    storage.unsubscribe(listener)
+    storage.add_contact("Анна", "79001111111", "", "")
+
+    assert [e[0] for e in events] == [CHANGE_ADD, CHANGE_UPDATE, CHANGE_DELETE, CHANGE_RELOAD, CHANGE_RELOAD]
+    assert events[0][1:] == (contact["ID"], "Иван")
+    assert events[1][1:] == (contact["ID"], "Иван Петров")
+    assert events[2][1] == contact["ID"]
+    assert events[3][1] is None
+
+
+def test_csv_storage_notifies_subscribers():
+    for options in ({}, {"cached": True}, {"cached": True, "journaled": True}):
+        test_file = "test_notify.txt"
+        _cleanup(test_file)
+        _check_notifications(ContactStorage(filename=test_file, **options))
+        _cleanup(test_file)
+
+
+def test_sqlite_storage_notifies_subscribers():
+    test_file = "test_notify.db"
+    _cleanup(test_file)
+    storage = SQLiteContactStorage(filename=test_file)
+    _check_notifications(storage)
+    storage.close()
+    _cleanup(test_file)
@@ -0,0 +1,80 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_storage import ContactStorage
+from model.sqlite_storage import SQLiteContactStorage
+from model.validators import normalize_phone, normalize_phone_prefix, phone_prefix_keys
+
+
+def test_normalize_phone():
+    assert normalize_phone("8 (901) 123-45-67") == "79011234567"
+    assert normalize_phone("+7 901 123 45 67") == "79011234567"
+    assert normalize_phone("9011234567") == "79011234567"
+    assert normalize_phone("") == ""
+    assert normalize_phone_prefix("8920") == "7920"
+    assert phone_prefix_keys("920") == ["920", "7920"]
+    assert phone_prefix_keys("+7 920") == ["7920"]
+    assert phone_prefix_keys("") == []
+
+
+def test_phone_lookup_cached_and_plain():
+    test_file = "test_phone_index.txt"
+    cached = ContactStorage(filename=test_file, cached=True)
+
+    cached.add_contact("Мария", "89201234567", "", "")
+    cached.add_contact("Иван", "+7 930 987-65-43", "", "")
+    cached.add_contact("Ольга", "79209998877", "", "")
+
+    plain = ContactStorage(filename=test_file)
+    for storage in (cached, plain):
+        # Точный поиск не зависит от формата номера
+        assert [c["Имя"] for c in storage.find_contacts_by_phone("+79201234567")] == ["Мария"]
+        # Поиск по началу номера
+        assert [c["Имя"] for c in storage.find_contacts_by_phone_prefix("8920")] == ["Мария", "Ольга"]
+        assert [c["Имя"] for c in storage.find_contacts_by_phone_prefix("7930")] == ["Иван"]
+        # Начало номера без кода страны
+        assert [c["Имя"] for c in storage.find_contacts_by_phone_prefix("920123")] == ["Мария"]
+        assert [c["Имя"] for c in storage.find_contacts_by_phone_prefix("(930) 98")] == ["Иван"]
+        assert storage.find_contacts_by_phone_prefix("7999") == []
+        assert storage.phone_exists("8 930 987 65 43") == True
+        assert storage.phone_exists("79000000000") == False
+
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_phone_index_follows_updates():
+    test_file = "test_phone_update.txt"
+    storage = ContactStorage(filename=test_file, cached=True)
+
+    maria = storage.add_contact("Мария", "89201234567", "", "")
+    storage.update_contact(dict(maria, Телефон="79305554433"))
+    assert storage.phone_exists("89201234567") == False
+    assert storage.find_contacts_by_phone_prefix("7930")[0]["Имя"] == "Мария"
+
+    storage.delete_contact(maria["ID"])
+    assert storage.find_contacts_by_phone_prefix("7") == []
+
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_phone_prefix_without_country_code_sqlite():
+    test_db = "test_phone_prefix.db"
+    storage = SQLiteContactStorage(filename=test_db)
+
+    storage.add_contact("Мария", "89201234567", "", "")
+    storage.add_contact("Иван", "+7 930 987-65-43", "", "")
+    storage.add_contact("Ольга", "79209998877", "", "")
+
+    assert [c["Имя"] for c in storage.find_contacts_by_phone_prefix("920123")] == ["Мария"]
+    assert [c["Имя"] for c in storage.find_contacts_by_phone_prefix("920")] == ["Мария", "Ольга"]
+    assert [c["Имя"] for c in storage.find_contacts_by_phone_prefix("8920")] == ["Мария", "Ольга"]
+    assert storage.find_contacts_by_phone_prefix("999") == []
+
+    storage.close()
+    for path in (test_db, test_db + "-wal", test_db + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
@@ -18,8 +18,9 @@ def test_search_by_name():
     assert results[0]["Имя"] == "Анна Петрова"
 
     # Удаляем тестовый файл
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def test_search_by_phone():
@@ -35,8 +36,9 @@ def test_search_by_phone():
     assert results[0]["Имя"] == "Мария"
 
     # Удаляем файл
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def test_general_search():
@@ -55,8 +57,9 @@ def test_general_search():
     assert len(results2) == 1
     assert results2[0]["Имя"] == "Ольга"
 
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 def test_search_nonexistent_contact():
@@ -74,5 +77,6 @@ def test_search_nonexistent_contact():
     results2 = storage.search_contacts("0000000000")
     assert len(results2) == 0
 
-    if os.path.exists(test_file):
-        os.remove(test_file)
\ No newline at end of file
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
\ No newline at end of file
@@ -0,0 +1,80 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_storage import ContactStorage
+from model.trigram_index import TrigramIndex, trigrams
+
+
+def test_trigram_candidates():
+    index = TrigramIndex()
+    index.add(1, {"Имя": "Анна Петрова", "Телефон": "79001112233", "Email": "", "Комментарий": ""})
+    index.add(2, {"Имя": "Пётр", "Телефон": "79104445566", "Email": "", "Комментарий": ""})
+
+    assert trigrams("абвг") == {"абв", "бвг"}
+    assert index.candidates("Имя", "петр") == {1}
+    assert index.candidates("Телефон", "9104") == {2}
+    assert index.candidates("Имя", "xyz") == set()
+    # Запрос короче триграммы индекс сузить не может
+    assert index.candidates("Имя", "Ан") is None
+
+    index.remove(1, {"Имя": "Анна Петрова", "Телефон": "79001112233", "Email": "", "Комментарий": ""})
+    assert index.candidates("Имя", "петр") == set()
+
+
+def test_trigram_postings_keep_row_order():
+    index = TrigramIndex()
+    index.add(5, {"Имя": "Анна"})
+    index.add(9, {"Имя": "Жанна"})
+    # Замена контакта на месте: номер строки меньше последнего
+    index.remove(5, {"Имя": "Анна"})
+    index.add(5, {"Имя": "Анна Иванова"})
+    index.add(7, {"Имя": "Нина Анненкова"})
+    assert index.candidates("Имя", "анн") == {5, 7, 9}
+    assert list(index._postings["Имя"]["анн"]) == [5, 7, 9]
+    assert index.candidates("Имя", "ива") == {5}
+
+
+def test_cached_search_matches_plain_search():
+    test_file = "test_trigram_search.txt"
+    storage = ContactStorage(filename=test_file, cached=True)
+
+    storage.add_contact("Анна Петрова", "79001112233", "anna@test.ru", "Друг")
+    boris = storage.add_contact("Борис Сидоров", "79104445566", "boris@work.com", "Коллега")
+    storage.add_contact("Ольга", "79501112233", "olga@company.org", "HR-менеджер")
+
+    plain = ContactStorage(filename=test_file)
+    for query in ("анна", "1112233", "company", "МЕНЕДЖЕР", "ол", "", "нет такого"):
+        assert storage.search_contacts(query) == plain.search_contacts(query)
+
+    # Индекс обновляется при изменении и удалении
+    storage.update_contact(dict(boris, Комментарий="Сосед"))
+    assert storage.search_contacts("коллега") == []
+    assert storage.search_contacts("сосед")[0]["Имя"] == "Борис Сидоров"
+    storage.delete_contact(boris["ID"])
+    assert storage.search_contacts("сидоров") == []
+
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_filter_contacts_by_fields():
+    test_file = "test_trigram_filter.txt"
+    storage = ContactStorage(filename=test_file, cached=True)
+
+    storage.add_contact("Анна Петрова", "79001112233", "anna@test.ru", "Друг")
+    storage.add_contact("Анна Сидорова", "79104445566", "anna@work.com", "Коллега")
+
+    results = storage.filter_contacts(name="анна", email="work")
+    assert [c["Имя"] for c in results] == ["Анна Сидорова"]
+
+    # Короткие значения проверяются напрямую, без индекса
+    results = storage.filter_contacts(name="ан", phone="79")
+    assert len(results) == 2
+
+    plain = ContactStorage(filename=test_file)
+    assert plain.filter_contacts(name="анна", email="work") == storage.filter_contacts(name="анна", email="work")
+
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
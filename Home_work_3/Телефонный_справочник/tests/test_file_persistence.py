@@ -7,8 +7,9 @@ def test_file_creation_and_persistence():
     test_file = "test_persistence.txt"
 
     # Убедимся, что файла нет
-    if os.path.exists(test_file):
-        os.remove(test_file)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
     # Создаём хранилище — файл ещё не создан
     storage = ContactStorage(filename=test_file)
@@ -32,5 +33,6 @@ def test_file_creation_and_persistence():
     assert loaded[0]["Email"] == "ivan@test.com"
 
     # Удаляем файл после теста
-    if os.path.exists(test_file):
-        os.remove(test_file)
\ No newline at end of file
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
\ No newline at end of file
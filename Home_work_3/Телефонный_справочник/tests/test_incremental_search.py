@@ -0,0 +1,82 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_storage import ContactStorage
+from model.incremental_search import IncrementalSearch, refines
+
+
+class CountingStorage:
+    """Обёртка над хранилищем, считающая обращения к filter_contacts."""
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.calls = 0
+
+    def filter_contacts(self, *args):
+        self.calls += 1
+        return self.storage.filter_contacts(*args)
+
+
+def _storage(test_file):
+    for path in (test_file, test_file + ".journal", test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+    storage = ContactStorage(filename=test_file, cached=True)
+    storage.write_contacts([
+        {"ID": str(i), "Имя": name, "Телефон": f"7900{i:07d}", "Email": "", "Комментарий": ""}
+        for i, name in enumerate(["Иван", "Ивана", "Иванов", "Пётр", "Ирина"] * 20)
+    ])
+    return storage
+
+
+def _names(chunks):
+    return [contact["Имя"] for chunk in chunks for contact in chunk]
+
+
+def test_refines():
+    assert refines({"Имя": "иван"}, {"Имя": "ив"})
+    assert refines({"Имя": "иван", "Email": "a"}, {"Имя": "ва"})
+    assert not refines({"Имя": "и"}, {"Имя": "ив"})
+    assert not refines({"Email": "ив"}, {"Имя": "ив"})
+
+
+def test_refined_query_filters_previous_results_in_chunks():
+    test_file = "test_incremental.txt"
+    storage = CountingStorage(_storage(test_file))
+    search = IncrementalSearch(storage, chunk_size=7)
+
+    chunks = list(search.search({"Имя": "Ив"}))
+    assert len(_names(chunks)) == 60
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    assert storage.calls == 1
+
+    # Дописали символы — поиск по прошлым результатам, без обращения к хранилищу
+    assert set(_names(search.search({"Имя": "Иван"}))) == {"Иван", "Ивана", "Иванов"}
+    assert _names(search.search({"Имя": "Иванов"})) == ["Иванов"] * 20
+    assert storage.calls == 1
+
+    # Стёрли символы — снова через индекс хранилища
+    assert len(_names(search.search({"Имя": "И"}))) == 80
+    assert storage.calls == 2
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_cancelled_search_stops_and_is_not_remembered():
+    test_file = "test_incremental.txt"
+    storage = CountingStorage(_storage(test_file))
+    search = IncrementalSearch(storage, chunk_size=10)
+
+    chunks = search.search({"Имя": "Ив"}, cancelled=lambda: len(seen) >= 2)
+    seen = []
+    for chunk in chunks:
+        seen.append(chunk)
+    assert len(seen) == 2
+
+    # Отменённый поиск не запоминается: следующий запрос снова идёт в хранилище
+    assert len(_names(search.search({"Имя": "Иван"}))) == 60
+    assert storage.calls == 2
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,96 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from model.contact_storage import ContactStorage
+from model.sqlite_storage import SQLiteContactStorage, migrate_csv_to_sqlite
+
+
+def _cleanup(*files):
+    for name in files:
+        for path in (name, name + "-wal", name + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def test_sqlite_crud():
+    test_db = "test_sqlite_crud.db"
+    _cleanup(test_db)
+    storage = SQLiteContactStorage(filename=test_db)
+
+    anna = storage.add_contact("Анна", "79001234567", "anna@example.com", "Друг")
+    boris = storage.add_contact("Борис", "89101112233", "", "")
+
+    assert storage.find_contact_by_id(anna["ID"])["Имя"] == "Анна"
+    assert [c["Имя"] for c in storage.load_contacts()] == ["Анна", "Борис"]
+
+    assert storage.update_contact(dict(anna, Комментарий="Коллега")) == True
+    assert storage.find_contact_by_id(anna["ID"])["Комментарий"] == "Коллега"
+    assert storage.update_contact(dict(anna, ID="несуществующий-id")) == False
+
+    assert storage.phone_exists("+7 910 111-22-33") == True
+    assert storage.find_contacts_by_phone_prefix("8910")[0]["ID"] == boris["ID"]
+    assert storage.find_contacts_by_email("ANNA@example.com")[0]["ID"] == anna["ID"]
+
+    assert storage.delete_contact(boris["ID"]) == True
+    assert storage.delete_contact(boris["ID"]) == False
+    assert len(storage.load_contacts()) == 1
+
+    storage.close()
+    _cleanup(test_db)
+
+
+def test_sqlite_search_matches_csv():
+    test_file = "test_sqlite_search.txt"
+    test_db = "test_sqlite_search.db"
+    _cleanup(test_db)
+    csv_storage = ContactStorage(filename=test_file)
+    csv_storage.add_contact("Анна Петрова", "79001112233", "anna@test.ru", "Друг")
+    csv_storage.add_contact("Борис Сидоров", "79104445566", "boris@work.com", "Коллега")
+    csv_storage.add_contact("Ольга", "79501112233", "olga@company.org", "HR-менеджер")
+
+    # Миграция из CSV сохраняет ID и порядок
+    assert migrate_csv_to_sqlite(test_file, test_db) == 3
+    storage = SQLiteContactStorage(filename=test_db)
+    assert storage.load_contacts() == csv_storage.load_contacts()
+
+    for query in ("анна", "1112233", "COMPANY", "менеджер", "ол", "", "нет такого"):
+        assert storage.search_contacts(query) == csv_storage.search_contacts(query)
+    assert storage.filter_contacts(name="сидор", phone="79") == csv_storage.filter_contacts(name="сидор", phone="79")
+
+    # Полнотекстовый индекс следует за изменениями
+    olga = storage.search_contacts("ольга")[0]
+    storage.update_contact(dict(olga, Имя="Ольга Смирнова"))
+    assert storage.search_contacts("смирнова")[0]["ID"] == olga["ID"]
+    storage.delete_contact(olga["ID"])
+    assert storage.search_contacts("смирнова") == []
+
+    storage.close()
+    _cleanup(test_db)
+    for path in (test_file, test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_migrate_in_batches_with_journal():
+    test_file = "test_sqlite_migrate.txt"
+    test_db = "test_sqlite_migrate.db"
+    _cleanup(test_db)
+    csv_storage = ContactStorage(filename=test_file, cached=True, journaled=True)
+    contacts = [csv_storage.add_contact(f"Контакт {i}", f"7900000000{i}", "", "") for i in range(5)]
+    # Изменения из журнала тоже переносятся
+    csv_storage.update_contact(dict(contacts[0], Комментарий="из журнала"))
+    csv_storage.delete_contact(contacts[1]["ID"])
+    assert os.path.exists(test_file + ".journal")
+
+    # Пачки по 2: последняя неполная; повторный запуск перезаписывает те же ID
+    for _ in range(2):
+        assert migrate_csv_to_sqlite(test_file, test_db, batch_size=2) == 4
+    storage = SQLiteContactStorage(filename=test_db)
+    assert storage.load_contacts() == csv_storage.load_contacts()
+    assert storage.find_contact_by_id(contacts[0]["ID"])["Комментарий"] == "из журнала"
+
+    storage.close()
+    _cleanup(test_db)
+    for path in (test_file, test_file + ".journal", test_file + ".lock"):
+        if os.path.exists(path):
+            os.remove(path)
@@ -1,4 +1,4 @@
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 from tkinter import Tk
 from view_forms.view import AppLabel, AppEntry, AppButton
 
@@ -8,6 +8,10 @@ class SearchContactForm:
     Форма для поиска контактов.
     Отвечает только за UI и сбор критериев поиска.
     Поиск делегируется внешней функции (callback).
+
+    Поиск запускается по мере ввода: после каждого нажатия клавиши форма ждёт
+    debounce_ms миллисекунд и, если пользователь больше ничего не ввёл, вызывает on_search.
+    Enter и кнопка «Поиск» запускают поиск сразу.
     """
 
     def __init__(
@@ -15,10 +19,20 @@ class SearchContactForm:
         parent: Tk,
         on_search: Callable[[str, str, str, str], None],
         on_cancel: Callable[[], None],
+        debounce_ms: int = 250,
     ) -> None:
+        """
+        :param parent: родительское окно (обычно root)
+        :param on_search: функция поиска, принимает (name, phone, email, comment)
+        :param on_cancel: функция, вызываемая при нажатии "Назад"
+        :param debounce_ms: пауза в вводе (мс), после которой запускается поиск
+        """
         self.parent = parent
         self.on_search = on_search
         self.on_cancel = on_cancel
+        self.debounce_ms = debounce_ms
+        self._pending: Optional[str] = None  # отложенный вызов after
+        self._last_criteria: Optional[Tuple[str, str, str, str]] = None
 
         self._build_ui()
 
@@ -36,6 +50,10 @@ class SearchContactForm:
         AppLabel(self.parent, text="Комментарий:")
         self.entry_comment = AppEntry(self.parent, ("Arial", 12), 80)
 
+        for entry in (self.entry_name, self.entry_phone, self.entry_email, self.entry_comment):
+            entry.root.bind("<KeyRelease>", self._on_key, add="+")
+            entry.root.bind("<Return>", lambda event: self._on_search_click(), add="+")
+
         # Кнопки
         AppButton(
             self.parent,
@@ -58,11 +76,35 @@ class SearchContactForm:
             command=self.on_cancel,
         )
 
+    def _criteria(self) -> Tuple[str, str, str, str]:
+        return (
+            self.entry_name.get().strip(),
+            self.entry_phone.get().strip(),
+            self.entry_email.get().strip(),
+            self.entry_comment.get().strip(),
+        )
+
+    def _on_key(self, event: object = None) -> None:
+        """Откладывает поиск до паузы в вводе (предыдущий отложенный поиск отменяется)."""
+        self._cancel_pending()
+        self._pending = self.parent.after(self.debounce_ms, self._on_debounced)
+
+    def _on_debounced(self) -> None:
+        self._pending = None
+        if not self.entry_name.root.winfo_exists():
+            return
+        # Клавиши-стрелки и Shift не меняют текст — повторять тот же поиск незачем
+        if self._criteria() != self._last_criteria:
+            self._on_search_click()
+
+    def _cancel_pending(self) -> None:
+        if self._pending is not None:
+            self.parent.after_cancel(self._pending)
+            self._pending = None
+
     def _on_search_click(self) -> None:
         """Собирает критерии и вызывает callback."""
-        name = self.entry_name.get().strip()
-        phone = self.entry_phone.get().strip()
-        email = self.entry_email.get().strip()
-        comment = self.entry_comment.get().strip()
+        self._cancel_pending()
+        name, phone, email, comment = self._last_criteria = self._criteria()
 
-        self.on_search(name, phone, email, comment)
\ No newline at end of file
+        self.on_search(name, phone, email, comment)
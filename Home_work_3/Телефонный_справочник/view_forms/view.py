@@ -1,9 +1,13 @@
 # Импортируем необходимые библиотеки
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, Any
+from typing import Callable, Any, Sequence
 from Controller_dir.exceptions import *
 from model.contact_storage import *
+from model.async_storage import AsyncStorage
+from model.change_notifier import CHANGE_ADD, CHANGE_DELETE, CHANGE_RELOAD, CHANGE_UPDATE
+from model.contact_record import contact_etag
+from model.storage_factory import create_storage
 
 
 class AppButton:
@@ -51,6 +55,10 @@ class AppTable:
     """
     Класс для создания таблицы (Treeview) в Tkinter с фиксированной высотой.
 
+    Таблица помнит, какой элемент Treeview показывает какой контакт, поэтому
+    refresh_table и apply_change трогают только изменившиеся строки.
+    Пока данные читаются в фоне, set_loading(True) показывает поверх таблицы «Загрузка…».
+
     :param root: родительское окно или контейнер
     :param columns: список названий столбцов
     :param show: какие элементы отображать (например, 'headings')
@@ -75,6 +83,15 @@ class AppTable:
             self.table.heading(col, text=col)
             self.table.column(col, width=170)
 
+        self._items: Dict[str, str] = {}  # ID контакта → элемент Treeview
+        self._item_values: Dict[str, tuple] = {}  # ID контакта → показанные значения
+        self._storage: Optional[Any] = None
+
+        self._loading = tk.Frame(self.frame, bd=1, relief=tk.SOLID, bg="white")
+        tk.Label(self._loading, text="Загрузка…", font=("Arial", 12), bg="white").pack(padx=20, pady=(10, 5))
+        self._progress = ttk.Progressbar(self._loading, mode="indeterminate", length=160)
+        self._progress.pack(padx=20, pady=(0, 10))
+
     def selection(self) -> tuple:
         """Возвращает выбранные элементы таблицы."""
         return self.table.selection()
@@ -95,40 +112,430 @@ class AppTable:
         :param contacts: список словарей с данными контактов
         """
         for contact in contacts:
-            self.table.insert(
-                "",
-                tk.END,
-                values=(
-                    contact["ID"],
-                    contact["Имя"],
-                    contact["Телефон"],
-                    contact["Email"],
-                    contact["Комментарий"],
-                ),
-            )
+            self._insert(contact, tk.END)
+
+    def append_contacts(self, contacts: List[Dict[str, str]]) -> None:
+        """
+        Дописывает контакты в конец таблицы (для вывода результатов порциями).
+
+        :param contacts: список словарей с данными контактов
+        """
+        self.load_contact(contacts)
 
     def refresh_table(self, load_contacts: Callable[[], List[Dict[str, str]]]) -> None:
         """
-        Очищает таблицу и загружает новые данные.
+        Обновляет таблицу по новому списку контактов.
+
+        Сравнивает новый список с показанным: удаляет пропавшие строки одним вызовом,
+        переписывает только изменившиеся значения и вставляет новые контакты на их места.
+        Выделение и позиция прокрутки сохраняются.
 
         :param load_contacts: функция, возвращающая список контактов
         """
-        for row in self.table.get_children():
-            self.table.delete(row)
-
         contacts = load_contacts()
+        new_ids = {contact["ID"] for contact in contacts}
+
+        removed = [contact_id for contact_id in self._items if contact_id not in new_ids]
+        if removed:
+            self.table.delete(*(self._items[contact_id] for contact_id in removed))
+            for contact_id in removed:
+                del self._items[contact_id]
+                del self._item_values[contact_id]
+
         for contact in contacts:
-            self.table.insert(
-                "",
-                tk.END,
-                values=(
-                    contact["ID"],
-                    contact["Имя"],
-                    contact["Телефон"],
-                    contact["Email"],
-                    contact["Комментарий"],
-                ),
-            )
+            if contact["ID"] in self._items:
+                self._update(contact)
+            else:
+                self._insert(contact, tk.END)
+
+        # Порядок меняется редко (например, после сжатия журнала), но если поменялся — переставляем
+        order = [self._items[contact["ID"]] for contact in contacts]
+        if list(self.table.get_children()) != order:
+            for position, item_id in enumerate(order):
+                self.table.move(item_id, "", position)
+
+    def clear(self) -> None:
+        """Удаляет все строки из таблицы."""
+        children = self.table.get_children()
+        if children:
+            self.table.delete(*children)
+        self._items.clear()
+        self._item_values.clear()
+
+    def apply_change(self, event: str, contact: Optional[Dict[str, str]] = None) -> None:
+        """
+        Применяет к таблице одно изменение хранилища.
+
+        :param event: событие (CHANGE_ADD, CHANGE_UPDATE, CHANGE_DELETE, CHANGE_RELOAD)
+        :param contact: изменённый контакт (для CHANGE_RELOAD не нужен)
+        """
+        if event == CHANGE_RELOAD:
+            self._reload()
+        elif event == CHANGE_ADD:
+            if contact["ID"] in self._items:
+                self._update(contact)
+            else:
+                self._insert(contact, tk.END)
+        elif event == CHANGE_UPDATE:
+            if contact["ID"] in self._items:
+                self._update(contact)
+        elif event == CHANGE_DELETE:
+            item_id = self._items.pop(contact["ID"], None)
+            if item_id is not None:
+                del self._item_values[contact["ID"]]
+                self.table.delete(item_id)
+
+    def exists(self) -> bool:
+        """Проверяет, не уничтожена ли таблица (например, при переходе на другой экран)."""
+        return bool(self.frame.winfo_exists())
+
+    def set_loading(self, loading: bool) -> None:
+        """Показывает или скрывает индикатор загрузки поверх таблицы."""
+        if loading:
+            self._loading.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+            self._loading.lift()
+            self._progress.start(15)
+        else:
+            self._progress.stop()
+            self._loading.place_forget()
+
+    def load_async(self, load: Callable[..., Any], on_error: Optional[Callable[[BaseException], None]] = None) -> None:
+        """
+        Загружает контакты в фоне, показывая индикатор загрузки.
+
+        :param load: метод AsyncStorage, принимающий on_done и on_error (например, async_storage.load_contacts)
+        :param on_error: вызывается при ошибке чтения
+        """
+        self.set_loading(True)
+
+        def done(contacts: Sequence[Dict[str, str]]) -> None:
+            # Пока шло чтение, пользователь мог уйти с экрана
+            if self.exists():
+                self.set_loading(False)
+                self.clear()
+                self.load_contact(contacts)
+
+        def failed(error: BaseException) -> None:
+            if self.exists():
+                self.set_loading(False)
+            if on_error is not None:
+                on_error(error)
+
+        load(on_done=done, on_error=failed)
+
+    def bind_storage(self, storage: Any) -> None:
+        """
+        Подписывает таблицу на изменения хранилища.
+
+        После этого добавление, изменение и удаление контактов сразу отражаются в таблице
+        без полной перезагрузки. Подписка снимается, когда таблица уничтожается.
+
+        :param storage: хранилище с методами subscribe/unsubscribe (ChangeNotifierMixin или AsyncStorage)
+        """
+        self._storage = storage
+        storage.subscribe(self.apply_change)
+        self.frame.bind("<Destroy>", lambda event: storage.unsubscribe(self.apply_change), add="+")
+
+    def _reload(self) -> None:
+        """Перечитывает контакты из привязанного хранилища (в фоне, если это AsyncStorage)."""
+        if self._storage is None:
+            return
+        if not isinstance(self._storage, AsyncStorage):
+            self.refresh_table(self._storage.load_contacts)
+            return
+        self.set_loading(True)
+
+        def done(contacts: Sequence[Dict[str, str]]) -> None:
+            if self.exists():
+                self.set_loading(False)
+                self.refresh_table(lambda: contacts)
+
+        self._storage.load_contacts(on_done=done)
+
+    def _insert(self, contact: Dict[str, str], index: Any) -> None:
+        values = self._values(contact)
+        self._items[contact["ID"]] = self.table.insert("", index, values=values)
+        self._item_values[contact["ID"]] = values
+
+    def _update(self, contact: Dict[str, str]) -> None:
+        values = self._values(contact)
+        if self._item_values[contact["ID"]] != values:
+            self.table.item(self._items[contact["ID"]], values=values)
+            self._item_values[contact["ID"]] = values
+
+    @staticmethod
+    def _values(contact: Dict[str, str]) -> tuple:
+        return (
+            contact["ID"],
+            contact["Имя"],
+            contact["Телефон"],
+            contact["Email"],
+            contact["Комментарий"],
+        )
+
+
+class VirtualAppTable(AppTable):
+    """
+    Таблица с виртуальной прокруткой.
+
+    В Treeview вставлены только видимые строки и запас buffer_rows сверху и снизу,
+    а весь список контактов хранится отдельно. При прокрутке окно строк сдвигается:
+    значения существующих элементов Treeview переписываются, а не создаются заново.
+    Поэтому открытие таблицы на 100 тысяч контактов стоит столько же, сколько на сотню.
+
+    selection() и item() работают как у AppTable: возвращают выбранные элементы
+    и их значения, где values[0] — ID контакта. Выбранный контакт запоминается
+    по ID и остаётся выбранным после прокрутки. Если его строка ушла из окна,
+    в Treeview она не выделена, а selection() возвращает элемент SELECTED_OFFSCREEN,
+    для которого item() отдаёт значения запомненного контакта. При перерисовке
+    значения элемента переписываются, только если строка действительно изменилась.
+
+    :param buffer_rows: сколько строк держать в Treeview сверх видимых с каждой стороны
+    """
+
+    # Элемент selection() для выбранного контакта, строка которого сейчас не в Treeview
+    SELECTED_OFFSCREEN = "selected-offscreen"
+
+    def __init__(
+        self, root: tk.Widget, columns: List[str], show: str, height: int, buffer_rows: int = 50
+    ) -> None:
+        super().__init__(root, columns, show, height)
+        self.buffer_rows = buffer_rows
+        self._height = height
+        self._row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        self._rows: Sequence[Dict[str, str]] = []
+        self._start = 0  # индекс в self._rows первой строки, вставленной в Treeview
+        self._window: List[str] = []  # элементы Treeview по порядку
+        self._window_values: List[tuple] = []  # значения, показанные в элементах окна
+        self._positions: Optional[Dict[str, int]] = None  # ID → индекс в self._rows, строится лениво
+        self._selected_id: Optional[str] = None
+        self._recenter_pending = False
+
+        # Полоса прокрутки отражает положение во всём списке, а не в окне Treeview
+        self.table.pack_forget()
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        self.table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.table.configure(yscrollcommand=self._on_tree_scroll)
+        self.table.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        self.table.bind("<Configure>", self._on_resize, add="+")
+
+    def selection(self) -> tuple:
+        """Возвращает выбранные элементы таблицы (выбранный контакт — даже после прокрутки)."""
+        selected = self.table.selection()
+        if selected or self._selected_id is None:
+            return selected
+        if self._position(self._selected_id) is None:
+            # Выбранный контакт удалён или не попал в новый список
+            return ()
+        return (self.SELECTED_OFFSCREEN,)
+
+    def item(self, item_id: str) -> Dict[str, Any]:
+        """
+        Возвращает данные элемента по его ID.
+
+        :param item_id: ID элемента в таблице или SELECTED_OFFSCREEN из selection()
+        :return: словарь с данными элемента
+        """
+        if item_id == self.SELECTED_OFFSCREEN:
+            position = self._position(self._selected_id) if self._selected_id is not None else None
+            if position is None:
+                raise KeyError(item_id)
+            return {"values": list(self._values(self._rows[position]))}
+        return self.table.item(item_id)
+
+    def load_contact(self, contacts: Sequence[Dict[str, str]]) -> None:
+        """
+        Показывает список контактов (заменяет предыдущий).
+
+        :param contacts: последовательность контактов; в Treeview попадает только видимая часть
+        """
+        self._rows = contacts
+        self._positions = None
+        self._render(0)
+        self.table.yview_moveto(0)
+
+    def refresh_table(self, load_contacts: Callable[[], Sequence[Dict[str, str]]]) -> None:
+        """
+        Перезагружает данные, сохраняя позицию прокрутки.
+
+        :param load_contacts: функция, возвращающая список контактов
+        """
+        top = self._top()
+        self._rows = load_contacts()
+        self._positions = None
+        self.scroll_to(top, force=True)
+
+    def append_contacts(self, contacts: Sequence[Dict[str, str]]) -> None:
+        """
+        Дописывает контакты в конец списка, сохраняя позицию прокрутки.
+
+        В Treeview добавляются строки, только если окно ещё не заполнено.
+
+        :param contacts: последовательность контактов
+        """
+        if not contacts:
+            return
+        if not isinstance(self._rows, list):
+            self._rows = list(self._rows)
+        self._rows.extend(contacts)
+        self._positions = None
+        if len(self._window) < min(len(self._rows), self._visible_rows() + 2 * self.buffer_rows):
+            self._render(self._start)
+        # Полоса прокрутки должна отразить новую длину списка
+        self._on_tree_scroll(*self.table.yview())
+
+    def clear(self) -> None:
+        """Удаляет все строки из таблицы."""
+        self.load_contact([])
+
+    def apply_change(self, event: str, contact: Optional[Dict[str, str]] = None) -> None:
+        """
+        Применяет к списку одно изменение хранилища и перерисовывает окно строк.
+
+        Перерисовка переписывает только элементы, значения которых изменились.
+
+        :param event: событие (CHANGE_ADD, CHANGE_UPDATE, CHANGE_DELETE, CHANGE_RELOAD)
+        :param contact: изменённый контакт (для CHANGE_RELOAD не нужен)
+        """
+        if event == CHANGE_RELOAD:
+            self._reload()
+            return
+
+        position = self._position(contact["ID"])
+        if not isinstance(self._rows, list):
+            self._rows = list(self._rows)
+        if event == CHANGE_ADD:
+            if position is None:
+                self._positions[contact["ID"]] = len(self._rows)
+                self._rows.append(contact)
+            else:
+                self._rows[position] = contact
+        elif event == CHANGE_UPDATE:
+            if position is None:
+                return
+            self._rows[position] = contact
+        elif event == CHANGE_DELETE:
+            if position is None:
+                return
+            del self._rows[position]
+            # Индексы следующих строк сдвинулись — карту построим заново при следующем изменении
+            self._positions = None
+        self.scroll_to(self._top(), force=True)
+
+    def scroll_to(self, index: int, force: bool = False) -> None:
+        """
+        Прокручивает таблицу так, чтобы строка index оказалась первой видимой.
+
+        :param force: перерисовать окно, даже если строка уже в нём
+        """
+        visible = self._visible_rows()
+        index = max(0, min(index, len(self._rows) - visible))
+        end = self._start + len(self._window)
+        if force or not (self._start <= index and index + visible <= end):
+            self._render(index - self.buffer_rows)
+        if self._window:
+            # Четверть строки в запас, чтобы погрешность float не сдвинула на строку выше
+            self.table.yview_moveto((index - self._start + 0.25) / len(self._window))
+
+    def _position(self, contact_id: str) -> Optional[int]:
+        """Индекс контакта в self._rows или None."""
+        if self._positions is None:
+            self._positions = {contact["ID"]: i for i, contact in enumerate(self._rows)}
+        return self._positions.get(contact_id)
+
+    def _visible_rows(self) -> int:
+        """Сколько строк помещается в видимой части Treeview."""
+        height = self.table.winfo_height()
+        if height <= 1:
+            # Виджет ещё не отрисован — оцениваем по высоте контейнера
+            height = self._height
+        return max(1, height // self._row_height)
+
+    def _top(self) -> int:
+        """Индекс в self._rows первой видимой строки."""
+        if not self._window:
+            return 0
+        return self._start + round(self.table.yview()[0] * len(self._window))
+
+    def _render(self, start: int) -> None:
+        """Заполняет Treeview строками self._rows, начиная с start."""
+        size = self._visible_rows() + 2 * self.buffer_rows
+        start = max(0, min(start, len(self._rows) - size))
+        rows = self._rows[start:start + size]
+
+        # Переиспользуем существующие элементы, лишние удаляем, недостающие добавляем
+        if len(self._window) > len(rows):
+            self.table.delete(*self._window[len(rows):])
+            del self._window[len(rows):]
+            del self._window_values[len(rows):]
+        while len(self._window) < len(rows):
+            self._window.append(self.table.insert("", tk.END, values=()))
+            self._window_values.append(())
+
+        selected = None
+        for position, (item_id, contact) in enumerate(zip(self._window, rows)):
+            values = self._values(contact)
+            if self._window_values[position] != values:
+                self.table.item(item_id, values=values)
+                self._window_values[position] = values
+            if contact["ID"] == self._selected_id:
+                selected = item_id
+        self._start = start
+
+        if selected is not None:
+            self.table.selection_set(selected)
+        elif self.table.selection():
+            self.table.selection_remove(*self.table.selection())
+
+    def _on_select(self, event: Any = None) -> None:
+        """Запоминает ID выбранного контакта, чтобы сохранить выбор при прокрутке."""
+        selected = self.table.selection()
+        if selected and selected[0] in self._window:
+            position = self._window.index(selected[0])
+            self._selected_id = self._rows[self._start + position]["ID"]
+
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        """
+        Вызывается Treeview при прокрутке его окна строк.
+
+        Переводит положение в окне в положение во всём списке для полосы прокрутки
+        и сдвигает окно, когда видимая часть подходит к краю запаса.
+        """
+        total = len(self._rows)
+        size = len(self._window)
+        if not total or not size:
+            self.scrollbar.set(0, 1)
+            return
+        top = self._start + float(first) * size
+        bottom = self._start + float(last) * size
+        self.scrollbar.set(top / total, bottom / total)
+
+        margin = self.buffer_rows // 2
+        near_top = self._start > 0 and top - self._start < margin
+        near_bottom = self._start + size < total and self._start + size - bottom < margin
+        if (near_top or near_bottom) and not self._recenter_pending:
+            self._recenter_pending = True
+            self.table.after_idle(self._recenter)
+
+    def _recenter(self) -> None:
+        """Сдвигает окно строк так, чтобы видимая часть оказалась в его середине."""
+        self._recenter_pending = False
+        self.scroll_to(self._top(), force=True)
+
+    def _on_scrollbar(self, *args: str) -> None:
+        """Обрабатывает перетаскивание и щелчки по полосе прокрутки."""
+        if args[0] == "moveto":
+            target = int(float(args[1]) * len(self._rows))
+        else:
+            step = self._visible_rows() if args[2] == "pages" else 1
+            target = self._top() + int(args[1]) * step
+        self.scroll_to(target)
+
+    def _on_resize(self, event: Any = None) -> None:
+        """Добирает строки в окно, если таблица стала выше."""
+        if len(self._window) < min(len(self._rows), self._visible_rows() + 2 * self.buffer_rows):
+            self._render(self._start)
 
 
 class AppLabel:
@@ -196,6 +603,8 @@ class AppWindowModal:
     :param mode: режим окна ('edit' или 'confirm')
     :param confirm_message: сообщение для режима подтверждения
     :param on_confirm: функция, вызываемая при подтверждении
+    :param storage: хранилище контактов или AsyncStorage, тогда запись идёт в фоне
+                    (по умолчанию — хранилище из настроек model/config.py)
     """
 
     def __init__(
@@ -206,6 +615,7 @@ class AppWindowModal:
         mode: str = "edit",
         confirm_message: Optional[str] = None,
         on_confirm: Optional[Callable[[], None]] = None,
+        storage: Optional[Any] = None,
     ) -> None:
         self.parent = parent
         self.contact_data = contact_data
@@ -215,7 +625,7 @@ class AppWindowModal:
         self.on_confirm = on_confirm
         self.entries: Dict[str, tk.Entry] = {}
         self.create_window()
-        self.storage = ContactStorage()
+        self.storage = storage if storage is not None else create_storage()
 
     def create_window(self) -> None:
         """Создаёт и настраивает содержимое модального окна в зависимости от режима."""
@@ -302,21 +712,38 @@ class AppWindowModal:
             if updated_data["Email"] and not self.storage.is_valid_email(updated_data["Email"]):
                 raise InvalidEmailError()
 
-            success = self.storage.update_contact(updated_data)
-
-            if success and self.on_save_callback:
-                self.on_save_callback()
-
-            self.parent.destroy()
+            # Версия контакта на момент открытия окна: если его успели изменить
+            # в другом окне или процессе, хранилище не даст затереть чужую правку
+            expected_etag = contact_etag(self.contact_data)
+            if isinstance(self.storage, AsyncStorage):
+                # Запись идёт в фоне; окно закроется, когда она завершится
+                self.storage.update_contact(
+                    updated_data, expected_etag, on_done=self._finish_save, on_error=self._show_save_error
+                )
+            else:
+                self._finish_save(self.storage.update_contact(updated_data, expected_etag))
 
-        except (EmptyFieldError, InvalidPhoneError, InvalidEmailError) as e:
+        except (EmptyFieldError, InvalidPhoneError, InvalidEmailError, ConcurrentUpdateError) as e:
             # Показываем ошибку под кнопкой
             self.error_label = AppLabel(self.parent, text=str(e), fg="red")
             self.error_label.root.pack(pady=5)
         except Exception as e:
             # На случай других ошибок
-            self.error_label = AppLabel(self.parent, text=f"Ошибка: {str(e)}", fg="red")
-            self.error_label.root.pack(pady=5)
+            self._show_save_error(e)
+
+    def _finish_save(self, success: bool) -> None:
+        """Завершает сохранение: вызывает on_save_callback и закрывает окно."""
+        if success and self.on_save_callback:
+            self.on_save_callback()
+        self.parent.destroy()
+
+    def _show_save_error(self, error: BaseException) -> None:
+        """Показывает ошибку сохранения под кнопкой."""
+        if not self.parent.winfo_exists():
+            return
+        text = str(error) if isinstance(error, ConcurrentUpdateError) else f"Ошибка: {str(error)}"
+        self.error_label = AppLabel(self.parent, text=text, fg="red")
+        self.error_label.root.pack(pady=5)
 
     def confirm(self) -> None:
         """Вызывается при подтверждении действия в режиме 'confirm'."""
@@ -362,8 +789,7 @@ class ContactScreenMixin:
 
     def get_all_contacts(self: 'App') -> None:
         """Открывает контроллер для отображения всех контактов."""
-        from Controller_dir.controller_v2 import ContactController
-        ctrl = ContactController(self)
+        ctrl = self.get_controller()
         ctrl.get_all_contacts()
 
 
@@ -372,8 +798,7 @@ class CreateContactScreenMixin:
 
     def create_contact(self: 'App') -> None:
         """Открывает контроллер для создания нового контакта."""
-        from Controller_dir.controller_v2 import ContactController
-        ctrl = ContactController(self)
+        ctrl = self.get_controller()
         ctrl.create_contact()
 
 
@@ -382,8 +807,7 @@ class SearchContactScreenMixin:
 
     def search_contact(self: 'App') -> None:
         """Открывает контроллер для поиска контакта."""
-        from Controller_dir.controller_v2 import ContactController
-        ctrl = ContactController(self)
+        ctrl = self.get_controller()
         ctrl.search_contact()
 
 
@@ -392,8 +816,7 @@ class EditContactScreenMixin:
 
     def edit_contact(self: 'App') -> None:
         """Открывает контроллер для редактирования контакта."""
-        from Controller_dir.controller_v2 import ContactController
-        ctrl = ContactController(self)
+        ctrl = self.get_controller()
         ctrl.edit_contact()
 
 
@@ -417,8 +840,21 @@ class App(StartScreenMixin, ContactScreenMixin, CreateContactScreenMixin,
         self.root.title("Телефонный_справочник")
         self.root.geometry("1000x850")
         self.root.configure(bg="black")
+        self._controller: Optional[Any] = None
         self.show_start_screen()
 
+    def get_controller(self) -> Any:
+        """
+        Возвращает контроллер приложения.
+
+        Контроллер создаётся один раз: хранилище с его кэшем и фоновый поток
+        общие для всех экранов, а не пересоздаются при каждом переходе.
+        """
+        if self._controller is None:
+            from Controller_dir.controller_v2 import ContactController
+            self._controller = ContactController(self)
+        return self._controller
+
     def clear_screen(self) -> None:
         """Удаляет все виджеты из главного окна."""
         for widget in self.root.winfo_children():
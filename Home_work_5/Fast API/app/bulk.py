@@ -0,0 +1,115 @@
+# === МАССОВЫЙ ИМПОРТ КОНТАКТОВ: разбор тела запроса и вставка пачками ===
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Tuple, Type
+
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel, ValidationError
+
+from app.repository import ContactRepository
+
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# Сколько ошибок по строкам вернуть в ответе (остальные только считаются)
+MAX_REPORTED_ERRORS = 1000
+
+# Строка тела: (номер строки с 1, разобранный объект или текст ошибки разбора)
+ParsedRow = Tuple[int, Any, str]
+
+
+async def iter_rows(request: Request) -> AsyncIterator[ParsedRow]:
+    """
+    Перебирает строки тела запроса.
+
+    NDJSON (по одному JSON-объекту в строке) читается потоково по мере поступления данных,
+    поэтому размер импорта не ограничен памятью. JSON-массив разбирается целиком.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_TYPES:
+        async for row in _iter_ndjson(request):
+            yield row
+        return
+
+    try:
+        data = json.loads(await request.body())
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Некорректный JSON: {error}")
+    if not isinstance(data, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Ожидается JSON-массив контактов")
+    for number, item in enumerate(data, start=1):
+        yield number, item, ""
+
+
+async def _iter_ndjson(request: Request) -> AsyncIterator[ParsedRow]:
+    buffer = b""
+    number = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            if line.strip():
+                yield _parse_line(number, line)
+    if buffer.strip():
+        yield _parse_line(number + 1, buffer)
+
+
+def _parse_line(number: int, line: bytes) -> ParsedRow:
+    try:
+        return number, json.loads(line), ""
+    except ValueError as error:
+        return number, None, f"Некорректный JSON: {error}"
+
+
+def _format_errors(error: ValidationError) -> List[Dict[str, str]]:
+    return [
+        {"field": ".".join(str(part) for part in item["loc"]), "message": item["msg"]}
+        for item in error.errors()
+    ]
+
+
+async def import_contacts(
+    rows: AsyncIterator[ParsedRow],
+    model: Type[BaseModel],
+    repository: ContactRepository,
+    chunk_size: int,
+) -> Dict[str, Any]:
+    """
+    Проверяет строки моделью model и вставляет корректные пачками по chunk_size.
+
+    Каждая пачка — одна транзакция с одним INSERT на все строки (executemany)
+    и одним временем создания. Некорректные строки не прерывают импорт,
+    а попадают в список ошибок с номером строки.
+
+    :return: {"created": ..., "failed": ..., "errors": [{"row": ..., "errors": [...]}, ...]}
+    """
+    created = failed = 0
+    errors: List[Dict[str, Any]] = []
+    chunk: List[Dict[str, Any]] = []
+
+    async def flush() -> None:
+        nonlocal created
+        if chunk:
+            now = datetime.now()
+            for values in chunk:
+                values["created_at"] = now
+            created += await repository.bulk_create(chunk)
+            chunk.clear()
+
+    async for number, item, parse_error in rows:
+        if parse_error:
+            problems = [{"field": "", "message": parse_error}]
+        else:
+            try:
+                chunk.append(model.model_validate(item).model_dump())
+                problems = []
+            except ValidationError as error:
+                problems = _format_errors(error)
+        if problems:
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": number, "errors": problems})
+        if len(chunk) >= chunk_size:
+            await flush()
+    await flush()
+    return {"created": created, "failed": failed, "errors": errors}
@@ -0,0 +1,87 @@
+# === ПОДКЛЮЧЕНИЕ К БД (по образцу Home_work_6/models.py) ===
+import os
+
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Адрес базы: SQLite + асинхронный драйвер aiosqlite.
+# Можно переопределить переменной окружения (например, для тестов или другого пути в контейнере).
+DATABASE_URL = os.getenv("CONTACTS_DATABASE_URL", "sqlite+aiosqlite:///./contacts.db")
+
+# "Мотор" с пулом соединений: соединение берётся из пула на время запроса,
+# а не открывается заново. Несколько воркеров uvicorn работают с одним файлом БД.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Настраивает каждое новое соединение SQLite.
+
+    WAL — читатели не ждут писателя (важно при нескольких воркерах),
+    busy_timeout — писатель ждёт освобождения БД, а не падает с "database is locked".
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+    # Нижний регистр для поиска без учёта регистра: встроенный lower() SQLite не знает кириллицу
+    dbapi_connection.create_function("py_lower", 1, _lower, deterministic=True)
+
+
+def _lower(value):
+    return value.lower() if value is not None else None
+
+
+# === БАЗОВЫЙ КЛАСС для моделей ===
+Base = declarative_base()
+
+# === ФАБРИКА СЕССИЙ ===
+AsyncSessionLocal = sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    expire_on_commit=False,  # после commit объекты можно отдавать в ответ без повторного запроса
+)
+
+
+async def init_db() -> None:
+    """Создаёт таблицы, если их нет."""
+    # Импорт регистрирует модели в Base.metadata
+    from app import models  # noqa: F401
+    from app.response_cache import init_versioning
+    from app.search import init_search
+
+    def create_all(sync_conn) -> None:
+        Base.metadata.create_all(sync_conn)
+        if sync_conn.dialect.name == "sqlite":
+            init_search(sync_conn)
+            init_versioning(sync_conn)
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(create_all)
+    except OperationalError:
+        # Несколько воркеров стартуют одновременно: таблицу мог только что создать соседний.
+        # Повторная проверка увидит её и ничего не будет создавать.
+        async with engine.begin() as conn:
+            await conn.run_sync(create_all)
+
+
+async def get_session():
+    """Зависимость FastAPI: выдаёт сессию на время запроса и закрывает её после ответа."""
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -0,0 +1,65 @@
+# === ПОТОКОВЫЙ ЭКСПОРТ КОНТАКТОВ (CSV / NDJSON) ===
+# Формат совпадает с файлом настольного справочника (Home_work_3, ContactStorage.write_contacts):
+# колонки ID, Имя, Телефон, Email, Комментарий. CSV открывается в tkinter-приложении как есть,
+# а строки NDJSON с теми же ключами можно передать в ContactStorage.bulk_add_contacts.
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Iterable, List
+
+from app.db import AsyncSessionLocal
+from app.repository import ContactRepository
+
+# Колонки файла настольного справочника
+EXPORT_FIELDNAMES = ["ID", "Имя", "Телефон", "Email", "Комментарий"]
+
+# Колонки БД в порядке EXPORT_FIELDNAMES
+EXPORT_COLUMNS = ("id", "name", "phone", "email", "notes")
+
+EXPORT_BATCH_SIZE = 1000
+
+# Для text/* Starlette сам добавит "; charset=utf-8"
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def _values(row: Any) -> List[str]:
+    # В справочнике все поля — строки (и ID тоже), пустые email и заметки — "", а не None
+    return ["" if value is None else str(value) for value in (getattr(row, column) for column in EXPORT_COLUMNS)]
+
+
+def _csv_chunk(rows: Iterable[Any], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDNAMES)
+    writer.writerows(_values(row) for row in rows)
+    return buffer.getvalue()
+
+
+def _ndjson_chunk(rows: Iterable[Any]) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDNAMES, _values(row))), ensure_ascii=False) + "\n" for row in rows
+    )
+
+
+async def export_contacts(export_format: str) -> AsyncIterator[bytes]:
+    """
+    Выдаёт файл экспорта кусками по EXPORT_BATCH_SIZE контактов.
+
+    Контакты читаются постранично по первичному ключу, в своей сессии (сессия запроса
+    закрывается раньше, чем ответ досылается клиенту). В памяти держится одна пачка,
+    а длинной транзакции, мешающей записи, нет.
+    """
+    if export_format == "csv":
+        yield _csv_chunk((), header=True).encode("utf-8")
+    async with AsyncSessionLocal() as session:
+        repository = ContactRepository(session)
+        after_id = 0
+        while True:
+            rows, last_id = await repository.page(after_id, EXPORT_BATCH_SIZE, EXPORT_COLUMNS)
+            if rows:
+                chunk = _csv_chunk(rows) if export_format == "csv" else _ndjson_chunk(rows)
+                yield chunk.encode("utf-8")
+            if last_id is None:
+                break
+            after_id = last_id
@@ -0,0 +1,101 @@
+# === БЫСТРЫЙ РЕЖИМ JSON-ОТВЕТОВ (включается переменной окружения) ===
+# CONTACTS_FAST_JSON=1:
+# - ответы сериализуются orjson (ORJSONResponse) — в разы быстрее стандартного json;
+# - контакты из БД отдаются без повторной проверки через response_model;
+# - уже сериализованные строки списка кэшируются: неизменившийся контакт
+#   не кодируется заново, его байты просто склеиваются в массив.
+# Без переменной ответы формируются как раньше. Переменная читается при каждом ответе,
+# поэтому режим можно переключить в тестах (monkeypatch.setenv) без перезагрузки модуля.
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.metrics import serialization_timer
+from app.pagination import CONTACT_FIELDS, rows_to_dicts
+
+try:
+    import orjson
+except ImportError:  # orjson не установлен — быстрый режим недоступен
+    orjson = None
+
+
+def fast_json_enabled() -> bool:
+    """Включён ли быстрый режим: задана CONTACTS_FAST_JSON и установлен orjson."""
+    return orjson is not None and os.getenv("CONTACTS_FAST_JSON", "").lower() in ("1", "true", "yes")
+
+
+# Сколько сериализованных строк держать в памяти (на один процесс)
+ROW_CACHE_SIZE = 100_000
+
+
+class RowCache:
+    """
+    LRU-кэш сериализованных строк: (поля, значения строки) → байты JSON-объекта.
+
+    Ключ включает все значения строки, поэтому изменённый контакт получает новый ключ,
+    а устаревшие байты просто вытесняются — инвалидация не нужна, и кэш корректен
+    при нескольких воркерах, меняющих одну БД.
+    """
+
+    def __init__(self, max_size: int = ROW_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._items: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+
+    def dumps(self, fields: Sequence[str], row: Any) -> bytes:
+        """Возвращает JSON строки (только поля fields), кодируя её, только если её нет в кэше."""
+        key = (fields, tuple(row))
+        data = self._items.get(key)
+        if data is not None:
+            self._items.move_to_end(key)
+            return data
+        data = orjson.dumps({field: getattr(row, field) for field in fields})
+        self._items[key] = data
+        if len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+        return data
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+row_cache = RowCache()
+
+
+def rows_response(rows: Iterable[Any], fields: Sequence[str], headers: Optional[Dict[str, str]] = None) -> Response:
+    """Ответ со списком строк выборки (страница списка или поиска)."""
+    with serialization_timer():
+        if not fast_json_enabled():
+            return JSONResponse(rows_to_dicts(rows, fields), headers=headers)
+        fields = tuple(fields)
+        body = b"[" + b",".join(row_cache.dumps(fields, row) for row in rows) + b"]"
+        return Response(body, media_type="application/json", headers=headers)
+
+
+def contact_response(contact: Any, status_code: int = 200) -> Any:
+    """
+    Ответ с одним контактом (ORM-объект).
+
+    В быстром режиме — ORJSONResponse без проверки response_model,
+    иначе объект возвращается как есть и проверяется FastAPI.
+    """
+    if not fast_json_enabled():
+        return contact
+    with serialization_timer():
+        return ORJSONResponse(
+            {field: getattr(contact, field) for field in CONTACT_FIELDS}, status_code=status_code
+        )
+
+
+def record_response(contact: Any) -> Response:
+    """
+    Готовый ответ с одним контактом из БД — всегда без проверки response_model.
+
+    Нужен там, где тело ответа кэшируется (app/response_cache.py).
+    """
+    if fast_json_enabled():
+        return contact_response(contact)
+    with serialization_timer():
+        return JSONResponse(rows_to_dicts([contact], CONTACT_FIELDS)[0])
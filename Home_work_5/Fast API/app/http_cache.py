@@ -0,0 +1,45 @@
+# === УСЛОВНЫЕ HTTP-ЗАПРОСЫ (ETag / Last-Modified → 304 Not Modified) ===
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(body: bytes) -> str:
+    """Сильный ETag тела ответа — хеш его байтов в кавычках."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def http_date(timestamp: float) -> str:
+    """Дата в формате заголовка Last-Modified."""
+    return formatdate(timestamp, usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[float] = None) -> bool:
+    """
+    Проверяет, есть ли у клиента актуальная копия ответа.
+
+    If-None-Match важнее If-Modified-Since: если клиент прислал ETag,
+    дата не проверяется (как требует RFC 9110).
+    :param etag: текущий ETag ресурса
+    :param last_modified: время изменения ресурса (timestamp) или None
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # Для If-None-Match сравнение слабое: W/"x" совпадает с "x"
+        return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
+    return False
+
+
+def not_modified(headers: dict) -> Response:
+    """Ответ 304 без тела, но с теми же ETag/Last-Modified/Cache-Control."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -1,13 +1,24 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.templating import Jinja2Templates
 
+from app.db import engine, init_db
+from app.metrics import MetricsMiddleware, metrics_response
 from app.routers import api, pages
 
-app = FastAPI(title="My First Web App")
 
-# Подключение шаблонов и статики
-templates = Jinja2Templates(directory="app/templates")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # При старте создаём таблицы, при остановке закрываем пул соединений
+    await init_db()
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(title="My First Web App", lifespan=lifespan)
 
+# Метрики запросов: время ответа, размеры, запросы в обработке (см. /metrics)
+app.add_middleware(MetricsMiddleware)
 
 # Подключение роутеров
 app.include_router(pages.router)  # HTML-страницы
@@ -21,3 +32,9 @@ async def health():
 @app.get("/ping/")
 async def ping():
     return {"message": "pong"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Метрики в текстовом формате Prometheus."""
+    return metrics_response()
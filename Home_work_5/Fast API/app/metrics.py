@@ -0,0 +1,228 @@
+# === МЕТРИКИ ЗАПРОСОВ (формат Prometheus, эндпоинт /metrics) ===
+# MetricsMiddleware — чистое ASGI-middleware: для каждого маршрута считает
+# число запросов по статусам, гистограммы времени ответа, размеров запроса и ответа
+# и времени сериализации, а также число запросов в обработке.
+#
+# Накладные расходы малы, поэтому метрики можно держать включёнными:
+# - гистограммы заранее разбиты на корзины, наблюдение — двоичный поиск и += 1;
+# - блокировок нет: метрики меняются только в потоке цикла событий,
+#   где операции не прерываются посередине;
+# - маршрут — шаблон пути (/api/contacts/{contact_id}), а не сам URL,
+#   поэтому число рядов метрик не растёт с числом контактов.
+# Каждый воркер uvicorn считает свои метрики; Prometheus собирает их с каждого процесса.
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from fastapi import Response
+
+# Границы корзин (верхние, включительно), как в стандартных клиентах Prometheus
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# Квантили, которые дополнительно оцениваются по корзинам гистограммы времени ответа
+QUANTILES = (0.5, 0.95, 0.99)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Накопитель времени сериализации текущего запроса (заводится middleware)
+_serialization_time: ContextVar[Optional[List[float]]] = ContextVar("serialization_time", default=None)
+
+
+class Histogram:
+    """Гистограмма с фиксированными корзинами: счётчики корзин, сумма и число наблюдений."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        # Последняя корзина — +Inf
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Оценивает квантиль по корзинам (линейная интерполяция, как histogram_quantile в PromQL).
+
+        Для значений в корзине +Inf возвращает верхнюю конечную границу.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.bounds[-1]
+
+
+class RouteMetrics:
+    """Метрики одного маршрута (метод + шаблон пути)."""
+
+    __slots__ = ("latency", "request_size", "response_size", "serialization", "statuses")
+
+    def __init__(self) -> None:
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.request_size = Histogram(SIZE_BUCKETS)
+        self.response_size = Histogram(SIZE_BUCKETS)
+        self.serialization = Histogram(LATENCY_BUCKETS)
+        self.statuses: Dict[int, int] = {}
+
+
+class MetricsRegistry:
+    """Все метрики процесса."""
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.in_flight = 0
+
+    def route(self, method: str, path: str) -> RouteMetrics:
+        key = (method, path)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        return metrics
+
+    def render(self) -> str:
+        """Текст метрик в формате Prometheus (text exposition format 0.0.4)."""
+        lines = [
+            "# HELP http_requests_in_flight Запросы, которые сейчас обрабатываются.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {self.in_flight}",
+            "# HELP http_requests_total Обработанные запросы.",
+            "# TYPE http_requests_total counter",
+        ]
+        routes = sorted(self.routes.items())
+        for (method, path), metrics in routes:
+            for status_code, count in sorted(metrics.statuses.items()):
+                lines.append(
+                    f'http_requests_total{{{_labels(method, path)},status="{status_code}"}} {count}'
+                )
+
+        histograms = (
+            ("http_request_duration_seconds", "Время ответа.", "latency"),
+            ("http_request_size_bytes", "Размер тела запроса.", "request_size"),
+            ("http_response_size_bytes", "Размер тела ответа.", "response_size"),
+            ("http_response_serialization_seconds", "Время сериализации ответа.", "serialization"),
+        )
+        for name, help_text, attribute in histograms:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for (method, path), metrics in routes:
+                lines += _histogram_lines(name, _labels(method, path), getattr(metrics, attribute))
+
+        name = "http_request_duration_quantile_seconds"
+        lines += [
+            f"# HELP {name} Квантили времени ответа, оценённые по корзинам гистограммы.",
+            f"# TYPE {name} gauge",
+        ]
+        for (method, path), metrics in routes:
+            for q in QUANTILES:
+                value = metrics.latency.quantile(q)
+                lines.append(f'{name}{{{_labels(method, path)},quantile="{q}"}} {value:.6f}')
+        return "\n".join(lines) + "\n"
+
+
+def _labels(method: str, path: str) -> str:
+    path = path.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",route="{path}"'
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+registry = MetricsRegistry()
+
+
+@contextmanager
+def serialization_timer() -> Iterator[None]:
+    """Добавляет время выполнения блока ко времени сериализации текущего запроса."""
+    accumulator = _serialization_time.get()
+    if accumulator is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        accumulator[0] += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """ASGI-middleware, которое записывает метрики каждого HTTP-запроса в registry."""
+
+    def __init__(self, app, registry: MetricsRegistry = registry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        started = time.perf_counter()
+        status_code = 500
+        response_size = 0
+        serialization = [0.0]
+        token = _serialization_time.set(serialization)
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        registry.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            registry.in_flight -= 1
+            _serialization_time.reset(token)
+            # Роутер FastAPI кладёт найденный маршрут в scope; без него — общий ряд
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "<unmatched>"
+            metrics = registry.route(scope["method"], path)
+            metrics.latency.observe(time.perf_counter() - started)
+            metrics.statuses[status_code] = metrics.statuses.get(status_code, 0) + 1
+            metrics.request_size.observe(_content_length(scope))
+            metrics.response_size.observe(response_size)
+            metrics.serialization.observe(serialization[0])
+
+
+def _content_length(scope) -> int:
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+def metrics_response() -> Response:
+    """Ответ эндпоинта /metrics."""
+    return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,22 @@
+# === МОДЕЛИ БД ===
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.db import Base
+
+
+class ContactRecord(Base):
+    """Контакт телефонного справочника (таблица contacts)."""
+
+    __tablename__ = "contacts"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # уникальный ID (выдаёт БД)
+    name = Column(String(100), nullable=False)
+    phone = Column(String(20), nullable=False)
+    email = Column(String, nullable=True)
+    notes = Column(String(500), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    def __repr__(self):
+        return f"<ContactRecord(id={self.id}, name='{self.name}')>"
@@ -0,0 +1,81 @@
+# === ПАГИНАЦИЯ ПО КУРСОРУ И ВЫБОР ПОЛЕЙ ===
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from fastapi import HTTPException, Request, status
+
+# Поля контакта, которые можно запросить через fields= (в том же порядке, что и в модели Contact)
+CONTACT_FIELDS = ("name", "phone", "email", "notes", "id", "created_at")
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Кодирует позицию в списке (ID последнего выданного контакта) в непрозрачный курсор.
+
+    Клиент не должен разбирать курсор — только передавать его обратно.
+    """
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Возвращает ID, после которого продолжать выдачу (0 — с начала)."""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Некорректный курсор")
+
+
+def parse_fields(fields: Optional[str]) -> Sequence[str]:
+    """
+    Разбирает параметр fields=name,phone в список полей.
+
+    Без параметра возвращаются все поля. Неизвестное поле — ошибка 400.
+    """
+    if not fields:
+        return CONTACT_FIELDS
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in CONTACT_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Неизвестные поля: {', '.join(unknown)}. Доступны: {', '.join(CONTACT_FIELDS)}",
+        )
+    # Порядок — как в CONTACT_FIELDS, без повторов
+    return tuple(field for field in CONTACT_FIELDS if field in requested)
+
+
+def rows_to_dicts(rows: Iterable[Any], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Превращает строки выборки в словари для JSON без повторной проверки pydantic.
+
+    Даты сериализуются так же, как их выдаёт модель Contact (ISO 8601).
+    """
+    items = []
+    for row in rows:
+        item = {}
+        for field in fields:
+            value = getattr(row, field)
+            item[field] = value.isoformat() if isinstance(value, datetime) else value
+        items.append(item)
+    return items
+
+
+def page_headers(request: Request, next_cursor: Optional[str]) -> Dict[str, str]:
+    """
+    Заголовки со ссылкой на следующую страницу.
+
+    X-Next-Cursor — курсор для параметра cursor=, Link — готовый URL (rel="next").
+    Если страниц больше нет, заголовков нет.
+    """
+    if next_cursor is None:
+        return {}
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    return {"X-Next-Cursor": next_cursor, "Link": f'<{next_url}>; rel="next"'}
@@ -0,0 +1,112 @@
+# === РЕПОЗИТОРИЙ КОНТАКТОВ: весь доступ к БД для роутера ===
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import response_cache
+from app.models import ContactRecord
+
+
+class ContactRepository:
+    """
+    Операции с контактами поверх асинхронной сессии SQLAlchemy.
+
+    Роутер не знает про SQL: он получает репозиторий через зависимость
+    и вызывает его методы. Чтение, изменение и удаление одного контакта
+    идут по первичному ключу — время не зависит от числа контактов.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def page(
+        self, after_id: int, limit: int, fields: Sequence[str], conditions: Sequence[Any] = ()
+    ) -> Tuple[List[Any], Optional[int]]:
+        """
+        Возвращает страницу контактов с ID больше after_id (keyset-пагинация).
+
+        Запрос идёт по первичному ключу (WHERE id > ? ORDER BY id LIMIT ?), поэтому
+        стоимость страницы не зависит от её номера. Выбираются только колонки из fields.
+
+        :param conditions: дополнительные условия WHERE (например, из app/search.py)
+        :return: (строки страницы, ID последней строки или None, если это последняя страница)
+        """
+        columns = [getattr(ContactRecord, field) for field in fields]
+        if "id" not in fields:
+            columns.append(ContactRecord.id)
+        query = (
+            select(*columns)
+            .where(ContactRecord.id > after_id, *conditions)
+            .order_by(ContactRecord.id)
+            .limit(limit + 1)  # одна лишняя строка — чтобы узнать, есть ли следующая страница
+        )
+        rows = list((await self.session.execute(query)).all())
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, rows[-1].id
+
+    async def count(self, conditions: Sequence[Any], limit: int) -> int:
+        """
+        Считает контакты, подходящие под условия, но не больше limit.
+
+        Ограничение не даёт подсчёту пройти всю таблицу, если совпадений очень много.
+        """
+        matches = select(ContactRecord.id).where(*conditions).limit(limit).subquery()
+        return (await self.session.execute(select(func.count()).select_from(matches))).scalar_one()
+
+    async def version(self) -> Optional[int]:
+        """
+        Возвращает версию коллекции контактов (растёт при каждом изменении).
+
+        :return: номер версии или None, если версия не ведётся (не SQLite)
+        """
+        if not response_cache.versioning_enabled:
+            return None
+        return (await self.session.execute(response_cache.VERSION_QUERY)).scalar_one()
+
+    async def get(self, contact_id: int) -> Optional[ContactRecord]:
+        """Возвращает контакт по первичному ключу или None."""
+        return await self.session.get(ContactRecord, contact_id)
+
+    async def create(self, data: Dict[str, Any]) -> ContactRecord:
+        """Создаёт контакт; ID и дату создания заполняет БД."""
+        contact = ContactRecord(**data)
+        self.session.add(contact)
+        await self.session.commit()
+        return contact
+
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Вставляет пачку контактов одним INSERT (executemany) в одной транзакции.
+
+        :return: число вставленных контактов
+        """
+        await self.session.execute(insert(ContactRecord), rows)
+        await self.session.commit()
+        return len(rows)
+
+    async def update(self, contact_id: int, data: Dict[str, Any]) -> Optional[ContactRecord]:
+        """
+        Меняет переданные поля контакта.
+
+        :return: обновлённый контакт или None, если контакта нет
+        """
+        contact = await self.session.get(ContactRecord, contact_id)
+        if contact is None:
+            return None
+        for field, value in data.items():
+            setattr(contact, field, value)
+        await self.session.commit()
+        return contact
+
+    async def delete(self, contact_id: int) -> bool:
+        """
+        Удаляет контакт одним запросом DELETE по первичному ключу.
+
+        :return: True, если контакт был
+        """
+        result = await self.session.execute(delete(ContactRecord).where(ContactRecord.id == contact_id))
+        await self.session.commit()
+        return result.rowcount > 0
@@ -0,0 +1,135 @@
+# === КЭШ ОТВЕТОВ API КОНТАКТОВ С ВЕРСИЕЙ КОЛЛЕКЦИИ ===
+# Версия коллекции — счётчик в таблице contacts_version. Его увеличивают триггеры
+# на любую вставку, изменение и удаление контакта, поэтому версию видят все воркеры
+# uvicorn и она растёт даже при массовом импорте в обход репозитория.
+#
+# Готовый ответ хранится вместе с версией, при которой он построен. Пока версия
+# не изменилась, повторный запрос отдаётся из кэша без обращения к таблице контактов
+# и без сериализации, а запрос с актуальным If-None-Match получает 304 без тела.
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.http_cache import is_not_modified, make_etag, not_modified
+
+VERSION_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS contacts_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO contacts_version (id, version) VALUES (1, 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_version_ai AFTER INSERT ON contacts BEGIN
+        UPDATE contacts_version SET version = version + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_version_au AFTER UPDATE ON contacts BEGIN
+        UPDATE contacts_version SET version = version + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_version_ad AFTER DELETE ON contacts BEGIN
+        UPDATE contacts_version SET version = version + 1 WHERE id = 1;
+    END
+    """,
+]
+
+VERSION_QUERY = text("SELECT version FROM contacts_version WHERE id = 1")
+
+# Предел памяти под тела ответов (на один процесс)
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Включается в init_versioning (нужен SQLite); без него ответы не кэшируются
+versioning_enabled = False
+
+
+def init_versioning(sync_conn) -> bool:
+    """
+    Создаёт счётчик версии и триггеры (вызывается из init_db через run_sync).
+
+    :return: True, если кэширование ответов доступно
+    """
+    global versioning_enabled
+    try:
+        for statement in VERSION_SCHEMA:
+            sync_conn.execute(text(statement))
+    except OperationalError:
+        versioning_enabled = False
+        return False
+    versioning_enabled = True
+    return True
+
+
+class ResponseCache:
+    """
+    LRU-кэш готовых ответов: URL запроса → (версия коллекции, тело, заголовки).
+
+    Ключ — полный URL: в нём путь и параметры, а также хост, от которого зависят
+    ссылки в заголовке Link. Объём ограничен суммарным размером тел.
+    """
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items: "OrderedDict[str, Tuple[int, bytes, Dict[str, str]]]" = OrderedDict()
+
+    def lookup(self, request: Request, version: Optional[int]) -> Optional[Response]:
+        """
+        Возвращает ответ из кэша (или 304), если он построен при той же версии.
+
+        :return: готовый ответ или None — тогда ответ нужно построить и передать в store
+        """
+        if version is None:
+            return None
+        entry = self._items.get(str(request.url))
+        if entry is None or entry[0] != version:
+            return None
+        self._items.move_to_end(str(request.url))
+        _, body, headers = entry
+        if is_not_modified(request, headers["ETag"]):
+            return not_modified(headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    def store(self, request: Request, version: Optional[int], response: Response) -> Response:
+        """
+        Добавляет к ответу ETag, запоминает его и возвращает (или 304, если ETag совпал).
+
+        :param response: построенный ответ с готовым телом (JSONResponse, Response)
+        """
+        if version is None:
+            return response
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in ("content-length", "content-type")
+        }
+        # Заголовки (X-Total-Count, Link) — тоже часть ответа, поэтому входят в ETag
+        meta = "\n".join(f"{name}: {value}" for name, value in sorted(headers.items()))
+        headers["ETag"] = make_etag(response.body + meta.encode("utf-8"))
+        headers["Cache-Control"] = "no-cache"
+        key = str(request.url)
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.size -= len(old[1])
+        if len(response.body) <= self.max_bytes:
+            self._items[key] = (version, response.body, headers)
+            self.size += len(response.body)
+            while self.size > self.max_bytes:
+                _, (_, body, _) = self._items.popitem(last=False)
+                self.size -= len(body)
+        if is_not_modified(request, headers["ETag"]):
+            return not_modified(headers)
+        return Response(response.body, media_type="application/json", headers=headers)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.size = 0
+
+
+response_cache = ResponseCache()
@@ -1,8 +1,27 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bulk import NDJSON_TYPES, import_contacts, iter_rows
+from app.db import get_session
+from app.export import MEDIA_TYPES, export_contacts
+from app.fast_json import contact_response, record_response, rows_response
+from app.pagination import (
+    CONTACT_FIELDS,
+    DEFAULT_LIMIT,
+    MAX_LIMIT,
+    decode_cursor,
+    encode_cursor,
+    page_headers,
+    parse_fields,
+)
+from app.repository import ContactRepository
+from app.response_cache import response_cache
+from app.search import COUNT_LIMIT, search_conditions
 
 router = APIRouter()
 
@@ -25,6 +44,37 @@ class ContactCreate(ContactBase):
     pass
 
 
+class ContactUpdate(ContactBase):
+    """Модель для полной замены контакта (PUT)"""
+
+    pass
+
+
+class ContactPatch(BaseModel):
+    """Модель для частичного изменения контакта (PATCH): передаются только меняемые поля"""
+
+    # Имя и телефон нельзя обнулить — тип str, а не Optional[str]
+    name: str = Field(None, min_length=1, max_length=100, description="Имя контакта")
+    phone: str = Field(None, min_length=10, max_length=20, description="Номер телефона")
+    email: Optional[str] = Field(None, description="Email адрес")
+    notes: Optional[str] = Field(None, max_length=500, description="Заметки")
+
+
+class BulkRowError(BaseModel):
+    """Ошибка в одной строке массового импорта"""
+
+    row: int = Field(..., description="Номер строки (элемента массива) с 1")
+    errors: List[dict] = Field(..., description="Ошибки: поле и сообщение")
+
+
+class BulkResult(BaseModel):
+    """Итог массового импорта"""
+
+    created: int
+    failed: int
+    errors: List[BulkRowError]
+
+
 class Contact(ContactBase):
     """Модель контакта с ID и датой создания"""
 
@@ -35,62 +85,232 @@ class Contact(ContactBase):
         from_attributes = True
 
 
-# ==================== Временное хранилище ====================
+# ==================== Хранилище ====================
+# Контакты хранятся в БД (app/db.py), поэтому переживают перезапуск
+# и доступны всем воркерам uvicorn.
 
-contacts_db: List[Contact] = []
-next_id = 1
+
+def get_repository(session: AsyncSession = Depends(get_session)) -> ContactRepository:
+    """Зависимость: репозиторий контактов поверх сессии текущего запроса."""
+    return ContactRepository(session)
+
+
+def _not_found(contact_id: int) -> HTTPException:
+    """Ошибка 404 для несуществующего контакта."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Контакт с ID {contact_id} не найден",
+    )
 
 
 # ==================== API Endpoints ====================
 
 
 @router.get("/", response_model=List[Contact], tags=["Контакты"])
-async def get_all_contacts():
+async def get_all_contacts(
+    request: Request,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Сколько контактов вернуть"),
+    cursor: Optional[str] = Query(None, description="Курсор из заголовка X-Next-Cursor предыдущего ответа"),
+    fields: Optional[str] = Query(
+        None, description=f"Какие поля вернуть, через запятую: {', '.join(CONTACT_FIELDS)}"
+    ),
+    repository: ContactRepository = Depends(get_repository),
+):
+    """
+    📋 Получить список контактов (постранично)
+
+    Возвращает не больше `limit` контактов в порядке создания.
+    Если есть следующая страница, в ответе есть заголовки `X-Next-Cursor`
+    (передайте его в `cursor=`) и `Link` с готовым URL.
+    `fields=name,phone` вернёт только указанные поля.
+
+    Ответ содержит `ETag`: если контакты не менялись, запрос с `If-None-Match` получит 304.
     """
-    📋 Получить список всех контактов
+    selected = parse_fields(fields)
+    after_id = decode_cursor(cursor)
+    version = await repository.version()
+    cached = response_cache.lookup(request, version)
+    if cached is not None:
+        return cached
+    rows, last_id = await repository.page(after_id, limit, selected)
+    next_cursor = encode_cursor(last_id) if last_id is not None else None
+    # Строки из БД уже корректны — отдаём их без повторной проверки через response_model
+    response = rows_response(rows, selected, page_headers(request, next_cursor))
+    return response_cache.store(request, version, response)
 
-    Возвращает полный список контактов из справочника.
+
+@router.get("/export", tags=["Контакты"], response_class=StreamingResponse)
+async def export_all_contacts(
+    format: Literal["csv", "ndjson"] = Query("csv", description="Формат файла: csv или ndjson"),
+):
     """
-    return contacts_db
+    📤 Выгрузить все контакты
+
+    Отдаёт файл потоково: память сервера не растёт с числом контактов.
+    Колонки — как в файле настольного справочника: ID, Имя, Телефон, Email, Комментарий.
+    """
+    return StreamingResponse(
+        export_contacts(format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="contacts.{format}"'},
+    )
+
+
+# Объявлены раньше /{contact_id}, иначе "export" и "search" разбирались бы как ID
+@router.get("/search", response_model=List[Contact], tags=["Контакты"])
+async def search_contacts(
+    request: Request,
+    q: str = Query("", description="Подстрока в любом поле (имя, телефон, email, заметки)"),
+    name: str = Query("", description="Подстрока в имени"),
+    phone: str = Query("", description="Подстрока в телефоне"),
+    email: str = Query("", description="Подстрока в email"),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Сколько контактов вернуть"),
+    cursor: Optional[str] = Query(None, description="Курсор из заголовка X-Next-Cursor предыдущего ответа"),
+    fields: Optional[str] = Query(
+        None, description=f"Какие поля вернуть, через запятую: {', '.join(CONTACT_FIELDS)}"
+    ),
+    repository: ContactRepository = Depends(get_repository),
+):
+    """
+    🔍 Найти контакты
+
+    Поиск подстроки без учёта регистра, как в настольном справочнике:
+    `q` ищется во всех полях, а `name`, `phone`, `email` — каждое в своём поле
+    (все заданные условия должны выполняться). Подстроки от трёх символов ищутся
+    по триграммному индексу FTS5. Без условий возвращаются все контакты.
+
+    Страницы — как у списка контактов (`limit`, `cursor`, `fields`).
+    На первой странице заголовок `X-Total-Count` содержит число совпадений;
+    если их больше 10 000, это нижняя оценка и добавляется `X-Total-Count-Capped: true`.
+    """
+    selected = parse_fields(fields)
+    after_id = decode_cursor(cursor)
+    version = await repository.version()
+    cached = response_cache.lookup(request, version)
+    if cached is not None:
+        return cached
+    conditions = search_conditions(q, {"name": name, "phone": phone, "email": email})
+    rows, last_id = await repository.page(after_id, limit, selected, conditions)
+    next_cursor = encode_cursor(last_id) if last_id is not None else None
+    headers = page_headers(request, next_cursor)
+    if cursor is None:
+        # Считаем один раз — на первой странице; дальше клиент уже знает оценку
+        total = await repository.count(conditions, COUNT_LIMIT + 1)
+        headers["X-Total-Count"] = str(min(total, COUNT_LIMIT))
+        if total > COUNT_LIMIT:
+            headers["X-Total-Count-Capped"] = "true"
+    return response_cache.store(request, version, rows_response(rows, selected, headers))
 
 
 @router.get("/{contact_id}", response_model=Contact, tags=["Контакты"])
-async def get_contact(contact_id: int):
+async def get_contact(
+    contact_id: int, request: Request, repository: ContactRepository = Depends(get_repository)
+):
     """
     👤 Получить контакт по ID
 
     Возвращает подробную информацию о конкретном контакте.
+    Ответ содержит `ETag`: если контакты не менялись, запрос с `If-None-Match` получит 304.
     """
-    contact = next((c for c in contacts_db if c.id == contact_id), None)
+    version = await repository.version()
+    cached = response_cache.lookup(request, version)
+    if cached is not None:
+        return cached
+    contact = await repository.get(contact_id)
     if not contact:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Контакт с ID {contact_id} не найден",
-        )
-    return contact
+        raise _not_found(contact_id)
+    return response_cache.store(request, version, record_response(contact))
 
 
 @router.post(
     "/", response_model=Contact, status_code=status.HTTP_201_CREATED, tags=["Контакты"]
 )
-async def create_contact(contact_data: ContactCreate):
+async def create_contact(
+    contact_data: ContactCreate, repository: ContactRepository = Depends(get_repository)
+):
     """
     ➕ Создать новый контакт
 
     Добавляет новый контакт в телефонный справочник.
     """
-    global next_id
+    contact = await repository.create(contact_data.model_dump())
+    return contact_response(contact, status_code=status.HTTP_201_CREATED)
 
-    new_contact = Contact(
-        id=next_id,
-        name=contact_data.name,
-        phone=contact_data.phone,
-        email=contact_data.email,
-        notes=contact_data.notes,
-        created_at=datetime.now(),
-    )
 
-    contacts_db.append(new_contact)
-    next_id += 1
+@router.post(
+    "/bulk",
+    response_model=BulkResult,
+    tags=["Контакты"],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/ContactCreate"}}
+                },
+                **{content_type: {"schema": {"type": "string"}} for content_type in NDJSON_TYPES},
+            },
+        }
+    },
+)
+async def bulk_create_contacts(
+    request: Request,
+    chunk_size: int = Query(1000, ge=1, le=10000, description="Сколько контактов вставлять за одну транзакцию"),
+    repository: ContactRepository = Depends(get_repository),
+):
+    """
+    📦 Массово создать контакты
+
+    Тело — JSON-массив контактов или NDJSON (`Content-Type: application/x-ndjson`,
+    по одному контакту в строке; читается потоково). Строки проверяются как в
+    `POST /api/contacts/` и вставляются пачками по `chunk_size`, по одной транзакции на пачку.
+    Некорректные строки не прерывают импорт: они перечислены в `errors` с номером строки.
+    """
+    return await import_contacts(iter_rows(request), ContactCreate, repository, chunk_size)
+
+
+@router.put("/{contact_id}", response_model=Contact, tags=["Контакты"])
+async def replace_contact(
+    contact_id: int,
+    contact_data: ContactUpdate,
+    repository: ContactRepository = Depends(get_repository),
+):
+    """
+    ✏️ Заменить контакт
+
+    Перезаписывает все поля контакта переданными значениями.
+    """
+    contact = await repository.update(contact_id, contact_data.model_dump())
+    if not contact:
+        raise _not_found(contact_id)
+    return contact_response(contact)
+
+
+@router.patch("/{contact_id}", response_model=Contact, tags=["Контакты"])
+async def patch_contact(
+    contact_id: int,
+    contact_data: ContactPatch,
+    repository: ContactRepository = Depends(get_repository),
+):
+    """
+    🩹 Изменить часть полей контакта
+
+    Меняет только переданные поля, остальные остаются прежними.
+    """
+    contact = await repository.update(contact_id, contact_data.model_dump(exclude_unset=True))
+    if not contact:
+        raise _not_found(contact_id)
+    return contact_response(contact)
+
+
+@router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Контакты"])
+async def delete_contact(contact_id: int, repository: ContactRepository = Depends(get_repository)):
+    """
+    🗑️ Удалить контакт
+
+    Удаляет контакт из справочника.
+    """
+    if not await repository.delete(contact_id):
+        raise _not_found(contact_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-    return new_contact
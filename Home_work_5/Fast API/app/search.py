@@ -0,0 +1,121 @@
+# === ПОЛНОТЕКСТОВЫЙ ПОИСК ПО КОНТАКТАМ (SQLite FTS5, триграммы) ===
+# Тот же подход, что в Home_work_3 (model/sqlite_storage.py): внешняя FTS5-таблица
+# с токенизатором trigram, синхронизируемая триггерами. Подстроки от трёх символов
+# ищутся по индексу, короче — сравнением в SQL (py_lower регистрируется в app/db.py).
+from typing import Dict, List, Optional
+
+from sqlalchemy import column, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models import ContactRecord
+
+FTS_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE contacts_fts USING fts5(
+        name, phone, email, notes,
+        content='contacts', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_ai AFTER INSERT ON contacts BEGIN
+        INSERT INTO contacts_fts(rowid, name, phone, email, notes)
+        VALUES (new.id, new.name, new.phone, new.email, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_ad AFTER DELETE ON contacts BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, name, phone, email, notes)
+        VALUES ('delete', old.id, old.name, old.phone, old.email, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_au AFTER UPDATE ON contacts BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, name, phone, email, notes)
+        VALUES ('delete', old.id, old.name, old.phone, old.email, old.notes);
+        INSERT INTO contacts_fts(rowid, name, phone, email, notes)
+        VALUES (new.id, new.name, new.phone, new.email, new.notes);
+    END
+    """,
+]
+
+# Поля, по которым ищет общий запрос q (как ContactStorage.search_contacts)
+SEARCH_COLUMNS = ("name", "phone", "email", "notes")
+
+# Столько совпадений считается для X-Total-Count; дальше — оценка "не меньше"
+COUNT_LIMIT = 10000
+
+# Включается в init_search, если SQLite собран с FTS5 и токенизатором trigram (3.34+)
+fts_enabled = False
+
+
+def init_search(sync_conn) -> bool:
+    """
+    Создаёт полнотекстовый индекс и триггеры (вызывается из init_db через run_sync).
+
+    Если индекс создаётся впервые, в него загружаются уже существующие контакты.
+    :return: True, если полнотекстовый поиск доступен
+    """
+    global fts_enabled
+    exists = sync_conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'contacts_fts'")
+    ).first()
+    try:
+        if not exists:
+            for statement in FTS_SCHEMA:
+                sync_conn.execute(text(statement))
+            sync_conn.execute(text("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')"))
+        else:
+            for statement in FTS_SCHEMA[1:]:
+                sync_conn.execute(text(statement))
+    except OperationalError:
+        # Старый SQLite без FTS5/trigram: поиск будет работать сравнением подстрок
+        fts_enabled = False
+        return False
+    fts_enabled = True
+    return True
+
+
+def _fts_phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def search_conditions(q: str = "", criteria: Optional[Dict[str, str]] = None) -> List[ColumnElement]:
+    """
+    Строит условия WHERE для поиска.
+
+    :param q: подстрока, которая должна встретиться хотя бы в одном поле
+    :param criteria: колонка → подстрока; каждое заполненное поле должно содержать свою подстроку
+    :return: список условий (все должны выполняться); пустой — если искать нечего
+    """
+    criteria = {field: value.lower() for field, value in (criteria or {}).items() if value}
+    q = q.lower()
+    conditions: List[ColumnElement] = []
+    fts_terms = []
+
+    if q:
+        if fts_enabled and len(q) >= 3:
+            fts_terms.append("{" + " ".join(SEARCH_COLUMNS) + "} : " + _fts_phrase(q))
+        # Проверка подстроки без учёта регистра (в том числе кириллицы) — для коротких запросов
+        # это основной фильтр, для длинных — уточнение кандидатов из индекса
+        conditions.append(
+            text(" OR ".join(f"instr(py_lower(coalesce({name}, '')), :q) > 0" for name in SEARCH_COLUMNS))
+            .bindparams(q=q)
+            .self_group()
+        )
+    for name, value in criteria.items():
+        if fts_enabled and len(value) >= 3:
+            fts_terms.append(f"{name} : {_fts_phrase(value)}")
+        param = f"value_{name}"
+        conditions.append(
+            text(f"instr(py_lower(coalesce({name}, '')), :{param}) > 0").bindparams(**{param: value})
+        )
+
+    if fts_terms:
+        match = (
+            text("SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH :match")
+            .bindparams(match=" AND ".join(fts_terms))
+            .columns(column("rowid"))
+        )
+        conditions.insert(0, ContactRecord.id.in_(match))
+    return conditions
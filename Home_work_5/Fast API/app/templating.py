@@ -0,0 +1,76 @@
+# === ОБЩЕЕ ОКРУЖЕНИЕ ШАБЛОНОВ И КЭШ СТАТИЧЕСКИХ СТРАНИЦ ===
+# Одно окружение Jinja2 на всё приложение:
+# - скомпилированные шаблоны хранятся в памяти и не перепроверяются на диске (auto_reload=False);
+# - байт-код шаблонов кэшируется на диске, поэтому новые воркеры не компилируют их заново.
+#   Каталог кэша принадлежит приложению (CONTACTS_TEMPLATE_CACHE_DIR, по умолчанию .cache/jinja2
+#   рядом с app/), а не общий системный каталог временных файлов.
+# Страницы с неизменным контекстом рендерятся один раз и отдаются из кэша
+# с ETag и Last-Modified; повторный запрос браузера получает 304 без тела.
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import jinja2
+from fastapi import Request, Response
+from fastapi.templating import Jinja2Templates
+
+from app.http_cache import http_date, is_not_modified, make_etag, not_modified
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+TEMPLATE_CACHE_DIR = Path(
+    os.getenv("CONTACTS_TEMPLATE_CACHE_DIR", Path(__file__).parent.parent / ".cache" / "jinja2")
+)
+
+# Сколько отрендеренных страниц держать (ключ включает адрес сайта — от него зависят ссылки url_for)
+PAGE_CACHE_SIZE = 64
+
+TEMPLATE_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR)),
+    )
+)
+
+# (шаблон, базовый URL) → (тело страницы, заголовки, время изменения шаблонов)
+_pages: "OrderedDict[Tuple[str, str], Tuple[bytes, Dict[str, str], float]]" = OrderedDict()
+
+
+def _templates_mtime() -> float:
+    """Время последнего изменения шаблонов — значение Last-Modified страниц."""
+    return max(path.stat().st_mtime for path in TEMPLATES_DIR.glob("*.html"))
+
+
+def static_page(request: Request, name: str, context: Dict[str, Any]) -> Response:
+    """
+    Отдаёт страницу, контекст которой не зависит от запроса, из кэша.
+
+    :param name: имя шаблона
+    :param context: контекст шаблона (без request — он подставляется сам);
+        должен быть одинаковым при каждом вызове
+    """
+    key = (name, str(request.base_url))
+    page = _pages.get(key)
+    if page is None:
+        body = templates.get_template(name).render({"request": request, **context}).encode("utf-8")
+        modified = _templates_mtime()
+        headers = {
+            "ETag": make_etag(body),
+            "Last-Modified": http_date(modified),
+            # Браузер может хранить копию, но перед показом переспрашивает сервер
+            "Cache-Control": "no-cache",
+        }
+        page = _pages[key] = (body, headers, modified)
+        if len(_pages) > PAGE_CACHE_SIZE:
+            _pages.popitem(last=False)
+    else:
+        _pages.move_to_end(key)
+
+    body, headers, modified = page
+    if is_not_modified(request, headers["ETag"], modified):
+        return not_modified(headers)
+    return Response(body, media_type="text/html", headers=headers)
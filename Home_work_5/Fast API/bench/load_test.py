@@ -0,0 +1,367 @@
+# === НАГРУЗОЧНЫЙ ТЕСТ API КОНТАКТОВ ===
+# Поднимает приложение на временной БД, заполняет её контактами и гоняет смешанную
+# нагрузку (чтение страниц, чтение по ID, поиск, создание, изменение, удаление)
+# заданным числом параллельных асинхронных клиентов httpx. Печатает RPS и квантили
+# времени ответа по каждой операции.
+#
+# Режимы:
+#   inprocess — приложение вызывается напрямую через ASGI (без сети и uvicorn);
+#               клиент и сервер делят один цикл событий, поэтому цифры — для сравнения
+#               версий кода между собой, а не оценка реальной ёмкости;
+#   uvicorn   — настоящий сервер на localhost (можно с несколькими воркерами).
+#
+# Базовые результаты сохраняются в bench/baselines/<имя>.json; с --compare прогон
+# сравнивается с базой, и при просадке больше допуска скрипт завершается с кодом 1.
+#
+# Запуск из папки "Fast API":
+#   python bench/load_test.py --duration 10 --concurrency 32 --save-baseline local
+#   python bench/load_test.py --duration 10 --concurrency 32 --compare local
+#   python bench/load_test.py --mode uvicorn --workers 4 --mix list=80,get=20
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+BASELINES_DIR = Path(__file__).resolve().parent / "baselines"
+
+DEFAULT_MIX = "list=40,get=30,search=15,create=8,update=5,delete=2"
+OPERATIONS = ("list", "get", "search", "create", "update", "delete")
+
+# Операции с меньшим числом запросов в прогоне не сравниваются с базой по отдельности:
+# на малой выборке квантили слишком шумят
+MIN_COMPARED_REQUESTS = 200
+
+SEARCH_WORDS = ("Иван", "Петр", "Анна", "Мария", "Олег", "Елена", "Сергей", "Ольга")
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """Разбирает долю операций вида "list=40,get=30" (веса, не обязательно в сумме 100)."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Неизвестная операция: {name} (есть {', '.join(OPERATIONS)})")
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("Нужна хотя бы одна операция с ненулевым весом")
+    return mix
+
+
+def make_contact(number: int) -> Dict[str, str]:
+    word = SEARCH_WORDS[number % len(SEARCH_WORDS)]
+    return {
+        "name": f"{word} Тестов {number}",
+        "phone": f"+7{number:010d}",
+        "email": f"user{number}@example.ru",
+        "notes": "нагрузочный тест",
+    }
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Квантиль по отсортированному списку (метод ближайшего ранга: ранг ceil(q * n))."""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, math.ceil(q * len(values)) - 1))
+    return values[index]
+
+
+class Workload:
+    """Смешанная нагрузка: выбирает операцию по весам и выполняет её."""
+
+    def __init__(self, client: httpx.AsyncClient, mix: Dict[str, int], seeded: int, seed: int) -> None:
+        self.client = client
+        self.operations = [name for name, weight in mix.items() if weight > 0]
+        self.weights = [mix[name] for name in self.operations]
+        self.random = random.Random(seed)
+        # ID, которые заведомо существуют (созданные при заполнении и во время теста)
+        self.ids = list(range(1, seeded + 1))
+        self.next_number = seeded + 1
+        self.cursors: List[str] = []
+
+    async def run_one(self) -> str:
+        operation = self.random.choices(self.operations, self.weights)[0]
+        response = await getattr(self, operation)()
+        if response.status_code >= 400 and response.status_code != 404:
+            raise RuntimeError(f"{operation}: HTTP {response.status_code} {response.text[:200]}")
+        return operation
+
+    def _random_id(self) -> int:
+        return self.ids[self.random.randrange(len(self.ids))] if self.ids else 1
+
+    async def list(self) -> httpx.Response:
+        # Первая страница или продолжение ранее полученного курсора
+        params = {"limit": 100}
+        if self.cursors and self.random.random() < 0.5:
+            params["cursor"] = self.cursors.pop(self.random.randrange(len(self.cursors)))
+        response = await self.client.get("/api/contacts/", params=params)
+        cursor = response.headers.get("x-next-cursor")
+        if cursor and len(self.cursors) < 1000:
+            self.cursors.append(cursor)
+        return response
+
+    async def get(self) -> httpx.Response:
+        return await self.client.get(f"/api/contacts/{self._random_id()}")
+
+    async def search(self) -> httpx.Response:
+        word = self.random.choice(SEARCH_WORDS)
+        return await self.client.get("/api/contacts/search", params={"q": word[:3], "limit": 50})
+
+    async def create(self) -> httpx.Response:
+        number, self.next_number = self.next_number, self.next_number + 1
+        response = await self.client.post("/api/contacts/", json=make_contact(number))
+        if response.status_code == 201:
+            self.ids.append(response.json()["id"])
+        return response
+
+    async def update(self) -> httpx.Response:
+        return await self.client.patch(
+            f"/api/contacts/{self._random_id()}", json={"notes": f"изменено {time.time()}"}
+        )
+
+    async def delete(self) -> httpx.Response:
+        if not self.ids:
+            return await self.get()
+        contact_id = self.ids.pop(self.random.randrange(len(self.ids)))
+        return await self.client.delete(f"/api/contacts/{contact_id}")
+
+
+async def seed_contacts(client: httpx.AsyncClient, count: int) -> None:
+    """Заполняет БД контактами одним запросом массового импорта."""
+    if count <= 0:
+        return
+    body = "\n".join(json.dumps(make_contact(number), ensure_ascii=False) for number in range(1, count + 1))
+    response = await client.post(
+        "/api/contacts/bulk",
+        content=body.encode("utf-8"),
+        headers={"Content-Type": "application/x-ndjson"},
+        timeout=600,
+    )
+    response.raise_for_status()
+    created = response.json()["created"]
+    if created != count:
+        raise RuntimeError(f"Заполнение: создано {created} из {count}")
+
+
+async def drive(client: httpx.AsyncClient, args: argparse.Namespace) -> Dict:
+    """Гоняет нагрузку args.concurrency клиентами и возвращает результаты."""
+    await seed_contacts(client, args.contacts)
+
+    latencies: Dict[str, List[float]] = {name: [] for name in OPERATIONS}
+    errors: List[str] = []
+
+    async def worker(number: int, deadline: float, record: bool) -> None:
+        workload = Workload(client, args.mix, args.contacts, args.seed + number)
+        # У каждого клиента свой диапазон номеров создаваемых контактов (и их телефонов)
+        workload.next_number = args.contacts + 1 + number * 10_000_000
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                operation = await workload.run_one()
+            except Exception as error:  # noqa: BLE001 — ошибка запроса считается, тест продолжается
+                if record:
+                    errors.append(str(error))
+                continue
+            if record:
+                latencies[operation].append(time.perf_counter() - started)
+
+    if args.warmup > 0:
+        deadline = time.perf_counter() + args.warmup
+        await asyncio.gather(*(worker(n, deadline, False) for n in range(args.concurrency)))
+
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(worker(n, deadline, True) for n in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    return summarize(latencies, errors, elapsed, args)
+
+
+def summarize(latencies: Dict[str, List[float]], errors: List[str], elapsed: float, args) -> Dict:
+    operations = {}
+    everything: List[float] = []
+    for name, values in latencies.items():
+        if not values:
+            continue
+        values.sort()
+        everything.extend(values)
+        operations[name] = _stats(values, elapsed)
+    everything.sort()
+    return {
+        "config": {
+            "mode": args.mode,
+            "workers": args.workers,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "contacts": args.contacts,
+            "mix": args.mix,
+            "fast_json": os.getenv("CONTACTS_FAST_JSON", ""),
+        },
+        "total": _stats(everything, elapsed),
+        "operations": operations,
+        "errors": len(errors),
+        "error_samples": errors[:5],
+    }
+
+
+def _stats(values: List[float], elapsed: float) -> Dict[str, float]:
+    return {
+        "requests": len(values),
+        "rps": round(len(values) / elapsed, 1),
+        "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(values, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+    }
+
+
+async def run_inprocess(args: argparse.Namespace) -> Dict:
+    """Вызывает приложение напрямую через ASGI-транспорт httpx."""
+    sys.path.insert(0, str(PROJECT_DIR))
+    from app.main import app
+
+    # ASGITransport не запускает lifespan — запускаем его сами (создание таблиц, закрытие пула)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await drive(client, args)
+
+
+async def run_uvicorn(args: argparse.Namespace, env: Dict[str, str]) -> Dict:
+    """Запускает uvicorn на свободном порту localhost и нагружает его по HTTP."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(args.workers), "--log-level", "warning",
+    ]
+    server = subprocess.Popen(command, cwd=PROJECT_DIR, env=env)
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+            await wait_ready(client, server)
+            return await drive(client, args)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+async def wait_ready(client: httpx.AsyncClient, server: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn завершился при запуске")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("uvicorn не ответил за отведённое время")
+
+
+def print_report(result: Dict) -> None:
+    print(f"{'операция':<10}{'запросов':>10}{'RPS':>10}{'p50, мс':>10}{'p95, мс':>10}{'p99, мс':>10}")
+    rows = list(result["operations"].items()) + [("всего", result["total"])]
+    for name, stats in rows:
+        print(
+            f"{name:<10}{stats['requests']:>10}{stats['rps']:>10}"
+            f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+        )
+    if result["errors"]:
+        print(f"Ошибок: {result['errors']}; например: {result['error_samples'][0]}")
+
+
+def compare(result: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Сравнивает прогон с базой.
+
+    :param tolerance: допустимая доля ухудшения (0.25 — RPS ниже на 25% или p95 выше на 25%)
+    :return: список регрессий (пустой, если их нет)
+    """
+    regressions = []
+    pairs = [("всего", result["total"], baseline["total"])] + [
+        (name, stats, baseline["operations"][name])
+        for name, stats in result["operations"].items()
+        if name in baseline["operations"]
+        and min(stats["requests"], baseline["operations"][name]["requests"]) >= MIN_COMPARED_REQUESTS
+    ]
+    for name, current, base in pairs:
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: RPS {current['rps']} < базы {base['rps']}")
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {current['p95_ms']} мс > базы {base['p95_ms']} мс")
+    if result["errors"] > baseline["errors"]:
+        regressions.append(f"ошибок {result['errors']} (в базе {baseline['errors']})")
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Нагрузочный тест API контактов")
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--workers", type=int, default=1, help="Воркеров uvicorn (режим uvicorn)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Параллельных клиентов")
+    parser.add_argument("--duration", type=float, default=10, help="Длительность замера, с")
+    parser.add_argument("--warmup", type=float, default=2, help="Прогрев перед замером, с")
+    parser.add_argument("--contacts", type=int, default=10_000, help="Контактов в БД перед тестом")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"Веса операций ({DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=1, help="Зерно генератора случайных операций")
+    parser.add_argument("--save-baseline", metavar="ИМЯ", help="Сохранить результат как базу")
+    parser.add_argument("--compare", metavar="ИМЯ", help="Сравнить с сохранённой базой")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Допуск ухудшения для --compare")
+    parser.add_argument("--json", action="store_true", help="Вывести результат в JSON")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Отдельная БД на прогон: результаты не зависят от данных прошлых запусков
+        database_url = f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        os.environ["CONTACTS_DATABASE_URL"] = database_url
+        if args.mode == "inprocess":
+            result = asyncio.run(run_inprocess(args))
+        else:
+            result = asyncio.run(run_uvicorn(args, dict(os.environ)))
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_report(result)
+
+    if args.save_baseline:
+        BASELINES_DIR.mkdir(exist_ok=True)
+        path = BASELINES_DIR / f"{args.save_baseline}.json"
+        path.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"База сохранена: {path}")
+
+    if args.compare:
+        path = BASELINES_DIR / f"{args.compare}.json"
+        baseline = json.loads(path.read_text(encoding="utf-8"))
+        if baseline["config"] != result["config"]:
+            print("Внимание: параметры прогона отличаются от базы — сравнение может быть некорректным")
+        regressions = compare(result, baseline, args.tolerance)
+        if regressions:
+            print("Регрессии относительно базы:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("Регрессий относительно базы нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# app/db.py читает адрес БД при импорте, поэтому он задаётся до импорта приложения
+TEST_DIR = tempfile.mkdtemp(prefix="contacts_test_")
+TEST_DB = os.path.join(TEST_DIR, "contacts.db")
+os.environ["CONTACTS_DATABASE_URL"] = f"sqlite+aiosqlite:///{TEST_DB}"
+# Байт-код шаблонов — тоже во временный каталог, а не в каталог проекта
+os.environ["CONTACTS_TEMPLATE_CACHE_DIR"] = os.path.join(TEST_DIR, "jinja2")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.response_cache import response_cache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_dir():
+    """Удаляет временный каталог с БД после всех тестов."""
+    yield TEST_DIR
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def client():
+    """Клиент приложения с пустой временной БД (таблицы создаёт lifespan)."""
+    response_cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    # lifespan закрыл пул соединений — файлы БД можно удалить
+    response_cache.clear()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(TEST_DB + suffix):
+            os.remove(TEST_DB + suffix)
+
+
+def make_contact(client, name="Иван Петров", phone="+79011234567", email=None, notes=None):
+    """Создаёт контакт через API и возвращает его JSON."""
+    response = client.post(
+        "/api/contacts/", json={"name": name, "phone": phone, "email": email, "notes": notes}
+    )
+    assert response.status_code == 201
+    return response.json()
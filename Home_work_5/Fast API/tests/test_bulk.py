@@ -0,0 +1,75 @@
+import json
+
+NDJSON = {"Content-Type": "application/x-ndjson"}
+
+
+def _contact(number):
+    return {"name": f"Контакт {number}", "phone": f"+7901000{number:04d}"}
+
+
+def test_bulk_json_array(client):
+    rows = [_contact(number) for number in range(5)]
+
+    response = client.post("/api/contacts/bulk", params={"chunk_size": 2}, json=rows)
+    assert response.status_code == 200
+    assert response.json() == {"created": 5, "failed": 0, "errors": []}
+
+    contacts = client.get("/api/contacts/").json()
+    assert [(contact["name"], contact["phone"]) for contact in contacts] == [
+        (row["name"], row["phone"]) for row in rows
+    ]
+    # Одна пачка — одно время создания
+    assert contacts[0]["created_at"] == contacts[1]["created_at"]
+
+
+def test_bulk_ndjson_reports_errors_per_row(client):
+    lines = [
+        json.dumps(_contact(1), ensure_ascii=False),
+        "{не json",
+        json.dumps({"name": "Без телефона"}, ensure_ascii=False),
+        "",
+        json.dumps({"name": "Короткий", "phone": "123"}, ensure_ascii=False),
+        json.dumps(_contact(2), ensure_ascii=False),
+    ]
+    body = "\n".join(lines).encode("utf-8")
+
+    response = client.post("/api/contacts/bulk", content=body, headers=NDJSON)
+    assert response.status_code == 200
+    result = response.json()
+    assert result["created"] == 2
+    assert result["failed"] == 3
+    # Номера строк считаются с 1, пустые строки пропускаются, но учитываются в нумерации
+    assert [error["row"] for error in result["errors"]] == [2, 3, 5]
+    assert result["errors"][0]["errors"][0]["message"].startswith("Некорректный JSON")
+    assert result["errors"][1]["errors"][0]["field"] == "phone"
+    assert result["errors"][2]["errors"][0]["field"] == "phone"
+
+    names = [contact["name"] for contact in client.get("/api/contacts/").json()]
+    assert names == ["Контакт 1", "Контакт 2"]
+
+
+def test_bulk_ndjson_streamed_in_chunks(client):
+    def body():
+        # Строки разрезаны на куски произвольно — разбор не зависит от границ кусков
+        data = "".join(json.dumps(_contact(number)) + "\n" for number in range(50)).encode()
+        for start in range(0, len(data), 37):
+            yield data[start:start + 37]
+
+    response = client.post(
+        "/api/contacts/bulk", params={"chunk_size": 7}, content=body(), headers=NDJSON
+    )
+    assert response.json() == {"created": 50, "failed": 0, "errors": []}
+    response = client.get("/api/contacts/", params={"fields": "phone", "limit": 1000})
+    assert [contact["phone"] for contact in response.json()] == [_contact(number)["phone"] for number in range(50)]
+
+
+def test_bulk_rejects_bad_body(client):
+    response = client.post(
+        "/api/contacts/bulk", content=b"{oops", headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 400
+    response = client.post("/api/contacts/bulk", json=_contact(1))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Ожидается JSON-массив контактов"
+    assert client.post("/api/contacts/bulk", params={"chunk_size": 0}, json=[]).status_code == 422
+    assert client.get("/api/contacts/").json() == []
@@ -0,0 +1,90 @@
+from tests.conftest import make_contact
+
+
+def test_create_and_get(client):
+    contact = make_contact(client, email="ivan@example.com", notes="коллега")
+    assert contact["name"] == "Иван Петров"
+    assert contact["email"] == "ivan@example.com"
+    assert contact["created_at"]
+
+    response = client.get(f"/api/contacts/{contact['id']}")
+    assert response.status_code == 200
+    assert response.json() == contact
+
+
+def test_create_validation(client):
+    response = client.post("/api/contacts/", json={"name": "Иван", "phone": "123"})
+    assert response.status_code == 422
+    response = client.post("/api/contacts/", json={"phone": "+79011234567"})
+    assert response.status_code == 422
+    assert client.get("/api/contacts/").json() == []
+
+
+def test_put_replaces_all_fields(client):
+    contact = make_contact(client, email="ivan@example.com", notes="коллега")
+
+    response = client.put(
+        f"/api/contacts/{contact['id']}", json={"name": "Иван Сидоров", "phone": "+79019999999"}
+    )
+    assert response.status_code == 200
+    replaced = response.json()
+    assert replaced["name"] == "Иван Сидоров"
+    assert replaced["phone"] == "+79019999999"
+    # Не переданные поля PUT обнуляет
+    assert replaced["email"] is None
+    assert replaced["notes"] is None
+    assert replaced["id"] == contact["id"]
+    assert replaced["created_at"] == contact["created_at"]
+    assert client.get(f"/api/contacts/{contact['id']}").json() == replaced
+
+    # PUT требует все обязательные поля
+    response = client.put(f"/api/contacts/{contact['id']}", json={"name": "Только имя"})
+    assert response.status_code == 422
+
+
+def test_patch_changes_only_given_fields(client):
+    contact = make_contact(client, email="ivan@example.com", notes="коллега")
+
+    response = client.patch(f"/api/contacts/{contact['id']}", json={"notes": "друг"})
+    assert response.status_code == 200
+    patched = response.json()
+    assert patched == {**contact, "notes": "друг"}
+
+
+def test_patch_null_email_clears_it(client):
+    contact = make_contact(client, email="ivan@example.com", notes="коллега")
+
+    response = client.patch(f"/api/contacts/{contact['id']}", json={"email": None})
+    assert response.status_code == 200
+    assert response.json() == {**contact, "email": None}
+    assert client.get(f"/api/contacts/{contact['id']}").json()["email"] is None
+
+
+def test_patch_cannot_clear_required_fields(client):
+    contact = make_contact(client)
+
+    assert client.patch(f"/api/contacts/{contact['id']}", json={"name": None}).status_code == 422
+    assert client.patch(f"/api/contacts/{contact['id']}", json={"phone": "123"}).status_code == 422
+    assert client.get(f"/api/contacts/{contact['id']}").json() == contact
+
+
+def test_delete(client):
+    first = make_contact(client, "Первый", "+79011111111")
+    second = make_contact(client, "Второй", "+79012222222")
+
+    response = client.delete(f"/api/contacts/{first['id']}")
+    assert response.status_code == 204
+    assert response.content == b""
+    assert client.get(f"/api/contacts/{first['id']}").status_code == 404
+    assert client.get("/api/contacts/").json() == [second]
+
+
+def test_missing_contact_is_404(client):
+    body = {"name": "Иван", "phone": "+79011234567"}
+    assert client.get("/api/contacts/999").status_code == 404
+    assert client.put("/api/contacts/999", json=body).status_code == 404
+    assert client.patch("/api/contacts/999", json={"notes": "x"}).status_code == 404
+    response = client.delete("/api/contacts/999")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Контакт с ID 999 не найден"
+
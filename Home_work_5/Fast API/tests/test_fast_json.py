@@ -0,0 +1,98 @@
+import pytest
+
+from app import fast_json
+from app.fast_json import fast_json_enabled, row_cache
+from app.response_cache import response_cache
+from tests.conftest import make_contact
+
+
+@pytest.fixture
+def fast_mode(monkeypatch):
+    """Переключает CONTACTS_FAST_JSON между запросами одного клиента."""
+
+    def switch(enabled):
+        if enabled:
+            monkeypatch.setenv("CONTACTS_FAST_JSON", "1")
+        else:
+            monkeypatch.delenv("CONTACTS_FAST_JSON", raising=False)
+        # Готовые тела ответов кэшируются — иначе второй режим получил бы ответ первого
+        response_cache.clear()
+        row_cache.clear()
+
+    yield switch
+    row_cache.clear()
+
+
+def _both_modes(fast_mode, request):
+    """Выполняет запрос в обычном и быстром режиме и возвращает оба ответа."""
+    responses = []
+    for enabled in (False, True):
+        fast_mode(enabled)
+        responses.append(request())
+    return responses
+
+
+def _assert_same(default, fast):
+    assert fast.status_code == default.status_code
+    assert fast.headers["content-type"] == default.headers["content-type"]
+    assert fast.json() == default.json()
+    assert fast.content == default.content
+
+
+def test_mode_is_read_at_call_time(fast_mode):
+    fast_mode(True)
+    assert fast_json_enabled() == (fast_json.orjson is not None)
+    fast_mode(False)
+    assert not fast_json_enabled()
+
+
+@pytest.mark.skipif(fast_json.orjson is None, reason="orjson не установлен")
+def test_list_and_search_match_default(client, fast_mode):
+    make_contact(client, email="ivan@example.com", notes="коллега")
+    make_contact(client, "Мария", "+79209998877")
+
+    for url in ("/api/contacts/", "/api/contacts/?limit=1", "/api/contacts/?fields=name,created_at",
+                "/api/contacts/search?q=иван"):
+        default, fast = _both_modes(fast_mode, lambda: client.get(url))
+        _assert_same(default, fast)
+        assert default.headers.get("X-Next-Cursor") == fast.headers.get("X-Next-Cursor")
+    # Быстрый режим действительно работал: строки легли в кэш сериализации
+    assert len(row_cache._items) > 0
+
+
+@pytest.mark.skipif(fast_json.orjson is None, reason="orjson не установлен")
+def test_get_matches_default(client, fast_mode):
+    contact = make_contact(client, email="ivan@example.com")
+    default, fast = _both_modes(fast_mode, lambda: client.get(f"/api/contacts/{contact['id']}"))
+    _assert_same(default, fast)
+    assert fast.json() == contact
+
+
+@pytest.mark.skipif(fast_json.orjson is None, reason="orjson не установлен")
+def test_writes_match_default(client, fast_mode):
+    def created():
+        return client.post("/api/contacts/", json={"name": "Пётр", "phone": "+79011112233", "notes": "сосед"})
+
+    default, fast = _both_modes(fast_mode, created)
+    assert fast.status_code == default.status_code == 201
+    assert fast.headers["content-type"] == default.headers["content-type"]
+    ids = default.json()["id"], fast.json()["id"]
+    created_fast = fast.json()
+    assert list(fast.json()) == list(default.json())
+    # Контакты разные, но всё, кроме ID и даты создания, совпадает
+    for field in ("name", "phone", "email", "notes"):
+        assert fast.json()[field] == default.json()[field]
+
+    # PUT и PATCH одного и того же контакта в обоих режимах дают одинаковый ответ
+    replacement = {"name": "Пётр Иванов", "phone": "+79014445566", "email": "petr@example.com"}
+    default, fast = _both_modes(fast_mode, lambda: client.put(f"/api/contacts/{ids[0]}", json=replacement))
+    _assert_same(default, fast)
+    assert fast.json()["notes"] is None
+
+    default, fast = _both_modes(fast_mode, lambda: client.patch(f"/api/contacts/{ids[0]}", json={"notes": "друг"}))
+    _assert_same(default, fast)
+    assert fast.json()["name"] == "Пётр Иванов"
+
+    # Контакт, созданный в быстром режиме, обычный GET отдаёт таким же
+    fast_mode(False)
+    assert client.get(f"/api/contacts/{ids[1]}").json() == created_fast
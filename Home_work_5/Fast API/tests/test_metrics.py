@@ -0,0 +1,92 @@
+import re
+
+import pytest
+
+from app.metrics import Histogram, registry
+from tests.conftest import make_contact
+
+
+@pytest.fixture
+def metrics_client(client):
+    # Метрики общие на процесс — начинаем с чистого реестра
+    registry.routes.clear()
+    return client
+
+
+def _samples(text):
+    """Разбирает текст Prometheus в словарь "имя{метки}" → значение."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_metrics_format_and_counters(metrics_client):
+    contact = make_contact(metrics_client)
+    for _ in range(3):
+        metrics_client.get(f"/api/contacts/{contact['id']}")
+    metrics_client.get("/api/contacts/999")
+    metrics_client.get("/no/such/page")
+
+    response = metrics_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = _samples(response.text)
+
+    # Маршрут — шаблон пути, а не URL с конкретным ID
+    route = 'method="GET",route="/api/contacts/{contact_id}"'
+    assert samples[f'http_requests_total{{{route},status="200"}}'] == 3
+    assert samples[f'http_requests_total{{{route},status="404"}}'] == 1
+    assert samples['http_requests_total{method="POST",route="/api/contacts/",status="201"}'] == 1
+    assert samples['http_requests_total{method="GET",route="<unmatched>",status="404"}'] == 1
+    assert not any("999" in name for name in samples)
+
+    # Запрос к /metrics сейчас в обработке
+    assert samples["http_requests_in_flight"] == 1
+
+    assert samples[f"http_request_duration_seconds_count{{{route}}}"] == 4
+    assert samples[f'http_request_duration_seconds_bucket{{{route},le="+Inf"}}'] == 4
+    for quantile in ("0.5", "0.95", "0.99"):
+        assert f'http_request_duration_quantile_seconds{{{route},quantile="{quantile}"}}' in samples
+
+
+def test_histogram_buckets_are_cumulative(metrics_client):
+    for _ in range(5):
+        metrics_client.get("/api/contacts/")
+    text = metrics_client.get("/metrics").text
+
+    buckets = re.findall(
+        r'http_request_duration_seconds_bucket\{method="GET",route="/api/contacts/",le="[^"]+"\} (\d+)', text
+    )
+    counts = [int(count) for count in buckets]
+    assert counts == sorted(counts)
+    assert counts[-1] == 5
+
+
+def test_sizes_and_serialization(metrics_client):
+    make_contact(metrics_client, notes="x" * 300)
+    body = metrics_client.get("/api/contacts/").content
+    samples = _samples(metrics_client.get("/metrics").text)
+
+    post = 'method="POST",route="/api/contacts/"'
+    get = 'method="GET",route="/api/contacts/"'
+    # Размер запроса — из Content-Length, ответа — фактически отправленные байты
+    assert samples[f"http_request_size_bytes_sum{{{post}}}"] > 300
+    assert samples[f"http_response_size_bytes_sum{{{get}}}"] == len(body)
+    assert samples[f"http_response_serialization_seconds_count{{{get}}}"] == 1
+    assert samples[f"http_response_serialization_seconds_sum{{{get}}}"] > 0
+
+
+def test_histogram_quantile():
+    histogram = Histogram((1.0, 2.0, 4.0))
+    assert histogram.quantile(0.5) == 0.0
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+    assert histogram.counts == [1, 2, 1, 0]
+    # Линейная интерполяция внутри корзины, как histogram_quantile
+    assert histogram.quantile(0.5) == 1.5
+    assert histogram.quantile(1.0) == 4.0
+    histogram.observe(100.0)
+    assert histogram.quantile(0.99) == 4.0
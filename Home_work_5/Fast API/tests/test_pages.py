@@ -0,0 +1,95 @@
+from email.utils import parsedate_to_datetime
+
+import pytest
+from fastapi import Request
+
+from app.http_cache import http_date, is_not_modified
+from app.templating import TEMPLATE_CACHE_DIR, _pages, _templates_mtime, templates
+
+
+@pytest.fixture
+def pages_client(client):
+    # Страницы кэшируются на процесс — начинаем с пустого кэша
+    _pages.clear()
+    yield client
+    _pages.clear()
+
+
+def _request(**headers):
+    """Запрос с заданными заголовками (имена — через подчёркивание: if_none_match)."""
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+@pytest.mark.parametrize("url", ["/", "/about/"])
+def test_page_has_validators(pages_client, url):
+    response = pages_client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["Cache-Control"] == "no-cache"
+    etag = response.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert response.headers["Last-Modified"] == http_date(_templates_mtime())
+
+    # Повторный запрос — из кэша, тот же ответ
+    again = pages_client.get(url)
+    assert again.content == response.content
+    assert again.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("url", ["/", "/about/"])
+def test_page_conditional_requests(pages_client, url):
+    first = pages_client.get(url)
+    etag = first.headers["ETag"]
+    last_modified = first.headers["Last-Modified"]
+    earlier = http_date(parsedate_to_datetime(last_modified).timestamp() - 3600)
+
+    for headers in ({"If-None-Match": etag}, {"If-None-Match": f"W/{etag}"}, {"If-Modified-Since": last_modified}):
+        response = pages_client.get(url, headers=headers)
+        assert response.status_code == 304, headers
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Last-Modified"] == last_modified
+
+    for headers in (
+        {"If-None-Match": '"other"'},
+        {"If-Modified-Since": earlier},
+        # If-None-Match важнее даты: чужой ETag — полный ответ, даже если дата свежая
+        {"If-None-Match": '"other"', "If-Modified-Since": last_modified},
+    ):
+        response = pages_client.get(url, headers=headers)
+        assert response.status_code == 200, headers
+        assert response.content == first.content
+
+
+def test_is_not_modified_etags():
+    etag = '"abc"'
+    assert is_not_modified(_request(if_none_match='"abc"'), etag)
+    # Слабое сравнение: W/ у клиента не мешает совпадению
+    assert is_not_modified(_request(if_none_match='W/"abc"'), etag)
+    assert is_not_modified(_request(if_none_match=' "x" ,W/"abc" '), etag)
+    assert is_not_modified(_request(if_none_match="*"), etag)
+    assert not is_not_modified(_request(if_none_match='"x", W/"y"'), etag)
+    assert not is_not_modified(_request(if_none_match="abc"), etag)
+    assert not is_not_modified(_request(), etag)
+
+
+def test_is_not_modified_dates():
+    modified = 1_700_000_000.5
+    assert is_not_modified(_request(if_modified_since=http_date(modified)), '"a"', modified)
+    assert is_not_modified(_request(if_modified_since=http_date(modified + 60)), '"a"', modified)
+    assert not is_not_modified(_request(if_modified_since=http_date(modified - 60)), '"a"', modified)
+    assert not is_not_modified(_request(if_modified_since="не дата"), '"a"', modified)
+    # Без времени изменения ресурса дата не проверяется
+    assert not is_not_modified(_request(if_modified_since=http_date(modified)), '"a"')
+    # If-None-Match проверяется первым, дата тогда игнорируется
+    assert not is_not_modified(
+        _request(if_none_match='"b"', if_modified_since=http_date(modified)), '"a"', modified
+    )
+
+
+def test_bytecode_cache_in_app_directory(pages_client):
+    assert templates.env.bytecode_cache.directory == str(TEMPLATE_CACHE_DIR)
+    templates.env.cache.clear()
+    pages_client.get("/")
+    assert any(TEMPLATE_CACHE_DIR.glob("__jinja2_*.cache"))
@@ -0,0 +1,91 @@
+from tests.conftest import make_contact
+
+
+def _fill(client, count):
+    return [make_contact(client, f"Контакт {number}", f"+790100000{number:02d}") for number in range(count)]
+
+
+def test_keyset_pages_cover_all_contacts(client):
+    created = _fill(client, 5)
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/contacts/", params=params)
+        assert response.status_code == 200
+        seen += [contact["id"] for contact in response.json()]
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            assert "Link" not in response.headers
+            break
+        assert response.headers["Link"].endswith('rel="next"')
+        assert f"cursor={cursor}" in response.headers["Link"]
+
+    # Страницы идут по ID без пропусков и повторов
+    assert seen == [contact["id"] for contact in created]
+    assert pages == 3
+
+
+def test_cursor_survives_inserts_and_deletes(client):
+    created = _fill(client, 4)
+    first = client.get("/api/contacts/", params={"limit": 2})
+    cursor = first.headers["X-Next-Cursor"]
+
+    # Изменения перед курсором не сдвигают следующую страницу (в отличие от offset)
+    client.delete(f"/api/contacts/{created[0]['id']}")
+    added = make_contact(client, "Новый", "+79017777777")
+
+    second = client.get("/api/contacts/", params={"limit": 2, "cursor": cursor})
+    assert [contact["id"] for contact in second.json()] == [created[2]["id"], created[3]["id"]]
+    third = client.get("/api/contacts/", params={"limit": 2, "cursor": second.headers["X-Next-Cursor"]})
+    assert [contact["id"] for contact in third.json()] == [added["id"]]
+
+
+def test_fields_selects_columns(client):
+    _fill(client, 3)
+
+    response = client.get("/api/contacts/", params={"fields": "phone,name", "limit": 2})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"name": "Контакт 0", "phone": "+79010000000"},
+        {"name": "Контакт 1", "phone": "+79010000001"},
+    ]
+
+    # Курсор работает вместе с fields, даже если id не запрошен
+    cursor = response.headers["X-Next-Cursor"]
+    rest = client.get("/api/contacts/", params={"fields": "phone,name", "limit": 2, "cursor": cursor})
+    assert rest.json() == [{"name": "Контакт 2", "phone": "+79010000002"}]
+    assert "X-Next-Cursor" not in rest.headers
+
+
+def test_full_contact_without_fields(client):
+    contact = make_contact(client, email="ivan@example.com", notes="коллега")
+    response = client.get("/api/contacts/")
+    assert response.json() == [contact]
+    assert set(contact) == {"id", "name", "phone", "email", "notes", "created_at"}
+
+
+def test_bad_cursor_and_unknown_field(client):
+    _fill(client, 1)
+
+    response = client.get("/api/contacts/", params={"cursor": "не-курсор"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Некорректный курсор"
+
+    response = client.get("/api/contacts/", params={"fields": "name,password"})
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+    # Поиск проверяет параметры так же
+    assert client.get("/api/contacts/search", params={"cursor": "%%%"}).status_code == 400
+    assert client.get("/api/contacts/search", params={"fields": "age"}).status_code == 400
+
+
+def test_limit_bounds(client):
+    assert client.get("/api/contacts/", params={"limit": 0}).status_code == 422
+    assert client.get("/api/contacts/", params={"limit": 1001}).status_code == 422
@@ -0,0 +1,156 @@
+import sqlite3
+
+import pytest
+
+from app.repository import ContactRepository
+from app.response_cache import response_cache
+from tests.conftest import TEST_DB, make_contact
+
+
+def _spy(monkeypatch, name):
+    """Считает вызовы метода репозитория: по ним видно, дошёл ли запрос до БД."""
+    calls = []
+    original = getattr(ContactRepository, name)
+
+    async def wrapper(self, *args, **kwargs):
+        calls.append(args)
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ContactRepository, name, wrapper)
+    return calls
+
+
+def test_repeat_get_served_from_cache(client, monkeypatch):
+    contact = make_contact(client)
+    pages = _spy(monkeypatch, "page")
+    gets = _spy(monkeypatch, "get")
+
+    for url in ("/api/contacts/", "/api/contacts/search?q=иван", f"/api/contacts/{contact['id']}"):
+        first = client.get(url)
+        second = client.get(url)
+        assert first.status_code == second.status_code == 200
+        assert second.content == first.content
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second.headers["Cache-Control"] == "no-cache"
+        assert second.headers.get("X-Total-Count") == first.headers.get("X-Total-Count")
+
+    # Список и поиск построены по одному разу, контакт по ID прочитан один раз
+    assert len(pages) == 2
+    assert len(gets) == 1
+
+
+def test_if_none_match_returns_304(client):
+    make_contact(client)
+    first = client.get("/api/contacts/")
+    etag = first.headers["ETag"]
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get("/api/contacts/", headers={"If-None-Match": header})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    response = client.get("/api/contacts/", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+    assert response.content == first.content
+
+
+def test_if_none_match_on_first_request(client):
+    # Кэш процесса пуст (например, после перезапуска), а у клиента актуальная копия
+    contact = make_contact(client)
+    etag = client.get(f"/api/contacts/{contact['id']}").headers["ETag"]
+    response_cache.clear()
+    response = client.get(f"/api/contacts/{contact['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def _write_post(client, contact):
+    make_contact(client, "Новый", "+79017777777")
+
+
+def _write_put(client, contact):
+    client.put(f"/api/contacts/{contact['id']}", json={"name": "Заменён", "phone": "+79018888888"})
+
+
+def _write_patch(client, contact):
+    client.patch(f"/api/contacts/{contact['id']}", json={"notes": "изменено"})
+
+
+def _write_delete(client, contact):
+    client.delete(f"/api/contacts/{contact['id']}")
+
+
+def _write_bulk(client, contact):
+    client.post("/api/contacts/bulk", json=[{"name": "Из импорта", "phone": "+79016666666"}])
+
+
+def _write_bulk_ndjson(client, contact):
+    client.post(
+        "/api/contacts/bulk",
+        content='{"name": "Из NDJSON", "phone": "+79015555555"}\n'.encode("utf-8"),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+
+def _write_sql(client, contact):
+    # Запись в обход API (другой процесс, миграция) тоже меняет версию — через триггеры
+    with sqlite3.connect(TEST_DB) as connection:
+        connection.execute("UPDATE contacts SET notes = 'из SQL' WHERE id = ?", (contact["id"],))
+    connection.close()
+
+
+@pytest.mark.parametrize(
+    "write",
+    [_write_post, _write_put, _write_patch, _write_delete, _write_bulk, _write_bulk_ndjson, _write_sql],
+)
+def test_every_write_changes_etag(client, write):
+    contact = make_contact(client, email="ivan@example.com")
+    make_contact(client, "Мария", "+79209998877")
+    urls = ["/api/contacts/", "/api/contacts/search?q=%2B790", "/api/contacts/?fields=name,notes"]
+    before = {url: client.get(url) for url in urls}
+
+    write(client, contact)
+
+    for url in urls:
+        response = client.get(url, headers={"If-None-Match": before[url].headers["ETag"]})
+        # Старая копия устарела: полный ответ с новым ETag и новым содержимым
+        assert response.status_code == 200
+        assert response.headers["ETag"] != before[url].headers["ETag"]
+        assert response.content != before[url].content
+        # Новый ответ снова кэшируется
+        again = client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+        assert again.status_code == 304
+
+
+def test_variants_cached_separately(client, monkeypatch):
+    for number in range(3):
+        make_contact(client, f"Контакт {number}", f"+7901000000{number}")
+    pages = _spy(monkeypatch, "page")
+
+    full = client.get("/api/contacts/", params={"limit": 2})
+    names = client.get("/api/contacts/", params={"limit": 2, "fields": "name"})
+    cursor = full.headers["X-Next-Cursor"]
+    rest = client.get("/api/contacts/", params={"limit": 2, "cursor": cursor})
+
+    # Вариант с fields не отдаёт полный ответ и наоборот
+    assert names.json() == [{"name": "Контакт 0"}, {"name": "Контакт 1"}]
+    assert len(full.json()[0]) == 6
+    assert [contact["name"] for contact in rest.json()] == ["Контакт 2"]
+    assert len({full.headers["ETag"], names.headers["ETag"], rest.headers["ETag"]}) == 3
+    assert len(pages) == 3
+
+    # Повторы каждого варианта — из кэша, со своим телом
+    assert client.get("/api/contacts/", params={"limit": 2}).content == full.content
+    assert client.get("/api/contacts/", params={"limit": 2, "fields": "name"}).content == names.content
+    assert client.get("/api/contacts/", params={"limit": 2, "cursor": cursor}).content == rest.content
+    assert len(pages) == 3
+
+    # ETag одного варианта не подходит к другому
+    response = client.get("/api/contacts/", params={"limit": 2}, headers={"If-None-Match": names.headers["ETag"]})
+    assert response.status_code == 200
+
+
+def test_errors_are_not_cached(client):
+    assert client.get("/api/contacts/1").status_code == 404
+    contact = make_contact(client)
+    assert client.get(f"/api/contacts/{contact['id']}").json() == contact
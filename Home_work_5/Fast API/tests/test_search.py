@@ -0,0 +1,95 @@
+import sqlite3
+
+import pytest
+
+from app import search
+from app.routers.api import contacts as contacts_router
+from tests.conftest import make_contact
+
+
+def _names(response):
+    assert response.status_code == 200
+    return [contact["name"] for contact in response.json()]
+
+
+def _fill(client):
+    make_contact(client, "Иван Петров", "+79011234567", "ivan@example.com", "коллега")
+    make_contact(client, "Мария Иванова", "+79209998877", "maria@mail.ru", "")
+    make_contact(client, "Ольга", "+79305550011", None, "соседка, тел. 1234")
+
+
+@pytest.mark.skipif(sqlite3.sqlite_version_info < (3, 34), reason="нет токенизатора trigram")
+def test_fts_index_is_used(client):
+    assert search.fts_enabled
+    _fill(client)
+
+    # Без учёта регистра, в том числе кириллица
+    assert _names(client.get("/api/contacts/search", params={"q": "ИВАН"})) == ["Иван Петров", "Мария Иванова"]
+    assert _names(client.get("/api/contacts/search", params={"q": "mail.ru"})) == ["Мария Иванова"]
+    assert _names(client.get("/api/contacts/search", params={"q": "1234"})) == ["Иван Петров", "Ольга"]
+    # Кавычки в запросе не ломают выражение MATCH
+    assert _names(client.get("/api/contacts/search", params={"q": 'ив"ан'})) == []
+
+
+def test_short_query_uses_substring_fallback(client):
+    _fill(client)
+
+    # Короче трёх символов триграммный индекс не применяется — работает сравнение подстрок
+    assert _names(client.get("/api/contacts/search", params={"q": "ив"})) == ["Иван Петров", "Мария Иванова"]
+    assert _names(client.get("/api/contacts/search", params={"q": "ЬГ"})) == ["Ольга"]
+    assert _names(client.get("/api/contacts/search", params={"name": "ра"})) == []
+
+
+def test_search_without_fts(client, monkeypatch):
+    _fill(client)
+    # Старый SQLite без FTS5: те же результаты сравнением подстрок
+    monkeypatch.setattr(search, "fts_enabled", False)
+    assert _names(client.get("/api/contacts/search", params={"q": "ИВАН"})) == ["Иван Петров", "Мария Иванова"]
+    assert _names(client.get("/api/contacts/search", params={"q": "1234"})) == ["Иван Петров", "Ольга"]
+
+
+def test_field_criteria_combine(client):
+    _fill(client)
+
+    assert _names(client.get("/api/contacts/search", params={"name": "иван"})) == ["Иван Петров", "Мария Иванова"]
+    assert _names(client.get("/api/contacts/search", params={"phone": "920"})) == ["Мария Иванова"]
+    # Все заданные условия должны выполняться
+    params = {"name": "иван", "email": "example"}
+    assert _names(client.get("/api/contacts/search", params=params)) == ["Иван Петров"]
+    # q ищет по всем полям, включая заметки
+    assert _names(client.get("/api/contacts/search", params={"q": "соседка"})) == ["Ольга"]
+    # Без условий — все контакты
+    assert len(_names(client.get("/api/contacts/search"))) == 3
+
+
+def test_index_follows_changes(client):
+    contact = make_contact(client, "Иван Петров", "+79011234567")
+
+    client.patch(f"/api/contacts/{contact['id']}", json={"name": "Пётр Сидоров"})
+    assert _names(client.get("/api/contacts/search", params={"q": "петров"})) == []
+    assert _names(client.get("/api/contacts/search", params={"q": "сидоров"})) == ["Пётр Сидоров"]
+
+    client.delete(f"/api/contacts/{contact['id']}")
+    assert _names(client.get("/api/contacts/search", params={"q": "сидоров"})) == []
+
+
+def test_total_count_on_first_page(client, monkeypatch):
+    for number in range(5):
+        make_contact(client, f"Иван {number}", f"+7901000000{number}")
+    make_contact(client, "Ольга", "+79305550011")
+
+    first = client.get("/api/contacts/search", params={"q": "иван", "limit": 2, "fields": "name"})
+    assert first.json() == [{"name": "Иван 0"}, {"name": "Иван 1"}]
+    assert first.headers["X-Total-Count"] == "5"
+    assert "X-Total-Count-Capped" not in first.headers
+
+    # Следующие страницы не пересчитывают совпадения
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get("/api/contacts/search", params={"q": "иван", "limit": 2, "cursor": cursor})
+    assert _names(second) == ["Иван 2", "Иван 3"]
+    assert "X-Total-Count" not in second.headers
+
+    monkeypatch.setattr(contacts_router, "COUNT_LIMIT", 3)
+    capped = client.get("/api/contacts/search", params={"q": "иван", "limit": 1})
+    assert capped.headers["X-Total-Count"] == "3"
+    assert capped.headers["X-Total-Count-Capped"] == "true"
@@ -2,7 +2,8 @@ import asyncio
 from typing import List, Dict, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from jsonplaceholder_requests import fetch_users_data, fetch_posts_data
 from models import Base, engine, AsyncSessionLocal, User, Post
@@ -14,49 +15,118 @@ async def create_tables():
         await conn.run_sync(Base.metadata.create_all)
 
 
-async def add_users_to_db(session: AsyncSession, users_data: List[Dict[str, Any]]) -> List[User]:
+def _upsert_statement(model, key: str = "id"):
     """
-    Добавляет пользователей в БД.
-    Возвращает список созданных объектов User.
+    Строит INSERT ... ON CONFLICT (key) DO UPDATE для таблицы модели.
+
+    Обновление срабатывает, только если хотя бы одно поле отличается
+    (IS NOT сравнивает и NULL), поэтому неизменённые строки не перезаписываются.
     """
-    users = []
-    for user_dict in users_data:  # ← исправлено: двоеточие после for
-        user = User(
-            id=user_dict["id"],
-            name=user_dict["name"],
-            username=user_dict["username"],
-            email=user_dict["email"]
-        )
-        users.append(user)
+    table = model.__table__
+    stmt = sqlite_insert(table)
+    columns = [column.name for column in table.columns if column.name != key]
+    return stmt.on_conflict_do_update(
+        index_elements=[key],
+        set_={name: stmt.excluded[name] for name in columns},
+        where=or_(*(table.c[name].is_not(stmt.excluded[name]) for name in columns)),
+    )
 
-    session.add_all(users)
-    await session.commit()
-    # Refresh objects to get any DB-generated values (if needed)
-    for user in users:
-        await session.refresh(user)
-    return users
+
+# Поля пользователя с ограничением UNIQUE помимо id
+USER_UNIQUE_FIELDS = ("username", "email")
 
 
-async def add_posts_to_db(session: AsyncSession, posts_data: List[Dict[str, Any]]) -> List[Post]:
+async def _release_unique_values(session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
     """
-    Добавляет посты в БД.
-    Возвращает список созданных объектов Post.
+    Освобождает username/email, которые в новых данных принадлежат другому id.
+
+    UPSERT разрешает конфликт только по id, поэтому если пользователи поменялись логинами
+    (или логин перешёл к новому id), вставка упала бы на UNIQUE. Такие строки
+    получают временные значения, а UPSERT в той же транзакции записывает настоящие.
+
+    Если значение занято пользователем, которого в новых данных нет, неясно, что с ним
+    делать (удалить вместе с постами или оставить), поэтому поднимается ValueError
+    и ничего не записывается.
     """
-    posts = []
-    for post_dict in posts_data:  # ← исправлено: двоеточие после for
-        post = Post(
-            id=post_dict["id"],
-            user_id=post_dict["userId"],  # API возвращает camelCase
-            title=post_dict["title"],
-            body=post_dict["body"]
+    owners = {(field, row[field]): row["id"] for row in rows for field in USER_UNIQUE_FIELDS}
+    incoming_ids = {row["id"] for row in rows}
+    result = await session.execute(
+        select(User.id, User.username, User.email).where(
+            or_(*(getattr(User, field).in_([row[field] for row in rows]) for field in USER_UNIQUE_FIELDS))
         )
-        posts.append(post)
+    )
+    # id существующего пользователя → поля, значения которых теперь принадлежат другому id
+    conflicts: Dict[int, List[str]] = {}
+    for user in result:
+        fields = [field for field in USER_UNIQUE_FIELDS if owners.get((field, getattr(user, field)), user.id) != user.id]
+        if fields:
+            conflicts[user.id] = fields
+    if not conflicts:
+        return
+
+    stale = sorted(user_id for user_id in conflicts if user_id not in incoming_ids)
+    if stale:
+        raise ValueError(f"username/email заняты пользователями, которых нет в загрузке: id {stale}")
+    for user_id, fields in conflicts.items():
+        await session.execute(
+            update(User).where(User.id == user_id).values({field: f"__released_{user_id}" for field in fields})
+        )
+
 
-    session.add_all(posts)
+async def add_users_to_db(session: AsyncSession, users_data: List[Dict[str, Any]]) -> int:
+    """
+    Добавляет пользователей в БД или обновляет уже загруженных (по id).
+
+    Повторный запуск не падает на уникальных username/email: изменившиеся
+    пользователи обновляются, а совпадающие строки не трогаются. Логин или email,
+    перешедший к другому id, тоже обновляется (см. _release_unique_values).
+    Возвращает число добавленных или изменённых строк.
+
+    :raises ValueError: если username/email занят пользователем, которого нет в users_data
+    """
+    rows = [
+        {
+            "id": user_dict["id"],
+            "name": user_dict["name"],
+            "username": user_dict["username"],
+            "email": user_dict["email"],
+        }
+        for user_dict in users_data
+    ]
+    if not rows:
+        return 0
+    try:
+        await _release_unique_values(session, rows)
+    except ValueError:
+        await session.rollback()
+        raise
+    # Один запрос на все строки (executemany)
+    result = await session.execute(_upsert_statement(User), rows)
+    await session.commit()
+    return result.rowcount
+
+
+async def add_posts_to_db(session: AsyncSession, posts_data: List[Dict[str, Any]]) -> int:
+    """
+    Добавляет посты в БД или обновляет уже загруженные (по id).
+
+    Как и для пользователей, неизменённые посты не перезаписываются.
+    Возвращает число добавленных или изменённых строк.
+    """
+    rows = [
+        {
+            "id": post_dict["id"],
+            "user_id": post_dict["userId"],  # API возвращает camelCase
+            "title": post_dict["title"],
+            "body": post_dict["body"],
+        }
+        for post_dict in posts_data
+    ]
+    if not rows:
+        return 0
+    result = await session.execute(_upsert_statement(Post), rows)
     await session.commit()
-    for post in posts:
-        await session.refresh(post)
-    return posts
+    return result.rowcount
 
 
 async def async_main():
@@ -72,16 +142,16 @@ async def async_main():
         fetch_posts_data(),
     )
 
-    # 3. Добавление данных в БД через сессию
+    # 3. Добавление данных в БД через сессию (повторный запуск обновит только изменившееся)
     async with AsyncSessionLocal() as session:
-        await add_users_to_db(session, users_data)
-        await add_posts_to_db(session, posts_data)
+        users_written = await add_users_to_db(session, users_data)
+        posts_written = await add_posts_to_db(session, posts_data)
 
         # Опционально: проверка количества записей
         users_result = await session.execute(select(User))
         posts_result = await session.execute(select(Post))
-        print(f"✓ Добавлено пользователей: {len(users_result.scalars().all())}")
-        print(f"✓ Добавлено постов: {len(posts_result.scalars().all())}")
+        print(f"✓ Пользователей в БД: {len(users_result.scalars().all())} (добавлено/обновлено: {users_written})")
+        print(f"✓ Постов в БД: {len(posts_result.scalars().all())} (добавлено/обновлено: {posts_written})")
 
     # 4. Корректное закрытие соединений
     await engine.dispose()
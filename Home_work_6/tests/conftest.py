@@ -0,0 +1,21 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import Base
+
+
+@pytest_asyncio.fixture
+async def session(tmp_path):
+    """Сессия над пустой временной БД (не homework.db из models.py)."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)() as test_session:
+        yield test_session
+    await engine.dispose()
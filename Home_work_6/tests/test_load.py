@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import select
+
+from main import add_posts_to_db, add_users_to_db
+from models import Post, User
+
+
+USERS = [
+    {"id": 1, "name": "Leanne Graham", "username": "Bret", "email": "Sincere@april.biz"},
+    {"id": 2, "name": "Ervin Howell", "username": "Antonette", "email": "Shanna@melissa.tv"},
+]
+POSTS = [
+    {"userId": 1, "id": 1, "title": "sunt aut facere", "body": "quia et suscipit"},
+    {"userId": 1, "id": 2, "title": "qui est esse", "body": "est rerum tempore"},
+    {"userId": 2, "id": 3, "title": "ea molestias", "body": "et iusto sed quo"},
+]
+
+
+async def _users(session):
+    result = await session.execute(select(User.id, User.username, User.email).order_by(User.id))
+    return [tuple(row) for row in result]
+
+
+async def _posts(session):
+    result = await session.execute(select(Post.id, Post.user_id, Post.title).order_by(Post.id))
+    return [tuple(row) for row in result]
+
+
+@pytest.mark.asyncio
+async def test_first_load(session):
+    assert await add_users_to_db(session, USERS) == 2
+    assert await add_posts_to_db(session, POSTS) == 3
+    assert await _users(session) == [(1, "Bret", "Sincere@april.biz"), (2, "Antonette", "Shanna@melissa.tv")]
+    assert await _posts(session) == [(1, 1, "sunt aut facere"), (2, 1, "qui est esse"), (3, 2, "ea molestias")]
+    assert await add_users_to_db(session, []) == 0
+
+
+@pytest.mark.asyncio
+async def test_identical_reload_writes_nothing(session):
+    await add_users_to_db(session, USERS)
+    await add_posts_to_db(session, POSTS)
+    assert await add_users_to_db(session, USERS) == 0
+    assert await add_posts_to_db(session, POSTS) == 0
+
+
+@pytest.mark.asyncio
+async def test_reload_with_changes(session):
+    await add_users_to_db(session, USERS)
+    await add_posts_to_db(session, POSTS)
+
+    users = [dict(USERS[0], email="leanne@april.biz"), USERS[1]]
+    posts = [POSTS[0], dict(POSTS[1], title="новый заголовок"), POSTS[2],
+             {"userId": 2, "id": 4, "title": "новый пост", "body": "текст"}]
+    # Записываются только изменённые и новые строки
+    assert await add_users_to_db(session, users) == 1
+    assert await add_posts_to_db(session, posts) == 2
+    assert (await _users(session))[0] == (1, "Bret", "leanne@april.biz")
+    assert await _posts(session) == [
+        (1, 1, "sunt aut facere"), (2, 1, "новый заголовок"), (3, 2, "ea molestias"), (4, 2, "новый пост")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unique_values_moved_between_users(session):
+    await add_users_to_db(session, USERS)
+
+    # Пользователи поменялись логинами, а email первого перешёл к новому пользователю
+    users = [
+        dict(USERS[0], username="Antonette", email="leanne@april.biz"),
+        dict(USERS[1], username="Bret"),
+        {"id": 3, "name": "Clementine Bauch", "username": "Samantha", "email": "Sincere@april.biz"},
+    ]
+    assert await add_users_to_db(session, users) == 3
+    assert await _users(session) == [
+        (1, "Antonette", "leanne@april.biz"),
+        (2, "Bret", "Shanna@melissa.tv"),
+        (3, "Samantha", "Sincere@april.biz"),
+    ]
+    assert await add_users_to_db(session, users) == 0
+
+
+@pytest.mark.asyncio
+async def test_unique_value_of_missing_user_is_rejected(session):
+    await add_users_to_db(session, USERS)
+
+    # Логин пользователя 1 занял новый id, а самого пользователя 1 в загрузке нет
+    users = [USERS[1], {"id": 3, "name": "Clementine Bauch", "username": "Bret", "email": "Nathan@yesenia.net"}]
+    with pytest.raises(ValueError, match=r"id \[1\]"):
+        await add_users_to_db(session, users)
+    # Ничего не записано, сессия пригодна для работы
+    assert await _users(session) == [(1, "Bret", "Sincere@april.biz"), (2, "Antonette", "Shanna@melissa.tv")]